@@ -1,15 +1,27 @@
 import re
+import time
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Tuple, Dict, Any, List, Optional
 
 from nba_api.stats.endpoints.scoreboardv2 import ScoreboardV2
 from nba_api.stats.endpoints.boxscoretraditionalv3 import BoxScoreTraditionalV3
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.library.http import NBAStatsHTTP
+from feed.cache import GAME_STATUS_FINAL, GAME_STATUS_LIVE, GAME_STATUS_SCHEDULED, FeedCache, FeedCacheConfig
+from feed.leaderboard import DailyLeaderboards
+from feed.poller import LeaderboardPoller
 from probability.points_model import estimate_break_probabilities
 try:
     from nba_api.live.nba.endpoints.boxscore import BoxScore as LiveBoxScore
+    from nba_api.live.nba.library.http import NBALiveHTTP
+
+    # idle games (timeouts, halftime) come back from cdn.nba.com as 304s
+    NBALiveHTTP.set_conditional_requests()
 except Exception:
     LiveBoxScore = None
+    NBALiveHTTP = None
 
 try:
     from streamlit_autorefresh import st_autorefresh
@@ -252,6 +264,12 @@ def apply_base_styles() -> None:
                 color: #94a3b8;
                 font-weight: 600;
             }
+            .runner-up {
+                display: flex;
+                justify-content: space-between;
+                font-size: 12px;
+                color: #64748b;
+            }
             .section-title {
                 font-size: 1.2rem;
                 color: #0f172a;
@@ -338,6 +356,16 @@ STAT_SEASON_HIGH = {
     "Turnovers": "SEASON HIGH: 9 L. JAMES",
 }
 
+# players kept per stat on the leaderboard (the card shows the leader plus runners-up)
+LEADERBOARD_TOP_K = 5
+
+# upper bound on concurrent per-game boxscore requests during one refresh
+FETCH_MAX_WORKERS = 8
+
+# background poller schedule; pages only read the latest published snapshot
+POLL_INTERVAL_SECONDS = 15.0
+FIRST_SNAPSHOT_TIMEOUT_SECONDS = 60.0
+
 # minimal team color map; unknown teams get a light gray
 TEAM_COLORS = {
     # examples; add more if desired
@@ -425,6 +453,12 @@ def format_record_value(value: str) -> str:
     return f"<strong>{number}</strong><span class='record-meta'>{rest}</span>"
 
 
+def format_stat_value(val: Any) -> Any:
+    if val is None:
+        return "—"
+    return int(val) if (isinstance(val, (int, float)) and float(val).is_integer()) else round(float(val), 1)
+
+
 def render_stat_card(card: Dict[str, Any]):
     """Render a single modern stat card using inline CSS and minimal HTML.
 
@@ -463,6 +497,10 @@ def render_stat_card(card: Dict[str, Any]):
         if all_time_prob is not None:
             parts.append(f"<div class='probability-note'>Break all-time: {all_time_prob:.2%}</div>")
         probability_html = "\n".join(parts)
+    runners_up_html = "\n".join(
+        f"<div class='runner-up'><span>{rank}. {r.get('player') or '—'} {r.get('team') or ''}</span><span>{format_stat_value(r.get('value'))}</span></div>"
+        for rank, r in enumerate(card.get("runners_up", ()), start=2)
+    )
 
     html = f"""
     <div class='stat-card'>
@@ -502,6 +540,7 @@ def render_stat_card(card: Dict[str, Any]):
             </a>
             <div class='game-clock'>{display_clock}</div>
             {probability_html}
+            {runners_up_html}
         </div>
     </div>
     """
@@ -510,23 +549,180 @@ def render_stat_card(card: Dict[str, Any]):
 
 
 
-def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
+def fetch_game_players(gid: str) -> Dict[str, Any]:
+    """Fetch one game's player rows, preferring the live feed over BoxScoreTraditionalV3.
+
+    Runs on a worker thread, so it only reports counters and errors back to the
+    caller instead of touching the shared ``debug`` dict.
+    """
+    result = {"players": [], "live_game": None, "ok": 0, "failed": 0, "errors": []}
+    # try live feed first
+    if LiveBoxScore is not None:
+        try:
+            live = LiveBoxScore(gid)
+            lg = live.game.get_dict() if getattr(live, "game", None) else None
+            if lg:
+                result["live_game"] = lg
+                hp = lg.get("homeTeam", {}).get("players", []) or []
+                ap = lg.get("awayTeam", {}).get("players", []) or []
+                home_name = lg.get("homeTeam", {}).get("teamTricode") or lg.get("homeTeam", {}).get("teamName")
+                away_name = lg.get("awayTeam", {}).get("teamTricode") or lg.get("awayTeam", {}).get("teamName")
+                for p in hp:
+                    if "teamName" not in p:
+                        p["teamName"] = home_name
+                for p in ap:
+                    if "teamName" not in p:
+                        p["teamName"] = away_name
+                result["players"] = hp + ap
+                result["ok"] += 1
+        except Exception as e:
+            result["errors"].append({"game_id": gid, "error": f"live_box_error: {e}"})
+
+    # fallback to traditional v3 boxscore
+    if not result["players"]:
+        try:
+            box = BoxScoreTraditionalV3(gid)
+            result["players"] = parse_dataset(box.player_stats)
+            result["ok"] += 1
+        except Exception as e:
+            result["failed"] += 1
+            result["errors"].append({"game_id": gid, "error": str(e)})
+    return result
+
+
+@st.cache_resource
+def get_feed_cache() -> FeedCache:
+    # the poller already paces live requests, so live games are never served from cache;
+    # only scheduled and final games are
+    return FeedCache(FeedCacheConfig(live_ttl=0.0))
+
+
+def fetch_scoreboard(date_str: str) -> Dict[str, List[Dict[str, Any]]]:
+    sb = ScoreboardV2(game_date=date_str)
+    return {
+        "games": parse_dataset(sb.game_header),
+        "line_score": parse_dataset(sb.line_score),
+        "team_leaders": parse_dataset(sb.team_leaders),
+    }
+
+
+def scoreboard_status(games: List[Dict[str, Any]]) -> int:
+    statuses = set()
+    for g in games:
+        try:
+            statuses.add(int(g.get("GAME_STATUS_ID")))
+        except (TypeError, ValueError):
+            statuses.add(GAME_STATUS_LIVE)
+    if statuses and statuses == {GAME_STATUS_FINAL}:
+        return GAME_STATUS_FINAL
+    if GAME_STATUS_LIVE in statuses:
+        return GAME_STATUS_LIVE
+    return GAME_STATUS_SCHEDULED
+
+
+def summarize_live_game(live_game: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not live_game:
+        return None
+    try:
+        ht = live_game.get("homeTeam", {})
+        at = live_game.get("awayTeam", {})
+        h_abbr = ht.get("teamTricode") or ht.get("teamName") or ""
+        a_abbr = at.get("teamTricode") or at.get("teamName") or ""
+        h_pts = ht.get("score")
+        a_pts = at.get("score")
+        clock_raw = live_game.get("gameClock") or ""
+        period = live_game.get("period") or ""
+        status_text = format_game_status(live_game)
+        clock = format_clock(clock_raw)
+        if clock and period:
+            clock = f"Q{period} {clock}"
+        elif period and not clock:
+            clock = f"Q{period}"
+        if h_abbr and a_abbr and h_pts is not None and a_pts is not None:
+            return {
+                "awayTeam": a_abbr,
+                "awayScore": a_pts,
+                "homeTeam": h_abbr,
+                "homeScore": h_pts,
+                "clock": clock,
+                "status": status_text,
+            }
+    except Exception:
+        pass
+    return None
+
+
+def summarize_line_score(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if len(rows) < 2:
+        return None
+    r1, r2 = rows[0], rows[1]
+    h_abbr = r1.get("TEAM_ABBREVIATION") or r1.get("TEAM_NAME")
+    a_abbr = r2.get("TEAM_ABBREVIATION") or r2.get("TEAM_NAME")
+    h_pts = r1.get("PTS")
+    a_pts = r2.get("PTS")
+    if h_abbr and a_abbr and h_pts is not None and a_pts is not None:
+        return {
+            "awayTeam": a_abbr,
+            "awayScore": a_pts,
+            "homeTeam": h_abbr,
+            "homeScore": h_pts,
+            "clock": "",
+            "status": "",
+        }
+    return None
+
+
+def build_game_index(
+    line_score: List[Dict[str, Any]], live_games: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """Game summary per game id, built once per refresh.
+
+    The live boxscore's summary wins; games without one fall back to their
+    ScoreboardV2 line score rows, grouped in a single pass.
+    """
+    rows_by_gid: Dict[str, List[Dict[str, Any]]] = {}
+    for row in line_score or []:
+        rows_by_gid.setdefault(row.get("GAME_ID"), []).append(row)
+
+    index: Dict[str, Dict[str, Any]] = {}
+    for gid in set(rows_by_gid) | set(live_games):
+        summary = summarize_live_game(live_games.get(gid)) or summarize_line_score(rows_by_gid.get(gid, []))
+        if summary is not None:
+            index[gid] = summary
+    return index
+
+
+def fetch_top_stats_for_date(
+    game_date: datetime, cache: Optional[FeedCache] = None, boards: Optional[DailyLeaderboards] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
     tops = {k: {"value": None, "player": None, "team": None, "game_id": None, "game": None, "minutes": 0.0} for k, _ in STAT_FIELDS}
     debug = {
         "games_found": 0,
         "game_ids": [],
         "boxes_ok": 0,
         "boxes_failed": 0,
+        "fetch_seconds": 0.0,
+        "cache_hits": 0,
+        "cache_misses": 0,
         "errors": [],
         "game_date": game_date.strftime("%Y-%m-%d"),
     }
 
-    try:
-        sb = ScoreboardV2(game_date=game_date.strftime("%Y-%m-%d"))
-        games = parse_dataset(sb.game_header)
-    except Exception as exc:
-        debug["errors"].append({"game_id": None, "error": f"scoreboard_error: {exc}"})
-        return tops, debug, []
+    date_str = debug["game_date"]
+    scoreboard = None
+    if cache is not None:
+        hit, scoreboard = cache.get(("scoreboard", date_str))
+        debug["cache_hits" if hit else "cache_misses"] += 1
+    if scoreboard is None:
+        try:
+            scoreboard = fetch_scoreboard(date_str)
+        except Exception as exc:
+            debug["errors"].append({"game_id": None, "error": f"scoreboard_error: {exc}"})
+            return tops, debug, []
+        if cache is not None:
+            status = scoreboard_status(scoreboard["games"])
+            cache.set(("scoreboard", date_str), scoreboard, cache.ttl_for_status(status))
+    games = scoreboard["games"]
 
     debug["games_found"] = len(games)
     debug["game_ids"] = [g.get("GAME_ID") for g in games if g.get("GAME_ID")]
@@ -537,92 +733,45 @@ def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, A
         except Exception:
             return 0.0
 
-    def game_for_gid(gid, live_game=None):
-        if live_game:
-            try:
-                ht = live_game.get("homeTeam", {})
-                at = live_game.get("awayTeam", {})
-                h_abbr = ht.get("teamTricode") or ht.get("teamName") or ""
-                a_abbr = at.get("teamTricode") or at.get("teamName") or ""
-                h_pts = ht.get("score")
-                a_pts = at.get("score")
-                clock_raw = live_game.get("gameClock") or ""
-                period = live_game.get("period") or ""
-                status_text = format_game_status(live_game)
-                clock = format_clock(clock_raw)
-                if clock and period:
-                    clock = f"Q{period} {clock}"
-                elif period and not clock:
-                    clock = f"Q{period}"
-                if h_abbr and a_abbr and h_pts is not None and a_pts is not None:
-                    return {
-                        "awayTeam": a_abbr,
-                        "awayScore": a_pts,
-                        "homeTeam": h_abbr,
-                        "homeScore": h_pts,
-                        "clock": clock,
-                        "status": status_text,
-                    }
-            except Exception:
-                pass
-        try:
-            ls = parse_dataset(sb.line_score)
-            rows = [r for r in ls if r.get("GAME_ID") == gid]
-            if len(rows) >= 2:
-                r1, r2 = rows[0], rows[1]
-                h_abbr = r1.get("TEAM_ABBREVIATION") or r1.get("TEAM_NAME")
-                a_abbr = r2.get("TEAM_ABBREVIATION") or r2.get("TEAM_NAME")
-                h_pts = r1.get("PTS")
-                a_pts = r2.get("PTS")
-                if h_abbr and a_abbr and h_pts is not None and a_pts is not None:
-                    return {
-                        "awayTeam": a_abbr,
-                        "awayScore": a_pts,
-                        "homeTeam": h_abbr,
-                        "homeScore": h_pts,
-                        "clock": "",
-                        "status": "",
-                    }
-        except Exception:
-            pass
-        return None
+    status_by_gid = {g.get("GAME_ID"): g.get("GAME_STATUS_ID") for g in games}
+
+    def load_game(gid):
+        if cache is None:
+            return fetch_game_players(gid), False
+        key = ("boxscore", date_str, gid)
+        hit, result = cache.get(key)
+        if hit:
+            return result, True
+        result = fetch_game_players(gid)
+        if not result["failed"]:
+            status = (result["live_game"] or {}).get("gameStatus") or status_by_gid.get(gid)
+            cache.set(key, result, cache.ttl_for_status(status))
+        return result, False
 
-    for gid in debug["game_ids"]:
-        players = []
-        live_game = None
-        # try live feed first
-        if LiveBoxScore is not None:
-            try:
-                live = LiveBoxScore(gid)
-                lg = live.game.get_dict() if getattr(live, "game", None) else None
-                if lg:
-                    live_game = lg
-                    hp = lg.get("homeTeam", {}).get("players", []) or []
-                    ap = lg.get("awayTeam", {}).get("players", []) or []
-                    home_name = lg.get("homeTeam", {}).get("teamTricode") or lg.get("homeTeam", {}).get("teamName")
-                    away_name = lg.get("awayTeam", {}).get("teamTricode") or lg.get("awayTeam", {}).get("teamName")
-                    for p in hp:
-                        if "teamName" not in p:
-                            p["teamName"] = home_name
-                    for p in ap:
-                        if "teamName" not in p:
-                            p["teamName"] = away_name
-                    players = hp + ap
-                    debug["boxes_ok"] += 1
-            except Exception as e:
-                debug["errors"].append({"game_id": gid, "error": f"live_box_error: {e}"})
-
-        # fallback to traditional v3 boxscore
+    fetch_started = time.perf_counter()
+    if debug["game_ids"]:
+        workers = min(FETCH_MAX_WORKERS, len(debug["game_ids"]))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            loaded = list(pool.map(load_game, debug["game_ids"]))
+    else:
+        loaded = []
+    debug["fetch_seconds"] = time.perf_counter() - fetch_started
+
+    # the poller keeps one board per date across refreshes and feeds it only changed players
+    if boards is None:
+        boards = new_leaderboards()
+    board = boards.board(date_str)
+    live_games: Dict[str, Any] = {}
+    for gid, (result, hit) in zip(debug["game_ids"], loaded):
+        if cache is not None:
+            debug["cache_hits" if hit else "cache_misses"] += 1
+        debug["boxes_ok"] += result["ok"]
+        debug["boxes_failed"] += result["failed"]
+        debug["errors"].extend(result["errors"])
+        players = result["players"]
+        live_games[gid] = result["live_game"]
         if not players:
-            try:
-                box = BoxScoreTraditionalV3(gid)
-                pdata = parse_dataset(box.player_stats)
-                players = pdata
-                debug["boxes_ok"] += 1
-            except Exception as e:
-                debug["boxes_failed"] += 1
-                debug["errors"].append({"game_id": gid, "error": str(e)})
-                continue
+            continue
 
         for p in players:
             # normalize player name and team
@@ -630,37 +779,35 @@ def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, A
             team = p.get("teamTricode") or p.get("teamName") or p.get("TEAM_ABBREVIATION") or p.get("TEAM_NAME")
             minutes = parse_minutes(p.get("minutes") or p.get("MIN") or p.get("MINUTES"))
 
-            # flatten live `statistics` dict if present
-            stats_src = p.get("statistics") if isinstance(p.get("statistics"), dict) else p
-            flat = dict(p)
-            if isinstance(stats_src, dict):
-                for k, v in stats_src.items():
-                    if k not in flat:
-                        flat[k] = v
-
+            # top-level fields win over the live `statistics` dict; V3 rows may use upper-case names
+            stats_src = p.get("statistics") if isinstance(p.get("statistics"), dict) else {}
+            values = {}
             for disp, field in STAT_FIELDS:
-                raw = None
-                # support multiple naming conventions
-                if field in flat:
-                    raw = flat.get(field)
-                elif isinstance(field, str) and field.upper() in flat:
-                    raw = flat.get(field.upper())
-                val = to_float(raw)
-                cur = tops[disp]["value"]
-                if cur is None or val > cur:
-                    tops[disp] = {
-                        "value": val,
-                        "player": name or None,
-                        "team": team or None,
-                        "game_id": gid,
-                        "game": game_for_gid(gid, live_game),
-                        "minutes": minutes,
-                    }
+                if field in p:
+                    raw = p[field]
+                elif field in stats_src:
+                    raw = stats_src[field]
+                else:
+                    raw = p.get(field.upper(), stats_src.get(field.upper()))
+                values[disp] = to_float(raw)
+
+            key = (gid, p.get("personId") or p.get("PLAYER_ID") or name)
+            boards.update(date_str, key, values, info={"player": name or None, "team": team or None, "game_id": gid, "minutes": minutes})
+
+    game_index = build_game_index(scoreboard.get("line_score"), live_games)
+
+    for disp, _ in STAT_FIELDS:
+        entries = board.top(disp)
+        if not entries:
+            continue
+        top = [dict(entry.info, value=entry.value) for entry in entries]
+        leader = entries[0]
+        tops[disp] = dict(top[0], game=game_index.get(leader.info["game_id"]), top=top)
 
     # Team leaders fallback (when some categories missing)
     try:
         if any(tops[k]["value"] in (None, 0) for k in ("Points", "Rebounds", "Assists")):
-            team_leaders = parse_dataset(sb.team_leaders)
+            team_leaders = scoreboard["team_leaders"]
             for tl in team_leaders:
                 gid = tl.get("GAME_ID")
                 try:
@@ -682,7 +829,7 @@ def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, A
                         "player": tl.get("PTS_PLAYER_NAME"),
                         "team": tl.get("TEAM_ABBREVIATION") or tl.get("TEAM_NICKNAME"),
                         "game_id": gid,
-                        "game": game_for_gid(gid),
+                        "game": game_index.get(gid),
                         "minutes": 0.0,
                     }
                 if reb and (tops["Rebounds"]["value"] is None or reb > tops["Rebounds"]["value"]):
@@ -691,7 +838,7 @@ def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, A
                         "player": tl.get("REB_PLAYER_NAME"),
                         "team": tl.get("TEAM_ABBREVIATION") or tl.get("TEAM_NICKNAME"),
                         "game_id": gid,
-                        "game": game_for_gid(gid),
+                        "game": game_index.get(gid),
                         "minutes": 0.0,
                     }
                 if ast and (tops["Assists"]["value"] is None or ast > tops["Assists"]["value"]):
@@ -700,7 +847,7 @@ def fetch_top_stats_for_date(game_date: datetime) -> Tuple[Dict[str, Dict[str, A
                         "player": tl.get("AST_PLAYER_NAME"),
                         "team": tl.get("TEAM_ABBREVIATION") or tl.get("TEAM_NICKNAME"),
                         "game_id": gid,
-                        "game": game_for_gid(gid),
+                        "game": game_index.get(gid),
                         "minutes": 0.0,
                     }
     except Exception:
@@ -724,6 +871,80 @@ def extract_schedule_rows(games: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     return rows
 
 
+def new_leaderboards() -> DailyLeaderboards:
+    return DailyLeaderboards([disp for disp, _ in STAT_FIELDS], k=LEADERBOARD_TOP_K)
+
+
+def fetch_leaderboard(
+    cache: Optional[FeedCache] = None, boards: Optional[DailyLeaderboards] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
+    if boards is None:
+        boards = new_leaderboards()
+    today = datetime.now()
+    polled = [today.strftime("%Y-%m-%d")]
+    tops, debug, games = fetch_top_stats_for_date(today, cache=cache, boards=boards)
+    has_stats = any(info.get("value") not in (None, 0) for info in tops.values())
+    if not has_stats:
+        yesterday = today - timedelta(days=1)
+        polled.append(yesterday.strftime("%Y-%m-%d"))
+        fallback_tops, fallback_debug, fallback_games = fetch_top_stats_for_date(yesterday, cache=cache, boards=boards)
+        fallback_has_stats = any(info.get("value") not in (None, 0) for info in fallback_tops.values())
+        if fallback_has_stats:
+            tops, debug, games = fallback_tops, fallback_debug, fallback_games
+            debug["fallback_used"] = True
+            debug["fallback_date"] = fallback_debug.get("game_date")
+        else:
+            debug["fallback_used"] = False
+    # once the date rolls over, the boards of dates no longer polled are dropped
+    boards.retain(polled)
+    return tops, debug, games
+
+
+def warm_up_connections() -> None:
+    NBAStatsHTTP.warm_up(connections=2)
+    if NBALiveHTTP is not None:
+        NBALiveHTTP.warm_up(connections=FETCH_MAX_WORKERS)
+
+
+@st.cache_resource
+def configure_rate_limits() -> None:
+    # per-host request budgets shared by every fetch in this process; excess requests queue.
+    # Cached so script reruns don't swap in fresh buckets with a full burst each time.
+    NBAHTTP.set_rate_limit("stats.nba.com", rate=2.0, burst=4)
+    NBAHTTP.set_rate_limit("cdn.nba.com", rate=10.0, burst=15)
+
+
+@st.cache_resource
+def configure_connection_pools() -> None:
+    # size the per-host connection pools to the fetch fan-out so no worker opens a throwaway
+    # connection; done once, before warm_up_connections fills them
+    NBAStatsHTTP.configure_pool(pool_maxsize=FETCH_MAX_WORKERS)
+    if NBALiveHTTP is not None:
+        NBALiveHTTP.configure_pool(pool_maxsize=FETCH_MAX_WORKERS)
+
+
+@st.cache_resource
+def get_poller() -> LeaderboardPoller:
+    configure_rate_limits()
+    configure_connection_pools()
+    cache = get_feed_cache()
+    boards = new_leaderboards()
+    poller = LeaderboardPoller(
+        lambda: fetch_leaderboard(cache, boards),
+        interval=POLL_INTERVAL_SECONDS,
+        warm_up=warm_up_connections,
+    )
+    poller.start()
+    return poller
+
+
+def format_age(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    return f"{seconds // 60}m {seconds % 60:02d}s"
+
+
 def render(tops: Dict[str, Dict[str, Any]], last_run: datetime, meta: Dict[str, Any]):
     st.markdown(
         f"""
@@ -733,7 +954,7 @@ def render(tops: Dict[str, Dict[str, Any]], last_run: datetime, meta: Dict[str,
                 <div class='topnum-subtitle'>Live leaders across tonight's games</div>
             </div>
             <div class='topnum-meta'>
-                <span class='meta-chip'>🕒 Updated {last_run.strftime('%H:%M:%S')} local</span>
+                <span class='meta-chip'>🕒 Updated {last_run.strftime('%H:%M:%S')} local · {format_age(meta.get('data_age', 0.0))} ago</span>
                 <span class='meta-chip'>📅 Data date {meta.get('data_date')}</span>
                 <span class='meta-chip'>🏀 Games tracked {meta.get('game_count')}</span>
             </div>
@@ -751,7 +972,7 @@ def render(tops: Dict[str, Dict[str, Any]], last_run: datetime, meta: Dict[str,
     for i, (stat_name, info) in enumerate(items):
         # Build card data
         val = info.get("value")
-        display_val = int(val) if (isinstance(val, (int, float)) and float(val).is_integer()) else (round(float(val), 1) if val is not None else "—")
+        display_val = format_stat_value(val)
         card = {
             "statLabel": stat_name,
             "statValue": display_val,
@@ -762,6 +983,7 @@ def render(tops: Dict[str, Dict[str, Any]], last_run: datetime, meta: Dict[str,
                 "season_high": STAT_SEASON_HIGH.get(stat_name, "—").replace("SEASON HIGH:", "").strip(),
             },
             "probability": {},
+            "runners_up": tuple(info.get("top", ()))[1:],
         }
         if not card["game"]:
             card["game"] = {"awayTeam": "", "awayScore": "", "homeTeam": "", "homeScore": "", "clock": "", "game_id": info.get("game_id")}
@@ -791,26 +1013,22 @@ def render(tops: Dict[str, Dict[str, Any]], last_run: datetime, meta: Dict[str,
 def main():
     st_autorefresh(interval=30 * 1000, key="topnum_autorefresh")
     apply_base_styles()
-    last_run = datetime.now()
-    with st.spinner("Fetching live data..."):
-        today = datetime.now()
-        tops, debug, games = fetch_top_stats_for_date(today)
-        has_stats = any(info.get("value") not in (None, 0) for info in tops.values())
-        if not has_stats:
-            yesterday = today - timedelta(days=1)
-            fallback_tops, fallback_debug, fallback_games = fetch_top_stats_for_date(yesterday)
-            fallback_has_stats = any(info.get("value") not in (None, 0) for info in fallback_tops.values())
-            if fallback_has_stats:
-                tops, debug, games = fallback_tops, fallback_debug, fallback_games
-                debug["fallback_used"] = True
-                debug["fallback_date"] = fallback_debug.get("game_date")
-            else:
-                debug["fallback_used"] = False
+    poller = get_poller()
+    snapshot = poller.snapshot()
+    if snapshot is None:
+        # only the first page load after a server start waits on the network
+        with st.spinner("Fetching live data..."):
+            snapshot = poller.wait_for_snapshot(timeout=FIRST_SNAPSHOT_TIMEOUT_SECONDS)
+    if snapshot is None:
+        st.info("Still waiting for the first scoreboard fetch. The page will refresh automatically.")
+        return
+    tops, debug, games = snapshot.tops, snapshot.debug, snapshot.games
     meta = {
         "data_date": debug.get("fallback_date") or debug.get("game_date"),
         "game_count": debug.get("games_found", 0),
+        "data_age": snapshot.age_seconds,
     }
-    render(tops, last_run, meta)
+    render(tops, snapshot.fetched_at_local, meta)
 
     has_stats = any(info.get("value") not in (None, 0) for info in tops.values())
     if not has_stats:
@@ -827,12 +1045,22 @@ def main():
         st.write(f"Game IDs: {debug['game_ids']}")
         st.write(f"Boxscore fetches OK: {debug['boxes_ok']}")
         st.write(f"Boxscore fetches failed: {debug['boxes_failed']}")
+        st.write(f"Boxscore fetch time: {debug.get('fetch_seconds', 0.0):.2f}s")
+        st.write(f"Snapshot age: {format_age(snapshot.age_seconds)} (poll every {poller.interval:.0f}s)")
+        if poller.last_error:
+            st.write(f"Last poll error: {poller.last_error}")
+        cache_stats = get_feed_cache().stats()
+        st.write(
+            f"Cache hits/misses this refresh: {debug.get('cache_hits', 0)}/{debug.get('cache_misses', 0)} "
+            f"(process total {cache_stats['hits']}/{cache_stats['misses']}, "
+            f"{cache_stats['entries']}/{cache_stats['max_entries']} entries)"
+        )
         if debug.get("fallback_used"):
             st.write(f"Fallback used: {debug.get('fallback_date')}")
         if debug['errors']:
             st.markdown("**Errors (first 5):**")
             for err in debug['errors'][:5]:
-                st.write(err)
+                st.write(dict(err))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# NBA gameStatus / GAME_STATUS_ID values
+GAME_STATUS_SCHEDULED = 1
+GAME_STATUS_LIVE = 2
+GAME_STATUS_FINAL = 3
+
+
+@dataclass(frozen=True)
+class FeedCacheConfig:
+    max_entries: int = 512
+    # 0 (or less) means the entry is not stored. A poller whose interval is at or
+    # below this TTL would hit the cache on every other poll and halve its rate.
+    live_ttl: float = 15.0
+    scheduled_ttl: float = 120.0
+    # None means the entry never expires; it can still be evicted by LRU.
+    final_ttl: Optional[float] = None
+
+
+class FeedCache:
+    """Thread-safe LRU cache with a per-entry TTL, shared by every session in the process."""
+
+    def __init__(self, config: FeedCacheConfig | None = None, clock: Callable[[], float] = time.monotonic):
+        self.config = config or FeedCacheConfig()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for_status(self, status: Any) -> Optional[float]:
+        try:
+            status = int(status)
+        except (TypeError, ValueError):
+            return self.config.live_ttl
+        if status == GAME_STATUS_FINAL:
+            return self.config.final_ttl
+        if status == GAME_STATUS_SCHEDULED:
+            return self.config.scheduled_ttl
+        return self.config.live_ttl
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.config.max_entries,
+            }
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import itertools
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    stat: str
+    value: float
+    key: Hashable
+    info: Any = None
+
+
+class TopKLeaderboard:
+    """Top-k holders of every stat, kept current as player values change.
+
+    Entries are ranked by value, then by who reached that value first, so ties
+    keep a stable order across polls. Each stat keeps its top k as a sorted list
+    next to a dict of every key's current value: an update bisects into the list
+    (O(log k) to locate, k is small), and only a top-k entry dropping below the
+    k-th value triggers a scan of that stat's values for the new k-th.
+
+    Not thread-safe; keep it on one thread (the poller's) or guard it externally.
+    """
+
+    def __init__(self, stats: Iterable[str], k: int = 5):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self._stats = tuple(stats)
+        self._seq = itertools.count()
+        # stat -> key -> (-value, seq); sort keys, so smaller ranks higher.
+        self._ranks: Dict[str, Dict[Hashable, Tuple[float, int]]] = {s: {} for s in self._stats}
+        # stat -> sorted [((-value, seq), key)] of the current top k.
+        self._top: Dict[str, List[Tuple[Tuple[float, int], Hashable]]] = {s: [] for s in self._stats}
+        self._info: Dict[Hashable, Any] = {}
+
+    @property
+    def stats(self) -> Tuple[str, ...]:
+        return self._stats
+
+    def update(self, key: Hashable, values: Mapping[str, float], info: Any = None) -> Set[str]:
+        """Set ``key``'s values for any subset of stats; returns the stats whose top k changed."""
+        if info is not None:
+            self._info[key] = info
+        changed = set()
+        for stat, value in values.items():
+            if self.update_stat(stat, key, value):
+                changed.add(stat)
+        return changed
+
+    def update_stat(self, stat: str, key: Hashable, value: float) -> bool:
+        ranks = self._ranks[stat]
+        old = ranks.get(key)
+        if old is not None and old[0] == -value:
+            return False
+        rank = (-value, next(self._seq))
+        ranks[key] = rank
+        top = self._top[stat]
+
+        if old is not None:
+            i = bisect_left(top, (old, key))
+            if i < len(top) and top[i] == (old, key):
+                del top[i]
+                if len(ranks) > len(top) + 1 and (not top or rank > top[-1][0]):
+                    # Dropped below the old k-th: someone outside may now belong.
+                    self._refill(stat)
+                    return True
+                insort(top, (rank, key))
+                del top[self.k:]
+                return True
+
+        if len(top) < self.k or rank < top[-1][0]:
+            insort(top, (rank, key))
+            del top[self.k:]
+            return True
+        return False
+
+    def _refill(self, stat: str) -> None:
+        ranks = self._ranks[stat]
+        self._top[stat] = sorted((rank, key) for key, rank in ranks.items())[: self.k]
+
+    def remove(self, key: Hashable) -> Set[str]:
+        """Forget ``key`` in every stat; returns the stats whose top k changed."""
+        self._info.pop(key, None)
+        changed = set()
+        for stat in self._stats:
+            rank = self._ranks[stat].pop(key, None)
+            if rank is None:
+                continue
+            top = self._top[stat]
+            i = bisect_left(top, (rank, key))
+            if i < len(top) and top[i] == (rank, key):
+                self._refill(stat)
+                changed.add(stat)
+        return changed
+
+    def top(self, stat: str) -> List[LeaderboardEntry]:
+        return [
+            LeaderboardEntry(stat, -rank[0], key, self._info.get(key))
+            for rank, key in self._top[stat]
+        ]
+
+    def leader(self, stat: str) -> Optional[LeaderboardEntry]:
+        top = self._top[stat]
+        if not top:
+            return None
+        rank, key = top[0]
+        return LeaderboardEntry(stat, -rank[0], key, self._info.get(key))
+
+
+class DailyLeaderboards:
+    """One TopKLeaderboard per game date, kept across polls.
+
+    ``update`` only reaches the board when a player's stat values differ from the
+    previous poll, so an unchanged slate costs one dict comparison per player and
+    tied players keep the order in which they reached their value. ``retain``
+    drops the boards of dates no longer polled, e.g. once the date rolls over.
+    """
+
+    def __init__(self, stats: Iterable[str], k: int = 5):
+        self._stats = tuple(stats)
+        self.k = k
+        self._boards: Dict[str, TopKLeaderboard] = {}
+        # date -> key -> the values last fed to that date's board.
+        self._values: Dict[str, Dict[Hashable, Mapping[str, float]]] = {}
+
+    def board(self, date: str) -> TopKLeaderboard:
+        board = self._boards.get(date)
+        if board is None:
+            board = self._boards[date] = TopKLeaderboard(self._stats, k=self.k)
+            self._values[date] = {}
+        return board
+
+    def update(self, date: str, key: Hashable, values: Mapping[str, float], info: Any = None) -> Set[str]:
+        """Feed ``key``'s values to ``date``'s board if they changed; returns the stats whose top k changed."""
+        board = self.board(date)
+        last = self._values[date]
+        if last.get(key) == values:
+            # info (minutes, team) may still move without a stat changing
+            return board.update(key, {}, info)
+        last[key] = dict(values)
+        return board.update(key, values, info)
+
+    def retain(self, dates: Iterable[str]) -> None:
+        keep = set(dates)
+        for date in [d for d in self._boards if d not in keep]:
+            del self._boards[date]
+            del self._values[date]
+
+    def dates(self) -> Tuple[str, ...]:
+        return tuple(self._boards)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class LeaderboardSnapshot:
+    tops: Mapping[str, Mapping[str, Any]]
+    debug: Mapping[str, Any]
+    games: Tuple[Mapping[str, Any], ...]
+    fetched_at: float
+    fetch_seconds: float
+
+    @classmethod
+    def build(cls, tops, debug, games, fetched_at: float, fetch_seconds: float) -> "LeaderboardSnapshot":
+        return cls(
+            tops=_freeze(tops),
+            debug=_freeze(debug),
+            games=_freeze(games),
+            fetched_at=fetched_at,
+            fetch_seconds=fetch_seconds,
+        )
+
+    @property
+    def fetched_at_local(self) -> datetime:
+        return datetime.fromtimestamp(self.fetched_at)
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+class LeaderboardPoller:
+    """Refreshes the leaderboard on a daemon thread and publishes immutable snapshots.
+
+    ``fetch`` must return a ``(tops, debug, games)`` tuple. A failed poll keeps the
+    previous snapshot and records the error in ``last_error``. ``warm_up`` runs once
+    on the poller thread before the first poll.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Tuple[Any, Any, Any]],
+        interval: float = 15.0,
+        warm_up: Optional[Callable[[], Any]] = None,
+    ):
+        self._fetch = fetch
+        self._warm_up = warm_up
+        self.interval = interval
+        self._snapshot: Optional[LeaderboardSnapshot] = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+        self.polls = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="topnum-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def snapshot(self) -> Optional[LeaderboardSnapshot]:
+        return self._snapshot
+
+    def wait_for_snapshot(self, timeout: Optional[float] = None) -> Optional[LeaderboardSnapshot]:
+        self._ready.wait(timeout)
+        return self._snapshot
+
+    def poll_once(self) -> None:
+        # stamp the snapshot with the time the fetch began, so its age covers the fetch itself
+        fetched_at = time.time()
+        started = time.perf_counter()
+        try:
+            tops, debug, games = self._fetch()
+        except Exception as exc:
+            self.last_error = str(exc)
+            return
+        finally:
+            self.polls += 1
+        self._snapshot = LeaderboardSnapshot.build(
+            tops,
+            debug,
+            games,
+            fetched_at=fetched_at,
+            fetch_seconds=time.perf_counter() - started,
+        )
+        self.last_error = None
+        self._ready.set()
+
+    def _run(self) -> None:
+        if self._warm_up is not None:
+            try:
+                self._warm_up()
+            except Exception:
+                pass
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -0,0 +1,90 @@
+"""Apache Arrow / Parquet export of tabular result sets."""
+
+import importlib.util
+import json
+import os
+
+from nba_api.library.columns import get_column_keys, get_columns
+
+# pyarrow is optional here and imported on first use, like pandas in get_data_frame().
+PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Schema metadata key holding the level names of multi-level headers.
+LEVELS_METADATA_KEY = b"nba_api.column_levels"
+
+
+def _require_pyarrow():
+    if not PYARROW:
+        raise Exception("Import Missing - Failed to import pyarrow.")
+
+
+def _column_array(pa, values):
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type columns (e.g. "-" placeholders among numbers) fall back to strings.
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=pa.string(),
+        )
+
+
+def get_arrow_table(headers, rows):
+    """Build a ``pyarrow.Table`` straight from a result set's headers and rows.
+
+    Columns are transposed once and handed to Arrow without going through
+    pandas. Multi-level headers become flat field names joined with ``_``
+    (empty levels skipped); each field keeps its per-level names in its
+    metadata and the level names are stored under ``LEVELS_METADATA_KEY`` in
+    the schema metadata, so the header structure can be rebuilt on read.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+
+    _, level_names = get_column_keys(headers)
+    columns = get_columns(headers, rows, as_numpy=False)
+
+    fields = []
+    arrays = []
+    for key, values in columns.items():
+        array = _column_array(pa, values)
+        if level_names is None:
+            field = pa.field(key, array.type)
+        else:
+            field = pa.field(
+                "_".join(part for part in key if part),
+                array.type,
+                metadata={name: part for name, part in zip(level_names, key)},
+            )
+        fields.append(field)
+        arrays.append(array)
+
+    metadata = None
+    if level_names is not None:
+        metadata = {LEVELS_METADATA_KEY: json.dumps(level_names)}
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+def write_parquet(table, path, **kwargs):
+    """Write an Arrow table to ``path``; kwargs go to ``pyarrow.parquet.write_table``.
+
+    The file can be read back without copying through
+    ``pyarrow.parquet.read_table(path, memory_map=True)``.
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, path, **kwargs)
+    return path
+
+
+def write_parquet_files(tables, directory, **kwargs):
+    """Write a ``{name: table}`` mapping as ``<directory>/<name>.parquet`` files.
+
+    Returns the ``{name: path}`` mapping of the written files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    return {
+        name: write_parquet(table, os.path.join(directory, name + ".parquet"), **kwargs)
+        for name, table in tables.items()
+    }
@@ -0,0 +1,272 @@
+"""Persistent, compressed on-disk cache for raw API responses."""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+
+from urllib.parse import quote_plus
+
+_FOREVER = "forever"
+
+_ENTRY_SUFFIX = ".nbz"
+
+
+def current_season_start_year(today=None):
+    today = today or datetime.date.today()
+    # Seasons tip off in October; anything earlier belongs to last year's season.
+    return today.year if today.month >= 10 else today.year - 1
+
+
+def season_start_year(parameters):
+    """Best-effort season of a request from its Season or GameID parameter."""
+    season = parameters.get("Season") or parameters.get("SeasonYear")
+    if season:
+        match = re.match(r"^(\d{4})", str(season))
+        if match:
+            return int(match.group(1))
+    game_id = parameters.get("GameID") or parameters.get("GameId")
+    if game_id and len(str(game_id)) >= 5 and str(game_id)[3:5].isdigit():
+        year = int(str(game_id)[3:5])
+        # Two-digit season years; the league's first season is 1946-47.
+        return (1900 if year >= 46 else 2000) + year
+    return None
+
+
+def historical_ttl(past_ttl=None, current_ttl=300):
+    """TTL policy that keeps past-season responses for ``past_ttl`` (None = forever)."""
+
+    def policy(parameters):
+        season = season_start_year(parameters)
+        if season is not None and season < current_season_start_year():
+            return past_ttl
+        return current_ttl
+
+    return policy
+
+
+GAME_STATUS_FINAL = 3
+
+
+def payload_game_final(contents):
+    """True if a response body reports a final game status (``gameStatus`` 3).
+
+    Looks at the top level and one level down, where the V3 summary and live
+    payloads keep it (``boxScoreSummary.gameStatus``, ``game.gameStatus``).
+    """
+    try:
+        payload = json.loads(contents)
+    except (TypeError, ValueError):
+        return False
+    if not isinstance(payload, dict):
+        return False
+    candidates = [payload] + [value for value in payload.values() if isinstance(value, dict)]
+    return any(candidate.get("gameStatus") == GAME_STATUS_FINAL for candidate in candidates)
+
+
+class FinalGameTTL:
+    """TTL policy for game-scoped endpoints: a game is cached only once it is final.
+
+    Games from past seasons are final by definition. Current-season responses are
+    written only when their payload reports a final status, so live and upcoming
+    games (and payloads without a status) are never cached, and any entry found on
+    lookup is a final game.
+    """
+
+    # get_ttl passes the response body to policies that set this.
+    reads_contents = True
+
+    def __init__(self, final_ttl=None):
+        self.final_ttl = final_ttl
+
+    def __call__(self, parameters, contents=None):
+        season = season_start_year(parameters)
+        if season is not None and season < current_season_start_year():
+            return self.final_ttl
+        if contents is None or payload_game_final(contents):
+            return self.final_ttl
+        return 0
+
+
+DEFAULT_TTL_POLICIES = {
+    "boxscoretraditionalv3": FinalGameTTL(),
+    "boxscoreadvancedv3": FinalGameTTL(),
+    "boxscoresummaryv3": FinalGameTTL(),
+    "playbyplayv3": FinalGameTTL(),
+    "leaguegamelog": historical_ttl(),
+    "playergamelog": historical_ttl(),
+    "playercareerstats": 12 * 60 * 60,
+}
+
+
+class ResponseCache:
+    """Compressed response files with per-endpoint TTLs and a total size cap.
+
+    ``ttl_policies`` maps a policy name (see ``get_policy_name``) to a TTL in
+    seconds, ``None`` (never expires) or a callable taking the request parameters
+    and returning one of those; a callable with ``reads_contents`` set (such as
+    ``FinalGameTTL``) also gets the response body when one is stored. A TTL of 0
+    disables caching; endpoints without a policy get ``default_ttl``, 0 by
+    default, so only endpoints listed in the policies are ever cached and
+    uncached ones skip the disk entirely. Entries are written to a temporary file
+    and renamed into place, so concurrent processes never read a partial entry;
+    once the directory grows past ``max_bytes`` the least recently used entries
+    are removed.
+    """
+
+    def __init__(
+        self,
+        directory,
+        default_ttl=0,
+        ttl_policies=None,
+        max_bytes=256 * 1024 * 1024,
+        compress_level=6,
+    ):
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.ttl_policies = dict(DEFAULT_TTL_POLICIES if ttl_policies is None else ttl_policies)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._approx_bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_parameter_string(parameters):
+        return "&".join(
+            "{}={}".format(key, "" if val is None else quote_plus(str(val)))
+            for key, val in parameters
+        )
+
+    @staticmethod
+    def get_policy_name(endpoint):
+        """Policy key of an endpoint: its lower-cased name, minus any game id and ".json".
+
+        Stats endpoints stay as they are ("leaguegamelog"); live CDN paths lose the
+        per-game part, e.g. "boxscore/boxscore_0022400001.json" -> "boxscore/boxscore".
+        """
+        return re.sub(r"(_\d+)?\.json$", "", endpoint.lower())
+
+    def get_ttl(self, endpoint, parameters, contents=None):
+        """TTL for a request; ``contents`` is the response body when storing one."""
+        policy = self.ttl_policies.get(self.get_policy_name(endpoint), self.default_ttl)
+        if callable(policy):
+            if getattr(policy, "reads_contents", False):
+                policy = policy(dict(parameters), contents)
+            else:
+                policy = policy(dict(parameters))
+        return policy
+
+    def get_path(self, endpoint, base_url, parameters):
+        key = "{}?{}".format(base_url, self.get_parameter_string(parameters))
+        prefix = re.sub(r"[^a-z0-9]+", "_", endpoint.lower()).strip("_")
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "{}-{}{}".format(prefix, digest, _ENTRY_SUFFIX))
+
+    def get(self, endpoint, base_url, parameters):
+        """Return ``(contents, status_code, url)`` for a fresh entry, else None."""
+        ttl = self.get_ttl(endpoint, parameters)
+        if ttl is not None and ttl <= 0:
+            return None
+        path = self.get_path(endpoint, base_url, parameters)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            header, contents = zlib.decompress(raw).decode("utf-8").split("\n", 1)
+            meta = json.loads(header)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error):
+            self._remove(path)
+            return None
+        expires = meta.get("expires")
+        if expires != _FOREVER and expires <= time.time():
+            self._remove(path)
+            return None
+        try:
+            # mtime doubles as the last-access time for LRU eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        return contents, meta.get("status_code"), meta.get("url")
+
+    def set(self, endpoint, base_url, parameters, contents, status_code=None, url=None):
+        ttl = self.get_ttl(endpoint, parameters, contents)
+        if ttl is not None and ttl <= 0:
+            return False
+        meta = {
+            "expires": _FOREVER if ttl is None else time.time() + ttl,
+            "status_code": status_code,
+            "url": url,
+        }
+        raw = zlib.compress(
+            (json.dumps(meta) + "\n" + contents).encode("utf-8"), self.compress_level
+        )
+        path = self.get_path(endpoint, base_url, parameters)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._remove(tmp_path)
+            return False
+        self._account(len(raw))
+        return True
+
+    def clear(self):
+        for entry in self._scan():
+            self._remove(entry.path)
+        with self._lock:
+            self._approx_bytes = 0
+
+    def prune(self):
+        """Evict least recently used entries until the cache is under 90% of max_bytes."""
+        entries = []
+        total = 0
+        for entry in self._scan():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        if self.max_bytes is not None and total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+        with self._lock:
+            self._approx_bytes = total
+        return total
+
+    def _account(self, size):
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._approx_bytes is not None:
+                self._approx_bytes += size
+            needs_prune = self._approx_bytes is None or self._approx_bytes > self.max_bytes
+        if needs_prune:
+            self.prune()
+
+    def _scan(self):
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if e.name.endswith(_ENTRY_SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,68 @@
+"""Column-oriented views of tabular result sets."""
+
+import importlib.util
+
+# numpy is optional here and imported on first use, like pandas in get_data_frame().
+NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def get_column_keys(headers):
+    """Column keys of a result set: header names, or tuples for multi-level headers.
+
+    Multi-level headers (``[{"name", "columnNames", "columnSpan", "columnsToSkip"}]``)
+    are expanded the same way ``DataSet.get_data_frame`` builds its MultiIndex.
+    Returns ``(keys, level_names)``; ``level_names`` is None for flat headers.
+    """
+    if not headers:
+        return [], None
+    if isinstance(headers[0], str):
+        return list(headers), None
+
+    levels = []
+    level_names = []
+    for i, level in enumerate(headers):
+        level_names.append(level["name"] if "name" in level else "LEVEL_" + str(i))
+        column_names = [""] * level.get("columnsToSkip", 0)
+        span = level.get("columnSpan", 1)
+        for name in level["columnNames"]:
+            column_names.extend([name] * span)
+        levels.append(column_names)
+    return list(zip(*levels)), level_names
+
+
+def get_columns(headers, rows, as_numpy=None):
+    """Map each column key to its values without building a dict per row.
+
+    Columns are tuples, or NumPy arrays when ``as_numpy`` is true (the default
+    when NumPy is installed). Keys are as returned by ``get_column_keys``.
+    """
+    if as_numpy is None:
+        as_numpy = NUMPY
+    elif as_numpy and not NUMPY:
+        raise Exception("Import Missing - Failed to import numpy.")
+    keys, _ = get_column_keys(headers)
+    # zip(*rows) transposes in C; an empty result set still gets its columns.
+    columns = list(zip(*rows)) if rows else [()] * len(keys)
+    if as_numpy:
+        import numpy as np
+
+        columns = [_column_array(np, column) for column in columns]
+    return dict(zip(keys, columns))
+
+
+def _column_array(np, column):
+    try:
+        array = np.array(column)
+    except ValueError:
+        array = None
+    if (
+        array is None
+        or array.ndim != 1
+        or array.dtype.kind in "OSU"
+        and not all(isinstance(value, str) for value in column)
+    ):
+        # Mixed or nested columns (e.g. "-" placeholders among numbers) keep
+        # their values as-is rather than being coerced to strings.
+        array = np.empty(len(column), dtype=object)
+        array[:] = column
+    return array
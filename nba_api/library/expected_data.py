@@ -0,0 +1,34 @@
+"""Lazily loaded expected_data schemas for endpoint classes."""
+
+import json
+import threading
+
+
+class ExpectedData:
+    """Class attribute serving ``expected_data`` from a packaged JSON resource.
+
+    The resource maps endpoint class names to their schema. It is read the first
+    time any endpoint in the package asks for its schema, so importing endpoint
+    modules allocates nothing for them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._schemas = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._schemas is None:
+            with self._lock:
+                if self._schemas is None:
+                    with open(self.path, encoding="utf-8") as f:
+                        self._schemas = json.load(f)
+        return self._schemas
+
+    def __get__(self, instance, owner):
+        try:
+            return self.load()[owner.__name__]
+        except KeyError:
+            raise AttributeError(
+                "{} has no expected_data".format(owner.__name__)
+            ) from None
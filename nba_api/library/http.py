@@ -1,9 +1,19 @@
 import os
+import asyncio
+import copy
+import importlib.util
 import json
 import random
+import threading
+import time
 import requests
 
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+
+from nba_api.library.cache import ResponseCache
+from nba_api.library.throttle import RetryPolicy, TokenBucket
 
 try:
     from nba_api.library.debug.debug import DEBUG
@@ -23,23 +33,46 @@ except ImportError:
     PROXY = ""
 
 
-if DEBUG:
-    from hashlib import md5
+# aiohttp is only needed by the async clients and is slow to import, so it is
+# imported when the first async session is created.
+AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
 
+if DEBUG:
     print("DEBUG MODE")
 
 
 class NBAResponse:
+    # Any callable taking a str and raising ValueError on bad input, e.g. orjson.loads.
+    json_decoder = staticmethod(json.loads)
+
     def __init__(self, response, status_code, url):
         self._response = response
         self._status_code = status_code
         self._url = url
+        self._dict = None
+        self._decode_error = None
+        self.retries = 0
+        self.rate_limit_wait = 0.0
+
+    @classmethod
+    def set_json_decoder(cls, decoder=None) -> None:
+        cls.json_decoder = staticmethod(decoder or json.loads)
 
     def get_response(self):
         return self._response
 
     def get_dict(self):
-        return json.loads(self._response)
+        # Parse once and reuse; callers share the returned dict.
+        if self._dict is None:
+            if self._decode_error is not None:
+                raise self._decode_error
+            try:
+                self._dict = self.json_decoder(self._response)
+            except ValueError as e:
+                self._decode_error = e
+                raise
+        return self._dict
 
     def get_json(self):
         return json.dumps(self.get_dict())
@@ -54,6 +87,28 @@ class NBAResponse:
     def get_url(self):
         return self._url
 
+    def get_status_code(self):
+        return self._status_code
+
+    def get_request_stats(self):
+        return {"retries": self.retries, "rate_limit_wait": self.rate_limit_wait}
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _freeze(value):
+    """Hashable stand-in for a headers dict or proxy list in a flight key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
 
 class NBAHTTP:
     nba_response = NBAResponse
@@ -66,37 +121,195 @@ class NBAHTTP:
 
     _session = None
 
+    _session_lock = threading.Lock()
+
+    # Connection pool for this client's base URL host. Subclasses (stats vs live
+    # CDN) keep separate sessions and can be tuned with configure_pool().
+    pool_connections = 10
+
+    pool_maxsize = 10
+
+    pool_block = False
+
+    keep_alive = True
+
+    # When enabled, ETag / Last-Modified validators are remembered per request and
+    # a 304 Not Modified reply returns the previously received NBAResponse.
+    conditional_requests = False
+
+    conditional_cache_size = 512
+
+    _conditional_cache = None
+
+    _conditional_lock = threading.Lock()
+
+    retry_policy = RetryPolicy()
+
+    # Token buckets keyed by host, shared by every NBAHTTP subclass.
+    _rate_limiters = {}
+
+    _rate_limiters_lock = threading.Lock()
+
+    # Optional ResponseCache shared by every NBAHTTP subclass.
+    _response_cache = None
+
+    # Identical concurrent requests (same base URL and sorted parameters) share
+    # one network call and one NBAResponse.
+    coalesce_requests = True
+
+    _in_flight = {}
+
+    _in_flight_lock = threading.Lock()
+
+    _async_in_flight = {}
+
     @classmethod
     def get_session(cls):
+        # The session is shared between threads; only its creation needs a lock,
+        # urllib3's connection pools are thread-safe.
         session = cls._session
         if session is None:
-            session = requests.Session()
-            cls._session = session
+            with cls._session_lock:
+                session = cls._session
+                if session is None:
+                    session = requests.Session()
+                    cls.mount_pool(session)
+                    cls._session = session
         return session
 
     @classmethod
     def set_session(cls, session) -> None:
         cls._session = session
 
+    @classmethod
+    def get_pool_prefix(cls):
+        if not cls.base_url:
+            return None
+        parts = urlsplit(cls.base_url)
+        return "{}://{}/".format(parts.scheme, parts.netloc)
+
+    @classmethod
+    def mount_pool(cls, session) -> None:
+        prefix = cls.get_pool_prefix()
+        if prefix is None or not hasattr(session, "mount"):
+            return
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                pool_connections=cls.pool_connections,
+                pool_maxsize=cls.pool_maxsize,
+                pool_block=cls.pool_block,
+            ),
+        )
+
+    @classmethod
+    def configure_pool(
+        cls, pool_connections=None, pool_maxsize=None, pool_block=None, keep_alive=None
+    ) -> None:
+        """Set pool sizing; remounts the live session's adapter only if it changed.
+
+        Remounting drops the pooled (possibly warmed up) connections, so calling
+        this again with the current settings is a no-op.
+        """
+        pool = (cls.pool_connections, cls.pool_maxsize, cls.pool_block)
+        if pool_connections is not None:
+            cls.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            cls.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            cls.pool_block = pool_block
+        if keep_alive is not None:
+            cls.keep_alive = keep_alive
+        if (cls.pool_connections, cls.pool_maxsize, cls.pool_block) == pool:
+            return
+        with cls._session_lock:
+            if cls._session is not None:
+                previous = getattr(cls._session, "adapters", {}).get(cls.get_pool_prefix())
+                cls.mount_pool(cls._session)
+                if previous is not None:
+                    previous.close()
+
+    @classmethod
+    def warm_up(cls, connections=None, timeout=5):
+        """Open up to ``connections`` pooled connections to the base URL host.
+
+        Returns the number of connections that completed a request; failures are
+        ignored since the first real request will simply connect on its own.
+        """
+        prefix = cls.get_pool_prefix()
+        if prefix is None:
+            return 0
+        if connections is None:
+            connections = cls.pool_maxsize
+        session = cls.get_session()
+
+        def touch(_):
+            try:
+                session.head(prefix, headers=cls.headers, timeout=timeout)
+            except requests.RequestException:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=max(1, connections)) as pool:
+            return sum(pool.map(touch, range(connections)))
+
+    @classmethod
+    def set_conditional_requests(cls, enabled=True) -> None:
+        cls.conditional_requests = enabled
+
+    @classmethod
+    def get_conditional_cache(cls):
+        with cls._conditional_lock:
+            if cls._conditional_cache is None:
+                cls._conditional_cache = {}
+            return cls._conditional_cache
+
+    @classmethod
+    def clear_conditional_cache(cls) -> None:
+        with cls._conditional_lock:
+            cls._conditional_cache = {}
+
+    @staticmethod
+    def set_response_cache(response_cache) -> None:
+        NBAHTTP._response_cache = response_cache
+
+    @staticmethod
+    def get_response_cache():
+        response_cache = NBAHTTP._response_cache
+        if response_cache is None and DEBUG and DEBUG_STORAGE:
+            # Debug storage keeps every response forever, uncapped.
+            response_cache = ResponseCache(
+                directory=os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)), "debug", "debug_storage"
+                ),
+                default_ttl=None,
+                ttl_policies={},
+                max_bytes=None,
+            )
+            NBAHTTP._response_cache = response_cache
+        return response_cache
+
+    @classmethod
+    def set_retry_policy(cls, retry_policy) -> None:
+        cls.retry_policy = retry_policy if retry_policy is not None else RetryPolicy(retries=0)
+
+    @staticmethod
+    def set_rate_limit(host, rate, burst=None) -> None:
+        """Limit requests to ``host`` to ``rate`` per second; ``rate=None`` removes the limit."""
+        with NBAHTTP._rate_limiters_lock:
+            if rate is None:
+                NBAHTTP._rate_limiters.pop(host, None)
+            else:
+                NBAHTTP._rate_limiters[host] = TokenBucket(rate=rate, burst=burst)
+
+    @staticmethod
+    def get_rate_limiter(host):
+        return NBAHTTP._rate_limiters.get(host)
+
     def clean_contents(self, contents):
         return contents
 
-    def send_api_request(
-        self,
-        endpoint,
-        parameters,
-        referer=None,
-        proxy=None,
-        headers=None,
-        timeout=None,
-        raise_exception_on_error=False,
-    ):
-        if not self.base_url:
-            raise Exception("Cannot use send_api_request from _HTTP class.")
-        base_url = self.base_url.format(endpoint=endpoint)
-        endpoint = endpoint.lower()
-        self.parameters = parameters
-
+    def _prepare_headers(self, headers, referer):
         if headers is None:
             request_headers = self.headers
         else:
@@ -104,7 +317,12 @@ class NBAHTTP:
 
         if referer:
             request_headers["Referer"] = referer
+        if not self.keep_alive:
+            request_headers = dict(request_headers or {})
+            request_headers["Connection"] = "close"
+        return request_headers
 
+    def _prepare_proxy(self, proxy):
         if proxy is None:
             request_proxy = PROXY
         elif not proxy:
@@ -116,7 +334,173 @@ class NBAHTTP:
             request_proxy = random.choice(request_proxy)
             if DEBUG:
                 print(request_proxy)
+        return request_proxy or None
+
+    def _conditional_headers(self, conditional_key, request_headers):
+        conditional_entry = self.get_conditional_cache().get(conditional_key)
+        if conditional_entry is not None:
+            etag, last_modified, _ = conditional_entry
+            request_headers = dict(request_headers or {})
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+        return conditional_entry, request_headers
+
+    def _remember_conditional(self, conditional_key, response_headers, data):
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not (etag or last_modified) or not data.valid_json():
+            return
+        conditional_cache = self.get_conditional_cache()
+        with self._conditional_lock:
+            conditional_cache.pop(conditional_key, None)
+            conditional_cache[conditional_key] = (etag, last_modified, data)
+            while len(conditional_cache) > self.conditional_cache_size:
+                conditional_cache.pop(next(iter(conditional_cache)))
+
+    def _get_with_retries(self, url, params, headers, proxies, timeout):
+        limiter = self.get_rate_limiter(urlsplit(url).hostname)
+        retry_policy = self.retry_policy
+        retries = 0
+        rate_limit_wait = 0.0
+        while True:
+            if limiter is not None:
+                rate_limit_wait += limiter.acquire()
+            try:
+                response = self.get_session().get(
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    proxies=proxies,
+                    timeout=timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if not retry_policy.should_retry(retries):
+                    raise
+                retry_after = None
+            else:
+                if not retry_policy.should_retry(retries, response.status_code):
+                    return response, retries, rate_limit_wait
+                retry_after = response.headers.get("Retry-After")
+            time.sleep(retry_policy.get_backoff(retries, retry_after))
+            retries += 1
+
+    @staticmethod
+    def _store_response(response_cache, endpoint, base_url, parameters, data):
+        if response_cache is None or not data.valid_json():
+            return
+        response_cache.set(
+            endpoint,
+            base_url,
+            parameters,
+            data.get_response(),
+            status_code=data.get_status_code(),
+            url=data.get_url(),
+        )
+
+    @staticmethod
+    def _with_request_stats(data, retries, rate_limit_wait):
+        data.retries = retries
+        data.rate_limit_wait = rate_limit_wait
+        return data
+
+    def _build_response(self, contents, status_code, url, raise_exception_on_error):
+        data = self.nba_response(response=contents, status_code=status_code, url=url)
+
+        if raise_exception_on_error and not data.valid_json():
+            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+
+        return data
+
+    def send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+        conditional=None,
+    ):
+        if not self.base_url:
+            raise Exception("Cannot use send_api_request from _HTTP class.")
+        if not self.coalesce_requests:
+            return self._send_api_request(
+                endpoint, parameters, referer, proxy, headers, timeout,
+                raise_exception_on_error, conditional,
+            )
+
+        self.parameters = parameters
+        key = self._flight_key(
+            endpoint, parameters, referer, proxy, headers, timeout,
+            raise_exception_on_error, conditional,
+        )
+        with NBAHTTP._in_flight_lock:
+            flight = NBAHTTP._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = NBAHTTP._in_flight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._send_api_request(
+                endpoint, parameters, referer, proxy, headers, timeout,
+                raise_exception_on_error, conditional,
+            )
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with NBAHTTP._in_flight_lock:
+                NBAHTTP._in_flight.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def _flight_key(
+        self, endpoint, parameters, referer, proxy, headers, timeout,
+        raise_exception_on_error, conditional,
+    ):
+        # Everything that changes what is sent, how long it may take or how the
+        # response is checked is part of the key, so a caller never gets a response
+        # fetched through another caller's proxy or headers, never waits behind a
+        # leader with a longer timeout, and never gets one its own error handling
+        # would reject.
+        return (
+            self.base_url.format(endpoint=endpoint),
+            tuple(sorted(parameters.items(), key=lambda kv: kv[0])),
+            referer,
+            _freeze(proxy),
+            _freeze(headers),
+            _freeze(timeout),
+            bool(raise_exception_on_error),
+            conditional,
+        )
+
+    def _send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer,
+        proxy,
+        headers,
+        timeout,
+        raise_exception_on_error,
+        conditional,
+    ):
+        base_url = self.base_url.format(endpoint=endpoint)
+        endpoint = endpoint.lower()
+        self.parameters = parameters
 
+        request_headers = self._prepare_headers(headers, referer)
+
+        request_proxy = self._prepare_proxy(proxy)
         proxies = None
         if request_proxy:
             proxies = {
@@ -124,60 +508,278 @@ class NBAHTTP:
                 "https": request_proxy,
             }
 
-        url = None
-        status_code = None
-        contents = None
-
         # Sort parameters by key... for some reason this matters for some requests...
         parameters = sorted(parameters.items(), key=lambda kv: kv[0])
 
-        if DEBUG and DEBUG_STORAGE:
-            print(endpoint, parameters)
-            directory_name = "debug_storage"
-            parameter_string = "&".join(
-                "{}={}".format(key, "" if val is None else quote_plus(str(val)))
-                for key, val in parameters
+        response_cache = self.get_response_cache()
+        if response_cache is not None:
+            cached = response_cache.get(endpoint, base_url, parameters)
+            if cached is not None:
+                if DEBUG:
+                    print("loading from cache...", endpoint)
+                contents, status_code, url = cached
+                return self._build_response(
+                    contents, status_code, url, raise_exception_on_error
+                )
+
+        if conditional is None:
+            conditional = self.conditional_requests
+        conditional_key = None
+        conditional_entry = None
+        if conditional:
+            conditional_key = (base_url, tuple(parameters))
+            conditional_entry, request_headers = self._conditional_headers(
+                conditional_key, request_headers
             )
-            url = "{}?{}".format(base_url, parameter_string)
-            print(url)
-            file_name = "{}-{}.txt".format(
-                endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
+
+        response, retries, rate_limit_wait = self._get_with_retries(
+            url=base_url,
+            params=parameters,
+            headers=request_headers,
+            proxies=proxies,
+            timeout=timeout,
+        )
+        if response.status_code == 304 and conditional_entry is not None:
+            return self._with_request_stats(
+                copy.copy(conditional_entry[2]), retries, rate_limit_wait
             )
-            file_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
+        url = response.url
+        status_code = response.status_code
+
+        contents = self.clean_contents(response.text)
+        data = self._build_response(contents, status_code, url, raise_exception_on_error)
+        self._with_request_stats(data, retries, rate_limit_wait)
+
+        if status_code == 200:
+            if conditional_key is not None:
+                self._remember_conditional(conditional_key, response.headers, data)
+            self._store_response(response_cache, endpoint, base_url, parameters, data)
+
+        return data
+
+
+class AsyncNBAHTTP:
+    """Mixin adding an asyncio counterpart of send_api_request to an NBAHTTP subclass.
+
+    Requests go through one aiohttp.ClientSession per event loop; the body is
+    wrapped in the same nba_response class, so endpoints parse it with their usual
+    load_response.
+    """
+
+    # (class, event loop) -> (session, task closing it when the loop shuts down).
+    # A ClientSession is bound to the loop that created it, so each loop gets its own.
+    _async_sessions = {}
+
+    @classmethod
+    async def get_async_session(cls):
+        if not AIOHTTP:
+            raise Exception("Import Missing - Failed to import aiohttp.")
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        entry = AsyncNBAHTTP._async_sessions.get((cls, loop))
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+
+        cls._forget_closed_loops()
+        connector = aiohttp.TCPConnector(
+            limit=cls.pool_connections * cls.pool_maxsize,
+            limit_per_host=cls.pool_maxsize,
+            force_close=not cls.keep_alive,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        cls._register_async_session(loop, session, owned=True)
+        return session
+
+    @classmethod
+    def set_async_session(cls, session) -> None:
+        """Use ``session`` for requests made on the running event loop.
+
+        Must be called from that loop; the caller keeps ownership and closes it.
+        """
+        loop = asyncio.get_running_loop()
+        cls._register_async_session(loop, session, owned=False)
+
+    @classmethod
+    async def close_async_session(cls) -> None:
+        """Close the running loop's session (sessions of other loops are left alone)."""
+        entry = AsyncNBAHTTP._async_sessions.pop((cls, asyncio.get_running_loop()), None)
+        if entry is None:
+            return
+        session, closer = entry
+        if closer is not None:
+            closer.cancel()
+        if not session.closed:
+            await session.close()
+
+    @classmethod
+    def _register_async_session(cls, loop, session, owned):
+        previous = AsyncNBAHTTP._async_sessions.get((cls, loop))
+        if previous is not None and previous[1] is not None:
+            previous[1].cancel()
+        closer = None
+        if owned:
+            # asyncio.run() cancels leftover tasks before closing the loop, which
+            # lets this one close the session while its loop is still running.
+            closer = loop.create_task(cls._close_on_shutdown(session))
+        AsyncNBAHTTP._async_sessions[(cls, loop)] = (session, closer)
+
+    @staticmethod
+    async def _close_on_shutdown(session):
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            if not session.closed:
+                await session.close()
+            raise
+
+    @classmethod
+    def _forget_closed_loops(cls):
+        # Loops closed without cancelling their tasks (loop.close() by hand) leave
+        # entries behind; their sessions can no longer be awaited, only dropped.
+        for key in [key for key in AsyncNBAHTTP._async_sessions if key[1].is_closed()]:
+            AsyncNBAHTTP._async_sessions.pop(key, None)
+
+    async def send_api_request_async(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+        conditional=None,
+    ):
+        if not self.base_url:
+            raise Exception("Cannot use send_api_request_async from _HTTP class.")
+        if not self.coalesce_requests:
+            return await self._send_api_request_async(
+                endpoint, parameters, referer, proxy, headers, timeout,
+                raise_exception_on_error, conditional,
             )
-            if not os.path.exists(file_path):
-                os.makedirs(file_path)
-            file_path = os.path.join(file_path, file_name)
-            print(file_name, os.path.isfile(file_path))
-            if os.path.isfile(file_path):
-                f = open(file_path, "r")
-                contents = f.read()
-                f.close()
-                print("loading from file...")
-
-        if not contents:
-            response = self.get_session().get(
-                url=base_url,
-                params=parameters,
-                headers=request_headers,
-                proxies=proxies,
-                timeout=timeout,
+
+        # Futures belong to one event loop, so coalescing is per loop.
+        self.parameters = parameters
+        key = (
+            asyncio.get_running_loop(),
+            self._flight_key(
+                endpoint, parameters, referer, proxy, headers, timeout,
+                raise_exception_on_error, conditional,
+            ),
+        )
+        future = NBAHTTP._async_in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        NBAHTTP._async_in_flight[key] = future
+        try:
+            result = await self._send_api_request_async(
+                endpoint, parameters, referer, proxy, headers, timeout,
+                raise_exception_on_error, conditional,
             )
-            url = response.url
-            status_code = response.status_code
-            contents = response.text
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a flight without followers does not log a warning.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            NBAHTTP._async_in_flight.pop(key, None)
+        return result
 
-        contents = self.clean_contents(contents)
-        if DEBUG and DEBUG_STORAGE:
-            f = open(file_path, "w")
-            f.write(contents)
-            f.close()
-            print(url)
+    async def _send_api_request_async(
+        self,
+        endpoint,
+        parameters,
+        referer,
+        proxy,
+        headers,
+        timeout,
+        raise_exception_on_error,
+        conditional,
+    ):
+        import aiohttp
 
-        data = self.nba_response(response=contents, status_code=status_code, url=url)
+        base_url = self.base_url.format(endpoint=endpoint)
+        self.parameters = parameters
 
-        if raise_exception_on_error and not data.valid_json():
-            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+        request_headers = self._prepare_headers(headers, referer)
+        request_proxy = self._prepare_proxy(proxy)
+
+        # Sort parameters by key... for some reason this matters for some requests...
+        parameters = sorted(parameters.items(), key=lambda kv: kv[0])
+        # requests drops None-valued parameters; aiohttp only accepts strings.
+        query = [(key, str(val)) for key, val in parameters if val is not None]
+
+        response_cache = self.get_response_cache()
+        if response_cache is not None:
+            cached = response_cache.get(endpoint.lower(), base_url, parameters)
+            if cached is not None:
+                contents, status_code, url = cached
+                return self._build_response(
+                    contents, status_code, url, raise_exception_on_error
+                )
+
+        if conditional is None:
+            conditional = self.conditional_requests
+        conditional_key = None
+        conditional_entry = None
+        if conditional:
+            conditional_key = (base_url, tuple(parameters))
+            conditional_entry, request_headers = self._conditional_headers(
+                conditional_key, request_headers
+            )
+
+        limiter = self.get_rate_limiter(urlsplit(base_url).hostname)
+        retry_policy = self.retry_policy
+        retries = 0
+        rate_limit_wait = 0.0
+        session = await self.get_async_session()
+        while True:
+            if limiter is not None:
+                rate_limit_wait += await limiter.acquire_async()
+            try:
+                async with session.get(
+                    base_url,
+                    params=query,
+                    headers=request_headers,
+                    proxy=request_proxy,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
+                    status_code = response.status
+                    retry_after = response.headers.get("Retry-After")
+                    if not retry_policy.should_retry(retries, status_code):
+                        url = str(response.url)
+                        contents = await response.text()
+                        response_headers = response.headers
+                        break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not retry_policy.should_retry(retries):
+                    raise
+                retry_after = None
+            await asyncio.sleep(retry_policy.get_backoff(retries, retry_after))
+            retries += 1
+
+        if status_code == 304 and conditional_entry is not None:
+            return self._with_request_stats(
+                copy.copy(conditional_entry[2]), retries, rate_limit_wait
+            )
+
+        contents = self.clean_contents(contents)
+        data = self._build_response(contents, status_code, url, raise_exception_on_error)
+        self._with_request_stats(data, retries, rate_limit_wait)
+
+        if status_code == 200:
+            if conditional_key is not None:
+                self._remember_conditional(conditional_key, response_headers, data)
+            self._store_response(
+                response_cache, endpoint.lower(), base_url, parameters, data
+            )
 
         return data
@@ -0,0 +1,84 @@
+"""Retry policy and per-host rate limiting shared by the HTTP clients."""
+
+import asyncio
+import random
+import threading
+import time
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for transient request failures.
+
+    ``retries`` is the number of extra attempts after the first one. Connection
+    errors, timeouts and any status in ``retry_statuses`` are retried.
+    """
+
+    def __init__(
+        self,
+        retries=2,
+        backoff_factor=0.5,
+        backoff_max=10.0,
+        jitter=0.5,
+        retry_statuses=(429, 500, 502, 503, 504),
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(self, attempt, status_code=None):
+        if attempt >= self.retries:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def get_backoff(self, attempt, retry_after=None):
+        delay = min(self.backoff_max, self.backoff_factor * (2**attempt))
+        delay += random.uniform(0, delay * self.jitter)
+        if retry_after:
+            try:
+                delay = max(delay, min(self.backoff_max, float(retry_after)))
+            except ValueError:
+                pass
+        return delay
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers that exceed the budget wait their turn.
+
+    ``reserve`` always takes a token, letting the balance go negative, and returns
+    how long the caller has to wait before using it. Waiters are therefore served in
+    reservation order and nobody is rejected.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -1,6 +1,6 @@
 __all__ = ["playbyplay", "boxscore", "scoreboard", "odds"]
 
-from .playbyplay import PlayByPlay
-from .boxscore import BoxScore
+from .playbyplay import PlayByPlay, PlayByPlayFollower, PlayByPlaySlate
+from .boxscore import BoxScore, BoxScoreDiffer, BoxScoreSlate
 from .scoreboard import ScoreBoard
 from .odds import Odds
\ No newline at end of file
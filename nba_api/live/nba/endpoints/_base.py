@@ -1,7 +1,15 @@
 import json
+import os
+
+from nba_api.library.expected_data import ExpectedData
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP
 
 
 class Endpoint:
+    expected_data = ExpectedData(
+        os.path.join(os.path.dirname(__file__), "_expected_data", "endpoints.json")
+    )
+
     class DataSet:
         key = None
         data = {}
@@ -15,6 +23,24 @@ class Endpoint:
         def get_dict(self):
             return self.data
 
+    @classmethod
+    async def create_async(cls, *args, **kwargs):
+        """Awaitable constructor: build the endpoint and fetch it without blocking the loop."""
+        kwargs["get_request"] = False
+        endpoint = cls(*args, **kwargs)
+        await endpoint.get_request_async()
+        return endpoint
+
+    async def get_request_async(self):
+        self.nba_response = await AsyncNBALiveHTTP().send_api_request_async(
+            endpoint=self.endpoint_url.format(**vars(self)),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
     def get_request_url(self):
         return self.nba_response.get_url()
 
@@ -0,0 +1 @@
+"""Expected data definitions for NBA Live API endpoints."""
@@ -6,52 +6,6 @@ class Odds(Endpoint):
     """Endpoint for retrieving live betting odds for NBA games."""
 
     endpoint_url = "odds/odds_todaysGames.json" # Oddly enough, this doesn't only return today's games
-    expected_data = {
-        "games": [
-            {
-                "gameId": "",
-                "sr_id": "",
-                "srMatchId": "",
-                "homeTeamId": "",
-                "awayTeamId": "",
-                "markets": [
-                    {
-                        "name": "",
-                        "odds_type_id": 0,
-                        "group_name": "",
-                        "books": [
-                            {
-                                "id": "",
-                                "name": "",
-                                "outcomes": [
-                                    {
-                                        "odds_field_id": 0,
-                                        "type": "",
-                                        "odds": "",
-                                        "opening_odds": "",
-                                        "odds_trend": "",
-                                        "spread": None,        # For spread markets
-                                        "opening_spread": None # For spread markets
-                                    },
-                                    {
-                                        "odds_field_id": 0,
-                                        "type": "",
-                                        "odds": "",
-                                        "opening_odds": "",
-                                        "odds_trend": "",
-                                        "spread": None,        # For spread markets
-                                        "opening_spread": None # For spread markets
-                                    }
-                                ],
-                                "url": "",
-                                "countryCode": ""
-                            }
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -1,57 +1,9 @@
 from nba_api.live.nba.endpoints._base import Endpoint
-from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.live.nba.library.http import AsyncNBALiveHTTP, NBALiveHTTP
 
 
 class PlayByPlay(Endpoint):
     endpoint_url = "playbyplay/playbyplay_{game_id}.json"
-    expected_data = {
-        "meta": {
-            "version": 1,
-            "code": 200,
-            "request": "http://nba.cloud/games/0022000180/playbyplay?Format=json",
-            "time": "2021-01-15 23:48:58.906160",
-        },
-        "game": {
-            "gameId": "0022000180",
-            "actions": [
-                {
-                    "actionNumber": 4,
-                    "clock": "PT11M58.00S",
-                    "timeActual": "2021-01-16T00:40:31.3Z",
-                    "period": 1,
-                    "periodType": "REGULAR",
-                    "teamId": 1610612738,
-                    "teamTricode": "BOS",
-                    "actionType": "jumpball",
-                    "subType": "recovered",
-                    "descriptor": "startperiod",
-                    "qualifiers": [],
-                    "personId": 1629684,
-                    "x": None,
-                    "y": None,
-                    "possession": 1610612738,
-                    "scoreHome": "0",
-                    "scoreAway": "0",
-                    "edited": "2021-01-16T00:40:31Z",
-                    "orderNumber": 40000,
-                    "xLegacy": None,
-                    "yLegacy": None,
-                    "isFieldGoal": 0,
-                    "jumpBallRecoveredName": "G. Williams",
-                    "jumpBallRecoverdPersonId": 1629684,
-                    "side": None,
-                    "playerName": "Williams",
-                    "playerNameI": "G. Williams",
-                    "personIdsFilter": [1629684, 202684, 202696],
-                    "jumpBallWonPlayerName": "Thompson",
-                    "jumpBallWonPersonId": 202684,
-                    "description": "Jump Ball T. Thompson vs. N. Vucevic: Tip to G. Williams",
-                    "jumpBallLostPlayerName": "Vucevic",
-                    "jumpBallLostPersonId": 202696,
-                }
-            ],
-        },
-    }
 
     # Data Sets
     game = Endpoint.DataSet
@@ -88,3 +40,187 @@ class PlayByPlay(Endpoint):
         data_sets = self.nba_response.get_dict()
         if "game" in data_sets and "actions" in data_sets["game"]:
             self.actions = Endpoint.DataSet(data=data_sets["game"]["actions"])
+
+
+class PlayByPlayUpdate:
+    """What changed in one game's feed since the previous poll.
+
+    ``new`` and ``edited`` are action dicts in feed order, ``deleted`` the
+    actionNumbers that disappeared. ``unchanged`` is True when the feed body was
+    identical (or a 304), in which case nothing was parsed. ``error`` holds the
+    exception of a failed poll when polling through PlayByPlaySlate.
+    """
+
+    def __init__(self, game_id, new=(), edited=(), deleted=(), unchanged=False, error=None):
+        self.game_id = game_id
+        self.new = list(new)
+        self.edited = list(edited)
+        self.deleted = list(deleted)
+        self.unchanged = unchanged
+        self.error = error
+
+    def __bool__(self):
+        return bool(self.new or self.edited or self.deleted)
+
+    def __repr__(self):
+        return "PlayByPlayUpdate(game_id={!r}, new={}, edited={}, deleted={})".format(
+            self.game_id, len(self.new), len(self.edited), len(self.deleted)
+        )
+
+
+class PlayByPlayFollower:
+    """Follows one game's live play-by-play and reports only what changed.
+
+    The follower remembers the highest actionNumber it has handed out and the
+    editedTime of every action. Each poll does one pass of dict lookups over the
+    feed: actions past the high-water mark (or never seen) are new, known actions
+    whose editedTime moved are edited, and actions missing from the feed are
+    reported as deleted. Conditional requests are used by default, and a body
+    identical to the previous one is not parsed at all.
+    """
+
+    update_class = PlayByPlayUpdate
+
+    def __init__(self, game_id, proxy=None, headers=None, timeout=30, conditional=True):
+        self.game_id = game_id
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self.conditional = conditional
+        self.last_action_number = 0
+        # actionNumber -> current action dict, in the order first seen.
+        self.actions = {}
+        self._edited_times = {}
+        self._last_body = None
+
+    def poll(self):
+        nba_response = NBALiveHTTP().send_api_request(
+            endpoint=PlayByPlay.endpoint_url.format(game_id=self.game_id),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            conditional=self.conditional,
+        )
+        return self.apply_response(nba_response)
+
+    async def poll_async(self):
+        nba_response = await AsyncNBALiveHTTP().send_api_request_async(
+            endpoint=PlayByPlay.endpoint_url.format(game_id=self.game_id),
+            parameters={},
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            conditional=self.conditional,
+        )
+        return self.apply_response(nba_response)
+
+    def apply_response(self, nba_response):
+        body = nba_response.get_response()
+        # A 304 hands back the previous response object, so identity is the common case.
+        if self._last_body is not None and (body is self._last_body or body == self._last_body):
+            return PlayByPlayUpdate(self.game_id, unchanged=True)
+        if not nba_response.valid_json():
+            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+        update = self.apply(nba_response.get_dict().get("game", {}).get("actions", []))
+        self._last_body = body
+        return update
+
+    def apply(self, actions):
+        """Diff a full ``actions`` list against the follower's state."""
+        known = self._edited_times
+        last_action_number = self.last_action_number
+        new = []
+        edited = []
+        present = 0
+        for action in actions:
+            number = action.get("actionNumber")
+            edited_time = action.get("editedTime")
+            if number is None:
+                continue
+            if number > last_action_number or number not in known:
+                new.append(action)
+                continue
+            present += 1
+            if known[number] != edited_time:
+                edited.append(action)
+
+        deleted = []
+        if present < len(known):
+            # Only rebuild the set of current numbers when something vanished.
+            current = {action.get("actionNumber") for action in actions}
+            deleted = [number for number in known if number not in current]
+            for number in deleted:
+                del known[number]
+                del self.actions[number]
+
+        for action in new + edited:
+            number = action["actionNumber"]
+            known[number] = action.get("editedTime")
+            self.actions[number] = action
+        if new:
+            self.last_action_number = max(
+                last_action_number, max(action["actionNumber"] for action in new)
+            )
+        return PlayByPlayUpdate(self.game_id, new, edited, deleted)
+
+
+class PlayByPlaySlate:
+    """One loop over a whole slate of games, each with its own PlayByPlayFollower.
+
+    ``poll()`` returns ``{game_id: PlayByPlayUpdate}``; a failing game gets an
+    update with ``error`` set instead of stopping the others. ``max_workers``
+    fetches games concurrently, ``poll_async`` does the same on an event loop.
+    Subclasses follow other feeds by setting ``follower_class``.
+    """
+
+    follower_class = PlayByPlayFollower
+
+    def __init__(self, game_ids=(), max_workers=1, **follower_kwargs):
+        self.max_workers = max_workers
+        self.follower_kwargs = follower_kwargs
+        self.followers = {}
+        for game_id in game_ids:
+            self.add_game(game_id)
+
+    def add_game(self, game_id):
+        if game_id not in self.followers:
+            self.followers[game_id] = self.follower_class(game_id, **self.follower_kwargs)
+        return self.followers[game_id]
+
+    def remove_game(self, game_id):
+        return self.followers.pop(game_id, None)
+
+    @staticmethod
+    def _poll_one(follower):
+        try:
+            return follower.poll()
+        except Exception as e:
+            return follower.update_class(follower.game_id, error=e)
+
+    def poll(self):
+        followers = list(self.followers.values())
+        if self.max_workers > 1 and len(followers) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(followers))) as pool:
+                updates = list(pool.map(self._poll_one, followers))
+        else:
+            updates = [self._poll_one(follower) for follower in followers]
+        return {update.game_id: update for update in updates}
+
+    async def poll_async(self):
+        import asyncio
+
+        followers = list(self.followers.values())
+        results = await asyncio.gather(
+            *(follower.poll_async() for follower in followers), return_exceptions=True
+        )
+        return {
+            follower.game_id: (
+                follower.update_class(follower.game_id, error=result)
+                if isinstance(result, Exception)
+                else result
+            )
+            for follower, result in zip(followers, results)
+        }
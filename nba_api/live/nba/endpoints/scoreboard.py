@@ -4,78 +4,6 @@ from nba_api.live.nba.library.http import NBALiveHTTP
 
 class ScoreBoard(Endpoint):
     endpoint_url = "scoreboard/todaysScoreboard_00.json"
-    expected_data = {
-        "meta": {"version": 0, "request": "", "time": "", "code": 0},
-        "scoreboard": {
-            "gameDate": "",
-            "leagueId": "",
-            "leagueName": "",
-            "games": [
-                {
-                    "gameId": "",
-                    "gameCode": "",
-                    "gameStatus": 0,
-                    "gameStatusText": "",
-                    "period": 0,
-                    "gameClock": "",
-                    "gameTimeUTC": "",
-                    "gameEt": "",
-                    "regulationPeriods": 0,
-                    "seriesGameNumber": "",
-                    "seriesText": "",
-                    "homeTeam": {
-                        "teamId": 0,
-                        "teamName": "",
-                        "teamCity": "",
-                        "teamTricode": "",
-                        "wins": 0,
-                        "losses": 0,
-                        "score": 0,
-                        "inBonus": None,
-                        "timeoutsRemaining": 0,
-                        "periods": [{"period": 0, "periodType": "", "score": 0}],
-                    },
-                    "awayTeam": {
-                        "teamId": 0,
-                        "teamName": "",
-                        "teamCity": "",
-                        "teamTricode": "",
-                        "wins": 0,
-                        "losses": 0,
-                        "score": 0,
-                        "inBonus": None,
-                        "timeoutsRemaining": 0,
-                        "periods": [{"period": 0, "periodType": "", "score": 0}],
-                    },
-                    "gameLeaders": {
-                        "homeLeaders": {
-                            "personId": 0,
-                            "name": "",
-                            "jerseyNum": "",
-                            "position": "",
-                            "teamTricode": "",
-                            "playerSlug": None,
-                            "points": 0,
-                            "rebounds": 0,
-                            "assists": 0,
-                        },
-                        "awayLeaders": {
-                            "personId": 0,
-                            "name": "",
-                            "jerseyNum": "",
-                            "position": "",
-                            "teamTricode": "",
-                            "playerSlug": None,
-                            "points": 0,
-                            "rebounds": 0,
-                            "assists": 0,
-                        },
-                    },
-                    "pbOdds": {"team": None, "odds": 0.0, "suspended": 0},
-                }
-            ],
-        },
-    }
 
     nba_response = None
     data_sets = None
@@ -24,3 +24,7 @@ class NBALiveHTTP(http.NBAHTTP):
         if '{"Message":"An error has occurred."}' in contents:
             return "<Error><Message>An error has occurred.</Message></Error>"
         return contents
+
+
+class AsyncNBALiveHTTP(http.AsyncNBAHTTP, NBALiveHTTP):
+    pass
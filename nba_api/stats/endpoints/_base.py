@@ -1,21 +1,30 @@
+import importlib.util
 import json
-import numpy as np
+import os
 
-try:
-    from pandas import DataFrame, MultiIndex
+from nba_api.library import arrow
+from nba_api.library.columns import get_columns
+from nba_api.library.expected_data import ExpectedData
+from nba_api.stats.library.http import AsyncNBAStatsHTTP, NBAStatsHTTP
 
-    PANDAS = True
-except ImportError:
-    PANDAS = False
+# pandas (and numpy with it) is imported on the first get_data_frame() call
+# rather than with every endpoint module.
+PANDAS = importlib.util.find_spec("pandas") is not None
 
 
 class Endpoint:
+    expected_data = ExpectedData(
+        os.path.join(os.path.dirname(__file__), "_expected_data", "endpoints.json")
+    )
+
     class DataSet:
         key = None
+        name = None
         data = {}
 
-        def __init__(self, data):
+        def __init__(self, data, name=None):
             self.data = data
+            self.name = name
 
         def get_json(self):
             return json.dumps(self.data)
@@ -23,11 +32,26 @@ class Endpoint:
         def get_dict(self):
             return self.data
 
+        def get_columns(self, as_numpy=None):
+            """Header -> column mapping (NumPy arrays when available), no per-row dicts."""
+            return get_columns(
+                self.data.get("headers"), self.data.get("data"), as_numpy=as_numpy
+            )
+
+        def get_arrow_table(self):
+            """pyarrow.Table of the data set, built without a pandas round-trip."""
+            return arrow.get_arrow_table(self.data.get("headers"), self.data.get("data"))
+
+        def write_parquet(self, path, **kwargs):
+            return arrow.write_parquet(self.get_arrow_table(), path, **kwargs)
+
         def get_data_frame(self):
             if not PANDAS:
                 raise Exception(
                     "Import Missing - Failed to import DataFrame from pandas."
                 )
+            import numpy as np
+            from pandas import DataFrame, MultiIndex
 
             if "headers" not in self.data or not self.data["headers"]:
                 return DataFrame()
@@ -62,6 +86,56 @@ class Endpoint:
                 )  # Use MultiIndex for dataframe columns
                 return DataFrame(self.data["data"], columns=midx)
 
+    @classmethod
+    async def create_async(cls, *args, **kwargs):
+        """Awaitable constructor: build the endpoint and fetch it without blocking the loop."""
+        kwargs["get_request"] = False
+        endpoint = cls(*args, **kwargs)
+        await endpoint.get_request_async()
+        return endpoint
+
+    async def get_request_async(self):
+        self.nba_response = await AsyncNBAStatsHTTP().send_api_request_async(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    def iter_data_sets(self):
+        """``{name: {"headers", "data"}}`` with "data" as a lazy row iterator.
+
+        If the endpoint was built with ``get_request=False`` the request is sent
+        here without going through load_response, so no DataSet is built.
+        """
+        from nba_api.stats.endpoints._parsers import has_parser_for_endpoint
+
+        if self.nba_response is None:
+            self.nba_response = NBAStatsHTTP().send_api_request(
+                endpoint=self.endpoint,
+                parameters=self.parameters,
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        parser_endpoint = (
+            self.endpoint if has_parser_for_endpoint(self.endpoint) else None
+        )
+        return self.nba_response.iter_data_sets(parser_endpoint)
+
+    def stream_data_sets(self, sink, names=None):
+        """Feed each data set to ``sink(name, headers, rows)`` one row at a time.
+
+        ``rows`` is an iterator, so a sink that writes or aggregates as it reads
+        (a csv.writer, a DB cursor's executemany, a running total) never holds the
+        whole data set. ``names`` restricts which data sets are streamed.
+        """
+        for name, data_set in self.iter_data_sets().items():
+            if names is None or name in names:
+                sink(name, data_set["headers"], data_set["data"])
+
     def get_request_url(self):
         return self.nba_response.get_url()
 
@@ -83,5 +157,25 @@ class Endpoint:
     def get_normalized_json(self):
         return self.nba_response.get_normalized_json()
 
+    def get_normalized_columns(self, as_numpy=None):
+        return self.nba_response.get_normalized_columns(as_numpy=as_numpy)
+
     def get_data_frames(self):
         return [data_set.get_data_frame() for data_set in self.data_sets]
+
+    def get_data_set_names(self):
+        """Result set name of each entry in data_sets, in the response's order."""
+        return [
+            data_set.name or "DataSet{}".format(i)
+            for i, data_set in enumerate(self.data_sets)
+        ]
+
+    def get_arrow_tables(self):
+        return {
+            name: data_set.get_arrow_table()
+            for name, data_set in zip(self.get_data_set_names(), self.data_sets)
+        }
+
+    def write_parquet(self, directory, **kwargs):
+        """Write each data set to ``<directory>/<name>.parquet``; returns the paths."""
+        return arrow.write_parquet_files(self.get_arrow_tables(), directory, **kwargs)
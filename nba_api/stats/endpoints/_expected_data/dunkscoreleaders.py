@@ -1,61 +0,0 @@
-"""Expected data structure for DunkScoreLeaders endpoint."""
-
-_EXPECTED_DATA = {
-    "Dunks": [
-        "GAME_ID",
-        "GAME_DATE",
-        "MATCHUP",
-        "PERIOD",
-        "GAME_CLOCK_TIME",
-        "EVENT_NUM",
-        "PLAYER_ID",
-        "PLAYER_NAME",
-        "FIRST_NAME",
-        "LAST_NAME",
-        "TEAM_ID",
-        "TEAM_NAME",
-        "TEAM_CITY",
-        "TEAM_ABBREVIATION",
-        "DUNK_SCORE",
-        "JUMP_SUBSCORE",
-        "POWER_SUBSCORE",
-        "STYLE_SUBSCORE",
-        "DEFENSIVE_CONTEST_SUBSCORE",
-        "MAX_BALL_HEIGHT",
-        "BALL_SPEED_THROUGH_RIM",
-        "PLAYER_VERTICAL",
-        "HANG_TIME",
-        "TAKEOFF_DISTANCE",
-        "REVERSE_DUNK",
-        "DUNK_360",
-        "THROUGH_THE_LEGS",
-        "ALLEY_OOP",
-        "TIP_IN",
-        "SELF_OOP",
-        "PLAYER_ROTATION",
-        "PLAYER_LATERAL_SPEED",
-        "BALL_DISTANCE_TRAVELED",
-        "BALL_REACH_BACK",
-        "TOTAL_BALL_ACCELERATION",
-        "DUNKING_HAND",
-        "JUMPING_FOOT",
-        "PASS_LENGTH",
-        "CATCHING_HAND",
-        "CATCH_DISTANCE",
-        "LATERAL_CATCH_DISTANCE",
-        "PASSER_ID",
-        "PASSER_NAME",
-        "PASSER_FIRST_NAME",
-        "PASSER_LAST_NAME",
-        "PASS_RELEASE_POINT",
-        "SHOOTER_ID",
-        "SHOOTER_NAME",
-        "SHOOTER_FIRST_NAME",
-        "SHOOTER_LAST_NAME",
-        "SHOT_RELEASE_POINT",
-        "SHOT_LENGTH",
-        "DEFENSIVE_CONTEST_LEVEL",
-        "POSSIBLE_ATTEMPTED_CHARGE",
-        "VIDEO_AVAILABLE",
-    ]
-}
@@ -8,6 +8,7 @@ Each parser is responsible for:
 - Extracting headers from the nested JSON structure
 - Flattening nested data into tabular format
 - Returning data in the format expected by Endpoint.DataSet
+- Yielding the same rows lazily from iter_data_sets(), for streaming consumers
 """
 
 from .boxscoreadvancedv3 import NBAStatsBoxscoreAdvancedV3Parser
@@ -47,6 +48,7 @@ __all__ = [
     "NBAStatsScheduleLeagueV2IntParser",
     "NBAStatsScoreboardV3Parser",
     "get_parser_for_endpoint",
+    "has_parser_for_endpoint",
 ]
 
 
@@ -87,3 +89,8 @@ def get_parser_for_endpoint(endpoint, nba_dict):
     """
     parser_class = _PARSER_REGISTRY[endpoint]
     return parser_class(nba_dict)
+
+
+def has_parser_for_endpoint(endpoint):
+    """Return True if ``endpoint`` responses are parsed by a V3 parser."""
+    return endpoint in _PARSER_REGISTRY
@@ -0,0 +1,14 @@
+"""Helpers shared by the parsers' iterator mode.
+
+Every parser exposes ``iter_data_sets()``, which returns the same
+``{name: {"headers": ..., "data": ...}}`` mapping as ``get_data_sets()`` except
+that each ``"data"`` is an iterator yielding rows as they are built.
+"""
+
+
+def materialize_data_sets(data_sets):
+    """Read every ``"data"`` iterator of an ``iter_data_sets()`` mapping into a list."""
+    return {
+        name: {"headers": data_set["headers"], "data": list(data_set["data"])}
+        for name, data_set in data_sets.items()
+    }
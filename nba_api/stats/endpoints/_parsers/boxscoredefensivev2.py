@@ -13,6 +13,8 @@ Structure:
     }
 """
 
+from ._stream import materialize_data_sets
+
 # Common metadata fields
 TEAM_METADATA_FIELDS = (
     "teamId",
@@ -107,8 +109,11 @@ class NBAStatsBoxscoreDefensiveV2Parser:
         Returns:
             list: List of two rows [home_team_data, away_team_data]
         """
+        return list(self.iter_team_data())
+
+    def iter_team_data(self):
+        """Yield the rows of get_team_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -122,9 +127,7 @@ class NBAStatsBoxscoreDefensiveV2Parser:
 
             # Combine into single row
             row = (game_id,) + team_metadata + stats_values
-            data.append(list(row))
-
-        return data
+            yield list(row)
 
     def get_player_data(self):
         """
@@ -133,8 +136,11 @@ class NBAStatsBoxscoreDefensiveV2Parser:
         Returns:
             list: List of player data rows
         """
+        return list(self.iter_player_data())
+
+    def iter_player_data(self):
+        """Yield the rows of get_player_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["awayTeam", "homeTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -157,11 +163,9 @@ class NBAStatsBoxscoreDefensiveV2Parser:
 
                 # Combine into single row
                 row = (game_id,) + team_metadata + player_metadata + stats_values
-                data.append(list(row))
+                yield list(row)
 
-        return data
-
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """
         Get all datasets for this endpoint.
 
@@ -172,10 +176,14 @@ class NBAStatsBoxscoreDefensiveV2Parser:
         return {
             "PlayerStats": {
                 "headers": list(self.get_player_headers()),
-                "data": self.get_player_data(),
+                "data": self.iter_player_data(),
             },
             "TeamStats": {
                 "headers": list(self.get_team_headers()),
-                "data": self.get_team_data(),
+                "data": self.iter_team_data(),
             },
         }
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
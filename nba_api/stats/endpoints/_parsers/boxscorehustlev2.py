@@ -18,6 +18,8 @@ Structure:
     }
 """
 
+from ._stream import materialize_data_sets
+
 # Common metadata fields
 TEAM_METADATA_FIELDS = (
     "teamId",
@@ -109,8 +111,11 @@ class NBAStatsBoxscoreHustleV2Parser:
         Returns:
             list: List of two rows [home_team_data, away_team_data]
         """
+        return list(self.iter_team_data())
+
+    def iter_team_data(self):
+        """Yield the rows of get_team_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -124,9 +129,7 @@ class NBAStatsBoxscoreHustleV2Parser:
 
             # Combine into single row
             row = (game_id,) + team_metadata + stats_values
-            data.append(list(row))
-
-        return data
+            yield list(row)
 
     def get_player_data(self):
         """
@@ -135,8 +138,11 @@ class NBAStatsBoxscoreHustleV2Parser:
         Returns:
             list: List of player data rows
         """
+        return list(self.iter_player_data())
+
+    def iter_player_data(self):
+        """Yield the rows of get_player_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["awayTeam", "homeTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -159,11 +165,9 @@ class NBAStatsBoxscoreHustleV2Parser:
 
                 # Combine into single row
                 row = (game_id,) + team_metadata + player_metadata + stats_values
-                data.append(list(row))
+                yield list(row)
 
-        return data
-
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """
         Get all datasets for this endpoint.
 
@@ -174,10 +178,14 @@ class NBAStatsBoxscoreHustleV2Parser:
         return {
             "PlayerStats": {
                 "headers": list(self.get_player_headers()),
-                "data": self.get_player_data(),
+                "data": self.iter_player_data(),
             },
             "TeamStats": {
                 "headers": list(self.get_team_headers()),
-                "data": self.get_team_data(),
+                "data": self.iter_team_data(),
             },
         }
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
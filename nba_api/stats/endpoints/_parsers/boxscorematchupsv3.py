@@ -1,5 +1,7 @@
 """Parser(s) for boxscorematchupsv3 endpoint."""
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsBoxscoreMatchupsParserV3:
     def __init__(self, nba_dict):
@@ -44,8 +46,10 @@ class NBAStatsBoxscoreMatchupsParserV3:
             return list(headers)
 
     def get_player_data(self):
+        return list(self.iter_player_data())
+
+    def iter_player_data(self):
         tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
-        pl_data = []
         for team in ["homeTeam", "awayTeam"]:
             team_info = [tmp["gameId"]] + [
                 value for key, value in tmp[team].items() if key != "players"
@@ -65,12 +69,15 @@ class NBAStatsBoxscoreMatchupsParserV3:
                     off_stats = list(
                         tmp[team]["players"][i]["matchups"][j]["statistics"].values()
                     )
-                    pl_data.append(team_info + def_data + off_data + off_stats)
-        return pl_data
+                    yield team_info + def_data + off_data + off_stats
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         results = {"PlayerStats": None}
         player_head = self.get_players_headers()
-        pl_data = self.get_player_data()
+        pl_data = self.iter_player_data()
         results["PlayerStats"] = {"headers": player_head, "data": pl_data}
         return results
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
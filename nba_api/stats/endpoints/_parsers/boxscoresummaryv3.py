@@ -1,5 +1,7 @@
 """Parser(s) for boxscoresummaryv3 endpoint."""
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsBoxscoreSummaryParserV3:
     """Parser for BoxScoreSummary v3 endpoint.
@@ -163,9 +165,12 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Two rows (home and away) with scores for each period.
                   Only includes periods 1-4; overtime periods are not included.
         """
+        return list(self.iter_line_score_data())
+
+    def iter_line_score_data(self):
+        """Yield the rows of get_line_score_data one at a time."""
         summary = self.nba_dict["boxScoreSummary"]
         game_id = summary.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = summary.get(team_key, {})
@@ -176,25 +181,21 @@ class NBAStatsBoxscoreSummaryParserV3:
                 if 1 <= period_num <= 4:
                     period_scores[period_num - 1] = period.get("score")
 
-            data.append(
-                [
-                    game_id,
-                    team.get("teamId"),
-                    team.get("teamCity"),
-                    team.get("teamName"),
-                    team.get("teamTricode"),
-                    team.get("teamSlug"),
-                    team.get("teamWins"),
-                    team.get("teamLosses"),
-                    period_scores[0],
-                    period_scores[1],
-                    period_scores[2],
-                    period_scores[3],
-                    team.get("score"),
-                ]
-            )
-
-        return data
+            yield [
+                game_id,
+                team.get("teamId"),
+                team.get("teamCity"),
+                team.get("teamName"),
+                team.get("teamTricode"),
+                team.get("teamSlug"),
+                team.get("teamWins"),
+                team.get("teamLosses"),
+                period_scores[0],
+                period_scores[1],
+                period_scores[2],
+                period_scores[3],
+                team.get("score"),
+            ]
 
     def get_inactive_players_headers(self):
         """Return column headers for the InactivePlayers dataset.
@@ -211,27 +212,26 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Rows for each inactive player from both teams. Returns empty
                   list if no inactive players or if inactives array is missing.
         """
+        return list(self.iter_inactive_players_data())
+
+    def iter_inactive_players_data(self):
+        """Yield the rows of get_inactive_players_data one at a time."""
         summary = self.nba_dict["boxScoreSummary"]
         game_id = summary.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = summary.get(team_key, {})
             team_id = team.get("teamId")
             inactives = team.get("inactives", [])
             for inactive in inactives:
-                data.append(
-                    [
-                        game_id,
-                        team_id,
-                        inactive.get("personId"),
-                        inactive.get("firstName"),
-                        inactive.get("familyName"),
-                        inactive.get("jerseyNum"),
-                    ]
-                )
-
-        return data
+                yield [
+                    game_id,
+                    team_id,
+                    inactive.get("personId"),
+                    inactive.get("firstName"),
+                    inactive.get("familyName"),
+                    inactive.get("jerseyNum"),
+                ]
 
     def get_last_five_meetings_headers(self):
         """Return column headers for the LastFiveMeetings dataset.
@@ -270,39 +270,38 @@ class NBAStatsBoxscoreSummaryParserV3:
                   ordered by recency. Returns empty list if lastFiveMeetings
                   is missing from the response.
         """
+        return list(self.iter_last_five_meetings_data())
+
+    def iter_last_five_meetings_data(self):
+        """Yield the rows of get_last_five_meetings_data one at a time."""
         summary = self.nba_dict["boxScoreSummary"]
         meetings = summary.get("lastFiveMeetings", {}).get("meetings", [])
-        data = []
 
         for meeting in meetings:
             away_team = meeting.get("awayTeam", {})
             home_team = meeting.get("homeTeam", {})
-            data.append(
-                [
-                    meeting.get("recencyOrder"),
-                    meeting.get("gameId"),
-                    meeting.get("gameTimeUTC"),
-                    meeting.get("gameEt"),
-                    meeting.get("gameStatus"),
-                    meeting.get("gameStatusText"),
-                    away_team.get("teamId"),
-                    away_team.get("teamCity"),
-                    away_team.get("teamName"),
-                    away_team.get("teamTricode"),
-                    away_team.get("score"),
-                    away_team.get("wins"),
-                    away_team.get("losses"),
-                    home_team.get("teamId"),
-                    home_team.get("teamCity"),
-                    home_team.get("teamName"),
-                    home_team.get("teamTricode"),
-                    home_team.get("score"),
-                    home_team.get("wins"),
-                    home_team.get("losses"),
-                ]
-            )
-
-        return data
+            yield [
+                meeting.get("recencyOrder"),
+                meeting.get("gameId"),
+                meeting.get("gameTimeUTC"),
+                meeting.get("gameEt"),
+                meeting.get("gameStatus"),
+                meeting.get("gameStatusText"),
+                away_team.get("teamId"),
+                away_team.get("teamCity"),
+                away_team.get("teamName"),
+                away_team.get("teamTricode"),
+                away_team.get("score"),
+                away_team.get("wins"),
+                away_team.get("losses"),
+                home_team.get("teamId"),
+                home_team.get("teamCity"),
+                home_team.get("teamName"),
+                home_team.get("teamTricode"),
+                home_team.get("score"),
+                home_team.get("wins"),
+                home_team.get("losses"),
+            ]
 
     def get_available_video_headers(self):
         """Return column headers for the AvailableVideo dataset.
@@ -410,48 +409,47 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Two rows (home and away) with comprehensive game statistics.
                   Returns rows with None values if postgameCharts is missing.
         """
+        return list(self.iter_other_stats_data())
+
+    def iter_other_stats_data(self):
+        """Yield the rows of get_other_stats_data one at a time."""
         summary = self.nba_dict["boxScoreSummary"]
         game_id = summary.get("gameId")
         postgame = summary.get("postgameCharts", {})
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = postgame.get(team_key, {})
             stats = team.get("statistics", {})
-            data.append(
-                [
-                    game_id,
-                    team.get("teamId"),
-                    team.get("teamCity"),
-                    team.get("teamName"),
-                    team.get("teamTricode"),
-                    stats.get("points"),
-                    stats.get("reboundsTotal"),
-                    stats.get("assists"),
-                    stats.get("steals"),
-                    stats.get("blocks"),
-                    stats.get("turnovers"),
-                    stats.get("fieldGoalsPercentage"),
-                    stats.get("threePointersPercentage"),
-                    stats.get("freeThrowsPercentage"),
-                    stats.get("pointsInThePaint"),
-                    stats.get("pointsSecondChance"),
-                    stats.get("pointsFastBreak"),
-                    stats.get("biggestLead"),
-                    stats.get("leadChanges"),
-                    stats.get("timesTied"),
-                    stats.get("biggestScoringRun"),
-                    stats.get("turnoversTeam"),
-                    stats.get("turnoversTotal"),
-                    stats.get("reboundsTeam"),
-                    stats.get("pointsFromTurnovers"),
-                    stats.get("benchPoints"),
-                ]
-            )
-
-        return data
+            yield [
+                game_id,
+                team.get("teamId"),
+                team.get("teamCity"),
+                team.get("teamName"),
+                team.get("teamTricode"),
+                stats.get("points"),
+                stats.get("reboundsTotal"),
+                stats.get("assists"),
+                stats.get("steals"),
+                stats.get("blocks"),
+                stats.get("turnovers"),
+                stats.get("fieldGoalsPercentage"),
+                stats.get("threePointersPercentage"),
+                stats.get("freeThrowsPercentage"),
+                stats.get("pointsInThePaint"),
+                stats.get("pointsSecondChance"),
+                stats.get("pointsFastBreak"),
+                stats.get("biggestLead"),
+                stats.get("leadChanges"),
+                stats.get("timesTied"),
+                stats.get("biggestScoringRun"),
+                stats.get("turnoversTeam"),
+                stats.get("turnoversTotal"),
+                stats.get("reboundsTeam"),
+                stats.get("pointsFromTurnovers"),
+                stats.get("benchPoints"),
+            ]
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """Compile all datasets for the BoxScoreSummary endpoint.
 
         Aggregates data from all getter methods into a dictionary of datasets,
@@ -478,39 +476,43 @@ class NBAStatsBoxscoreSummaryParserV3:
 
         results["GameSummary"] = {
             "headers": self.get_game_summary_headers(),
-            "data": self.get_game_summary_data(),
+            "data": iter(self.get_game_summary_data()),
         }
         results["GameInfo"] = {
             "headers": self.get_game_info_headers(),
-            "data": self.get_game_info_data(),
+            "data": iter(self.get_game_info_data()),
         }
         results["ArenaInfo"] = {
             "headers": self.get_arena_info_headers(),
-            "data": self.get_arena_info_data(),
+            "data": iter(self.get_arena_info_data()),
         }
         results["Officials"] = {
             "headers": self.get_officials_headers(),
-            "data": self.get_officials_data(),
+            "data": iter(self.get_officials_data()),
         }
         results["LineScore"] = {
             "headers": self.get_line_score_headers(),
-            "data": self.get_line_score_data(),
+            "data": self.iter_line_score_data(),
         }
         results["InactivePlayers"] = {
             "headers": self.get_inactive_players_headers(),
-            "data": self.get_inactive_players_data(),
+            "data": self.iter_inactive_players_data(),
         }
         results["LastFiveMeetings"] = {
             "headers": self.get_last_five_meetings_headers(),
-            "data": self.get_last_five_meetings_data(),
+            "data": self.iter_last_five_meetings_data(),
         }
         results["OtherStats"] = {
             "headers": self.get_other_stats_headers(),
-            "data": self.get_other_stats_data(),
+            "data": self.iter_other_stats_data(),
         }
         results["AvailableVideo"] = {
             "headers": self.get_available_video_headers(),
-            "data": self.get_available_video_data(),
+            "data": iter(self.get_available_video_data()),
         }
 
         return results
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
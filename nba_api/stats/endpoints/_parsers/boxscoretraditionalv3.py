@@ -15,6 +15,8 @@ Structure:
     }
 """
 
+from ._stream import materialize_data_sets
+
 # Common metadata fields
 TEAM_METADATA_FIELDS = (
     "teamId",
@@ -150,8 +152,11 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of two rows [home_team_data, away_team_data]
         """
+        return list(self.iter_team_data())
+
+    def iter_team_data(self):
+        """Yield the rows of get_team_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -165,9 +170,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
 
             # Combine: gameId + metadata + stats
             row = [game_id] + team_metadata + team_stats
-            data.append(row)
-
-        return data
+            yield row
 
     def get_player_data(self):
         """
@@ -176,8 +179,11 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of player data rows
         """
+        return list(self.iter_player_data())
+
+    def iter_player_data(self):
+        """Yield the rows of get_player_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -199,9 +205,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
 
                 # Combine: gameId + team_metadata + player_metadata + stats
                 row = [game_id] + team_metadata + player_metadata + player_stats
-                data.append(row)
-
-        return data
+                yield row
 
     def get_start_bench_data(self):
         """
@@ -210,8 +214,11 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of four rows [home_starters, home_bench, away_starters, away_bench]
         """
+        return list(self.iter_start_bench_data())
+
+    def iter_start_bench_data(self):
+        """Yield the rows of get_start_bench_data one at a time."""
         game_id = self.boxscore.get("gameId")
-        data = []
 
         for team_key in ["homeTeam", "awayTeam"]:
             team = self.boxscore.get(team_key, {})
@@ -230,7 +237,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
 
             # Combine: gameId + metadata + stats + "Starters" label
             starter_row = [game_id] + team_metadata + starter_stats + ["Starters"]
-            data.append(starter_row)
+            yield starter_row
 
             # Process bench
             bench = team.get("bench")
@@ -241,11 +248,9 @@ class NBAStatsBoxscoreTraditionalParserV3:
 
             # Combine: gameId + metadata + stats + "Bench" label
             bench_row = [game_id] + team_metadata + bench_stats + ["Bench"]
-            data.append(bench_row)
-
-        return data
+            yield bench_row
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """
         Return all datasets for this endpoint.
 
@@ -256,14 +261,18 @@ class NBAStatsBoxscoreTraditionalParserV3:
         return {
             "PlayerStats": {
                 "headers": self.get_player_headers(),
-                "data": self.get_player_data(),
+                "data": self.iter_player_data(),
             },
             "TeamStarterBenchStats": {
                 "headers": self.get_start_bench_headers(),
-                "data": self.get_start_bench_data(),
+                "data": self.iter_start_bench_data(),
             },
             "TeamStats": {
                 "headers": self.get_team_headers(),
-                "data": self.get_team_data(),
+                "data": self.iter_team_data(),
             },
         }
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
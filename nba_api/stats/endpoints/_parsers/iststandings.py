@@ -1,5 +1,7 @@
 """Parser(s) for iststandings endpoint."""
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsISTStandingsParser:
     def __init__(self, nba_dict):
@@ -20,7 +22,9 @@ class NBAStatsISTStandingsParser:
         return ["leagueId"] + ["seasonYear"] + team_header + game_header
 
     def get_iststandings_data(self):
-        teams_data = []
+        return list(self.iter_iststandings_data())
+
+    def iter_iststandings_data(self):
         for team in self.nba_dict["teams"]:
             team_value = []
             t_data = [value for key, value in team.items() if key != "games"]
@@ -31,12 +35,15 @@ class NBAStatsISTStandingsParser:
                     if key == "gameNumber":
                         continue
                     team_value.append(value)
-            teams_data.append(team_value)
-        return teams_data
+            yield team_value
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         results = {"Standings": None}
         iststandings_head = self.get_iststandings_headers()
-        iststandings_data = self.get_iststandings_data()
+        iststandings_data = self.iter_iststandings_data()
         results["Standings"] = {"headers": iststandings_head, "data": iststandings_data}
         return results
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
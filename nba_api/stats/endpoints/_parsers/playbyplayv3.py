@@ -4,6 +4,8 @@ This parser extracts play-by-play data from the NBA Stats API v3 format,
 which returns nested JSON with game actions and video availability.
 """
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsPlayByPlayParserV3:
     """Parser for PlayByPlayV3 endpoint.
@@ -61,10 +63,13 @@ class NBAStatsPlayByPlayParserV3:
             list: List of action rows, each starting with gameId followed by
                   all action fields in the order defined by headers.
         """
+        return list(self.iter_playbyplay_data())
+
+    def iter_playbyplay_data(self):
+        """Yield the rows of get_playbyplay_data one at a time."""
         game_id = self.game.get("gameId")
         actions = self.game.get("actions", [])
 
-        data = []
         for action in actions:
             row = [
                 game_id,
@@ -92,9 +97,7 @@ class NBAStatsPlayByPlayParserV3:
                 action.get("shotValue"),
                 action.get("actionId"),
             ]
-            data.append(row)
-
-        return data
+            yield row
 
     def get_videoavailable_headers(self):
         """Return column headers for the AvailableVideo dataset.
@@ -113,7 +116,7 @@ class NBAStatsPlayByPlayParserV3:
         video_available = self.game.get("videoAvailable", 0)
         return [[video_available]]
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """Return all datasets for this endpoint.
 
         Returns:
@@ -123,10 +126,14 @@ class NBAStatsPlayByPlayParserV3:
         return {
             "PlayByPlay": {
                 "headers": self.get_playbyplay_headers(),
-                "data": self.get_playbyplay_data(),
+                "data": self.iter_playbyplay_data(),
             },
             "AvailableVideo": {
                 "headers": self.get_videoavailable_headers(),
-                "data": self.get_videoavailable_data(),
+                "data": iter(self.get_videoavailable_data()),
             },
         }
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
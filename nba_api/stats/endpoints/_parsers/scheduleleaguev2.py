@@ -1,23 +1,29 @@
 """Parser(s) for scheduleleaguev2 endpoint."""
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsScheduleLeagueV2Parser:
     def __init__(self, nba_dict):
         self.nba_dict = nba_dict
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         results = {"SeasonGames": None, "SeasonWeeks": None}
 
         weeks_head = list(self.get_weeks_headers())
-        weeks_data = self.get_weeks_data()
+        weeks_data = iter(self.get_weeks_data())
         results["SeasonWeeks"] = {"headers": weeks_head, "data": weeks_data}
 
         games_head = list(self.get_games_headers())
-        games_data = self.get_games_data()
+        games_data = self.iter_games_data()
         results["SeasonGames"] = {"headers": games_head, "data": games_data}
 
         return results
 
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
+
     def get_weeks_headers(self):
         weeks = self.nba_dict[list(self.nba_dict.keys())[1]]["weeks"]
         if not weeks:
@@ -63,12 +69,14 @@ class NBAStatsScheduleLeagueV2Parser:
         return headers
 
     def get_games_data(self):
-        data = []
+        return list(self.iter_games_data())
+
+    def iter_games_data(self):
         tmp = self.nba_dict[list(self.nba_dict.keys())[1]]
         all_gameDates = tmp["gameDates"]
         for gameDate in all_gameDates:
             for game in gameDate["games"]:
-                data.append(
+                yield (
                     [
                         tmp["leagueId"],
                         tmp["seasonYear"],
@@ -76,7 +84,6 @@ class NBAStatsScheduleLeagueV2Parser:
                     ]
                     + self.get_game_data(game)
                 )
-        return data
 
     def get_game_data(self, game_dict):
         data = []
@@ -204,12 +211,12 @@ class NBAStatsScheduleLeagueV2IntParser(NBAStatsScheduleLeagueV2Parser):
     def __init__(self, nba_dict):
         super().__init__(nba_dict)
 
-    def get_data_sets(self):
-        results = super().get_data_sets()
+    def iter_data_sets(self):
+        results = super().iter_data_sets()
         results["BroadcasterList"] = None
 
         broadcaster_head = list(self.get_broadcaster_list_headers())
-        broadcaster_data = self.get_broadcaster_list_data()
+        broadcaster_data = iter(self.get_broadcaster_list_data())
         results["BroadcasterList"] = {
             "headers": broadcaster_head,
             "data": broadcaster_data,
@@ -1,5 +1,7 @@
 """Parser for scoreboardv3 endpoint."""
 
+from ._stream import materialize_data_sets
+
 
 class NBAStatsScoreboardV3Parser:
     """Parser for ScoreboardV3 endpoint data.
@@ -74,11 +76,14 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows, one for each game
         """
+        return list(self.iter_game_header_data())
+
+    def iter_game_header_data(self):
+        """Yield the rows of get_game_header_data one at a time."""
         games = self.scoreboard.get("games", [])
-        data = []
 
         for game in games:
-            data.append([
+            yield [
                 game.get("gameId"),
                 game.get("gameCode"),
                 game.get("gameStatus"),
@@ -97,9 +102,7 @@ class NBAStatsScoreboardV3Parser:
                 game.get("poRoundDesc"),
                 game.get("gameSubtype"),
                 game.get("isNeutral"),
-            ])
-
-        return data
+            ]
 
     def get_line_score_headers(self):
         """Get headers for line score information.
@@ -128,15 +131,18 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows with team scoring information
         """
+        return list(self.iter_line_score_data())
+
+    def iter_line_score_data(self):
+        """Yield the rows of get_line_score_data one at a time."""
         games = self.scoreboard.get("games", [])
-        data = []
 
         for game in games:
             game_id = game.get("gameId")
 
             # Home team
             home_team = game.get("homeTeam", {})
-            data.append([
+            yield [
                 game_id,
                 home_team.get("teamId"),
                 home_team.get("teamCity"),
@@ -149,11 +155,11 @@ class NBAStatsScoreboardV3Parser:
                 home_team.get("seed"),
                 home_team.get("inBonus"),
                 home_team.get("timeoutsRemaining"),
-            ])
+            ]
 
             # Away team
             away_team = game.get("awayTeam", {})
-            data.append([
+            yield [
                 game_id,
                 away_team.get("teamId"),
                 away_team.get("teamCity"),
@@ -166,9 +172,7 @@ class NBAStatsScoreboardV3Parser:
                 away_team.get("seed"),
                 away_team.get("inBonus"),
                 away_team.get("timeoutsRemaining"),
-            ])
-
-        return data
+            ]
 
     def get_game_leaders_headers(self):
         """Get headers for game leaders information.
@@ -197,8 +201,11 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows with game leader statistics
         """
+        return list(self.iter_game_leaders_data())
+
+    def iter_game_leaders_data(self):
+        """Yield the rows of get_game_leaders_data one at a time."""
         games = self.scoreboard.get("games", [])
-        data = []
 
         for game in games:
             game_id = game.get("gameId")
@@ -208,7 +215,7 @@ class NBAStatsScoreboardV3Parser:
             home_leader = game_leaders.get("homeLeaders", {})
             if home_leader:
                 home_team = game.get("homeTeam", {})
-                data.append([
+                yield [
                     game_id,
                     home_team.get("teamId"),
                     "home",
@@ -221,13 +228,13 @@ class NBAStatsScoreboardV3Parser:
                     home_leader.get("points"),
                     home_leader.get("rebounds"),
                     home_leader.get("assists"),
-                ])
+                ]
 
             # Away leader
             away_leader = game_leaders.get("awayLeaders", {})
             if away_leader:
                 away_team = game.get("awayTeam", {})
-                data.append([
+                yield [
                     game_id,
                     away_team.get("teamId"),
                     "away",
@@ -240,9 +247,7 @@ class NBAStatsScoreboardV3Parser:
                     away_leader.get("points"),
                     away_leader.get("rebounds"),
                     away_leader.get("assists"),
-                ])
-
-        return data
+                ]
 
     def get_team_leaders_headers(self):
         """Get headers for team leaders information.
@@ -272,8 +277,11 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows with team leader season averages
         """
+        return list(self.iter_team_leaders_data())
+
+    def iter_team_leaders_data(self):
+        """Yield the rows of get_team_leaders_data one at a time."""
         games = self.scoreboard.get("games", [])
-        data = []
 
         for game in games:
             game_id = game.get("gameId")
@@ -283,7 +291,7 @@ class NBAStatsScoreboardV3Parser:
             home_leader = team_leaders.get("homeLeaders", {})
             if home_leader:
                 home_team = game.get("homeTeam", {})
-                data.append([
+                yield [
                     game_id,
                     home_team.get("teamId"),
                     "home",
@@ -297,13 +305,13 @@ class NBAStatsScoreboardV3Parser:
                     home_leader.get("rebounds"),
                     home_leader.get("assists"),
                     team_leaders.get("seasonLeadersFlag"),
-                ])
+                ]
 
             # Away team leader
             away_leader = team_leaders.get("awayLeaders", {})
             if away_leader:
                 away_team = game.get("awayTeam", {})
-                data.append([
+                yield [
                     game_id,
                     away_team.get("teamId"),
                     "away",
@@ -317,9 +325,7 @@ class NBAStatsScoreboardV3Parser:
                     away_leader.get("rebounds"),
                     away_leader.get("assists"),
                     team_leaders.get("seasonLeadersFlag"),
-                ])
-
-        return data
+                ]
 
     def get_broadcasters_headers(self):
         """Get headers for broadcasters information.
@@ -342,8 +348,11 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows with broadcaster information
         """
+        return list(self.iter_broadcasters_data())
+
+    def iter_broadcasters_data(self):
+        """Yield the rows of get_broadcasters_data one at a time."""
         games = self.scoreboard.get("games", [])
-        data = []
 
         broadcaster_types = [
             ("nationalBroadcasters", "nationalTv"),
@@ -364,18 +373,16 @@ class NBAStatsScoreboardV3Parser:
             for api_field, broadcaster_type in broadcaster_types:
                 broadcaster_list = broadcasters.get(api_field, [])
                 for broadcaster in broadcaster_list:
-                    data.append([
+                    yield [
                         game_id,
                         broadcaster_type,
                         broadcaster.get("broadcasterId"),
                         broadcaster.get("broadcastDisplay"),
                         broadcaster.get("broadcasterTeamId"),
                         broadcaster.get("broadcasterDescription"),
-                    ])
-
-        return data
+                    ]
 
-    def get_data_sets(self):
+    def iter_data_sets(self):
         """Return all datasets for this endpoint.
 
         Returns:
@@ -384,26 +391,30 @@ class NBAStatsScoreboardV3Parser:
         return {
             "ScoreboardInfo": {
                 "headers": self.get_scoreboard_info_headers(),
-                "data": self.get_scoreboard_info_data(),
+                "data": iter(self.get_scoreboard_info_data()),
             },
             "GameHeader": {
                 "headers": self.get_game_header_headers(),
-                "data": self.get_game_header_data(),
+                "data": self.iter_game_header_data(),
             },
             "LineScore": {
                 "headers": self.get_line_score_headers(),
-                "data": self.get_line_score_data(),
+                "data": self.iter_line_score_data(),
             },
             "GameLeaders": {
                 "headers": self.get_game_leaders_headers(),
-                "data": self.get_game_leaders_data(),
+                "data": self.iter_game_leaders_data(),
             },
             "TeamLeaders": {
                 "headers": self.get_team_leaders_headers(),
-                "data": self.get_team_leaders_data(),
+                "data": self.iter_team_leaders_data(),
             },
             "Broadcasters": {
                 "headers": self.get_broadcasters_headers(),
-                "data": self.get_broadcasters_data(),
+                "data": self.iter_broadcasters_data(),
             },
         }
+
+    def get_data_sets(self):
+        """Same as iter_data_sets, with every "data" iterator read into a list."""
+        return materialize_data_sets(self.iter_data_sets())
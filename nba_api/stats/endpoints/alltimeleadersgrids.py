@@ -5,27 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, PerModeSimple, SeasonType
 
 class AllTimeLeadersGrids(Endpoint):
     endpoint = "alltimeleadersgrids"
-    expected_data = {
-        "ASTLeaders": ["PLAYER_ID", "PLAYER_NAME", "AST", "AST_RANK"],
-        "BLKLeaders": ["PLAYER_ID", "PLAYER_NAME", "BLK", "BLK_RANK"],
-        "DREBLeaders": ["PLAYER_ID", "PLAYER_NAME", "DREB", "DREB_RANK"],
-        "FG3ALeaders": ["PLAYER_ID", "PLAYER_NAME", "FG3A", "FG3A_RANK"],
-        "FG3MLeaders": ["PLAYER_ID", "PLAYER_NAME", "FG3M", "FG3M_RANK"],
-        "FG3_PCTLeaders": ["PLAYER_ID", "PLAYER_NAME", "FG3_PCT", "FG3_PCT_RANK"],
-        "FGALeaders": ["PLAYER_ID", "PLAYER_NAME", "FGA", "FGA_RANK"],
-        "FGMLeaders": ["PLAYER_ID", "PLAYER_NAME", "FGM", "FGM_RANK"],
-        "FG_PCTLeaders": ["PLAYER_ID", "PLAYER_NAME", "FG_PCT", "FG_PCT_RANK"],
-        "FTALeaders": ["PLAYER_ID", "PLAYER_NAME", "FTA", "FTA_RANK"],
-        "FTMLeaders": ["PLAYER_ID", "PLAYER_NAME", "FTM", "FTM_RANK"],
-        "FT_PCTLeaders": ["PLAYER_ID", "PLAYER_NAME", "FT_PCT", "FT_PCT_RANK"],
-        "GPLeaders": ["PLAYER_ID", "PLAYER_NAME", "GP", "GP_RANK"],
-        "OREBLeaders": ["PLAYER_ID", "PLAYER_NAME", "OREB", "OREB_RANK"],
-        "PFLeaders": ["PLAYER_ID", "PLAYER_NAME", "PF", "PF_RANK"],
-        "PTSLeaders": ["PLAYER_ID", "PLAYER_NAME", "PTS", "PTS_RANK"],
-        "REBLeaders": ["PLAYER_ID", "PLAYER_NAME", "REB", "REB_RANK"],
-        "STLLeaders": ["PLAYER_ID", "PLAYER_NAME", "STL", "STL_RANK"],
-        "TOVLeaders": ["PLAYER_ID", "PLAYER_NAME", "TOV", "TOV_RANK"],
-    }
 
     nba_response = None
     data_sets = None
@@ -70,7 +49,7 @@ class AllTimeLeadersGrids(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.ast_leaders = Endpoint.DataSet(data=data_sets["ASTLeaders"])
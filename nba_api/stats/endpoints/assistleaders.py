@@ -11,9 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class AssistLeaders(Endpoint):
     endpoint = "assistleaders"
-    expected_data = {
-        "AssistLeaders": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "AST"]
-    }
 
     nba_response = None
     data_sets = None
@@ -60,7 +57,7 @@ class AssistLeaders(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.assist_leaders = Endpoint.DataSet(data=data_sets["AssistLeaders"])
@@ -22,7 +22,6 @@ from nba_api.stats.library.parameters import (
 
 class AssistTracker(Endpoint):
     endpoint = "assisttracker"
-    expected_data = {"AssistTracker": ["ASSISTS"]}
 
     nba_response = None
     data_sets = None
@@ -115,7 +114,7 @@ class AssistTracker(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.assist_tracker = Endpoint.DataSet(data=data_sets["AssistTracker"])
@@ -11,72 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreAdvancedV2(Endpoint):
     endpoint = "boxscoreadvancedv2"
-    expected_data = {
-        "PlayerStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "E_OFF_RATING",
-            "OFF_RATING",
-            "E_DEF_RATING",
-            "DEF_RATING",
-            "E_NET_RATING",
-            "NET_RATING",
-            "AST_PCT",
-            "AST_TOV",
-            "AST_RATIO",
-            "OREB_PCT",
-            "DREB_PCT",
-            "REB_PCT",
-            "TM_TOV_PCT",
-            "EFG_PCT",
-            "TS_PCT",
-            "USG_PCT",
-            "E_USG_PCT",
-            "E_PACE",
-            "PACE",
-            "PACE_PER40",
-            "POSS",
-            "PIE",
-        ],
-        "TeamStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "E_OFF_RATING",
-            "OFF_RATING",
-            "E_DEF_RATING",
-            "DEF_RATING",
-            "E_NET_RATING",
-            "NET_RATING",
-            "AST_PCT",
-            "AST_TOV",
-            "AST_RATIO",
-            "OREB_PCT",
-            "DREB_PCT",
-            "REB_PCT",
-            "E_TM_TOV_PCT",
-            "TM_TOV_PCT",
-            "EFG_PCT",
-            "TS_PCT",
-            "USG_PCT",
-            "E_USG_PCT",
-            "E_PACE",
-            "PACE",
-            "PACE_PER40",
-            "POSS",
-            "PIE",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -125,7 +59,7 @@ class BoxScoreAdvancedV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
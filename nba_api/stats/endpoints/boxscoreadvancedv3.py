@@ -11,79 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreAdvancedV3(Endpoint):
     endpoint = "boxscoreadvancedv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "estimatedOffensiveRating",
-            "offensiveRating",
-            "estimatedDefensiveRating",
-            "defensiveRating",
-            "estimatedNetRating",
-            "netRating",
-            "assistPercentage",
-            "assistToTurnover",
-            "assistRatio",
-            "offensiveReboundPercentage",
-            "defensiveReboundPercentage",
-            "reboundPercentage",
-            "turnoverRatio",
-            "effectiveFieldGoalPercentage",
-            "trueShootingPercentage",
-            "usagePercentage",
-            "estimatedUsagePercentage",
-            "estimatedPace",
-            "pace",
-            "pacePer40",
-            "possessions",
-            "PIE",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "estimatedOffensiveRating",
-            "offensiveRating",
-            "estimatedDefensiveRating",
-            "defensiveRating",
-            "estimatedNetRating",
-            "netRating",
-            "assistPercentage",
-            "assistToTurnover",
-            "assistRatio",
-            "offensiveReboundPercentage",
-            "defensiveReboundPercentage",
-            "reboundPercentage",
-            "estimatedTeamTurnoverPercentage",
-            "turnoverRatio",
-            "effectiveFieldGoalPercentage",
-            "trueShootingPercentage",
-            "usagePercentage",
-            "estimatedUsagePercentage",
-            "estimatedPace",
-            "pace",
-            "pacePer40",
-            "possessions",
-            "PIE",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -132,7 +59,7 @@ class BoxScoreAdvancedV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
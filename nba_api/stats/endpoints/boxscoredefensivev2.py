@@ -4,48 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class BoxScoreDefensiveV2(Endpoint):
     endpoint = "boxscoredefensivev2"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "matchupMinutes",
-            "partialPossessions",
-            "switchesOn",
-            "playerPoints",
-            "defensiveRebounds",
-            "matchupAssists",
-            "matchupTurnovers",
-            "steals",
-            "blocks",
-            "matchupFieldGoalsMade",
-            "matchupFieldGoalsAttempted",
-            "matchupFieldGoalPercentage",
-            "matchupThreePointersMade",
-            "matchupThreePointersAttempted",
-            "matchupThreePointerPercentage",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -75,7 +33,7 @@ class BoxScoreDefensiveV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
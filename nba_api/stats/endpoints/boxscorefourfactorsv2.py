@@ -11,43 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreFourFactorsV2(Endpoint):
     endpoint = "boxscorefourfactorsv2"
-    expected_data = {
-        "sqlPlayersFourFactors": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "EFG_PCT",
-            "FTA_RATE",
-            "TM_TOV_PCT",
-            "OREB_PCT",
-            "OPP_EFG_PCT",
-            "OPP_FTA_RATE",
-            "OPP_TOV_PCT",
-            "OPP_OREB_PCT",
-        ],
-        "sqlTeamsFourFactors": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "EFG_PCT",
-            "FTA_RATE",
-            "TM_TOV_PCT",
-            "OREB_PCT",
-            "OPP_EFG_PCT",
-            "OPP_FTA_RATE",
-            "OPP_TOV_PCT",
-            "OPP_OREB_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -96,7 +59,7 @@ class BoxScoreFourFactorsV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.sql_players_four_factors = Endpoint.DataSet(
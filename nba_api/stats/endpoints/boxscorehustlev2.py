@@ -4,66 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class BoxScoreHustleV2(Endpoint):
     endpoint = "boxscorehustlev2"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "points",
-            "contestedShots",
-            "contestedShots2pt",
-            "contestedShots3pt",
-            "deflections",
-            "chargesDrawn",
-            "screenAssists",
-            "screenAssistPoints",
-            "looseBallsRecoveredOffensive",
-            "looseBallsRecoveredDefensive",
-            "looseBallsRecoveredTotal",
-            "offensiveBoxOuts",
-            "defensiveBoxOuts",
-            "boxOutPlayerTeamRebounds",
-            "boxOutPlayerRebounds",
-            "boxOuts",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "points",
-            "contestedShots",
-            "contestedShots2pt",
-            "contestedShots3pt",
-            "deflections",
-            "chargesDrawn",
-            "screenAssists",
-            "screenAssistPoints",
-            "looseBallsRecoveredOffensive",
-            "looseBallsRecoveredDefensive",
-            "looseBallsRecoveredTotal",
-            "offensiveBoxOuts",
-            "defensiveBoxOuts",
-            "boxOutPlayerTeamRebounds",
-            "boxOutPlayerRebounds",
-            "boxOuts",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -93,7 +33,7 @@ class BoxScoreHustleV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
@@ -4,56 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class BoxScoreMatchupsV3(Endpoint):
     endpoint = "boxscorematchupsv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personIdOff",
-            "firstNameOff",
-            "familyNameOff",
-            "nameIOff",
-            "playerSlugOff",
-            "jerseyNumOff",
-            "personIdDef",
-            "firstNameDef",
-            "familyNameDef",
-            "nameIDef",
-            "playerSlugDef",
-            "positionDef",
-            "commentDef",
-            "jerseyNumDef",
-            "matchupMinutes",
-            "matchupMinutesSort",
-            "partialPossessions",
-            "percentageDefenderTotalTime",
-            "percentageOffensiveTotalTime",
-            "percentageTotalTimeBothOn",
-            "switchesOn",
-            "playerPoints",
-            "teamPoints",
-            "matchupAssists",
-            "matchupPotentialAssists",
-            "matchupTurnovers",
-            "matchupBlocks",
-            "matchupFieldGoalsMade",
-            "matchupFieldGoalsAttempted",
-            "matchupFieldGoalsPercentage",
-            "matchupThreePointersMade",
-            "matchupThreePointersAttempted",
-            "matchupThreePointersPercentage",
-            "helpBlocks",
-            "helpFieldGoalsMade",
-            "helpFieldGoalsAttempted",
-            "helpFieldGoalsPercentage",
-            "matchupFreeThrowsMade",
-            "matchupFreeThrowsAttempted",
-            "shootingFouls",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -83,7 +33,7 @@ class BoxScoreMatchupsV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
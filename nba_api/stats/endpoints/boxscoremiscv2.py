@@ -11,51 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreMiscV2(Endpoint):
     endpoint = "boxscoremiscv2"
-    expected_data = {
-        "sqlPlayersMisc": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "PTS_OFF_TOV",
-            "PTS_2ND_CHANCE",
-            "PTS_FB",
-            "PTS_PAINT",
-            "OPP_PTS_OFF_TOV",
-            "OPP_PTS_2ND_CHANCE",
-            "OPP_PTS_FB",
-            "OPP_PTS_PAINT",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-        ],
-        "sqlTeamsMisc": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "PTS_OFF_TOV",
-            "PTS_2ND_CHANCE",
-            "PTS_FB",
-            "PTS_PAINT",
-            "OPP_PTS_OFF_TOV",
-            "OPP_PTS_2ND_CHANCE",
-            "OPP_PTS_FB",
-            "OPP_PTS_PAINT",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -104,7 +59,7 @@ class BoxScoreMiscV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.sql_players_misc = Endpoint.DataSet(data=data_sets["sqlPlayersMisc"])
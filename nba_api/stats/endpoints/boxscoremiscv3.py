@@ -11,58 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreMiscV3(Endpoint):
     endpoint = "boxscoremiscv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "pointsOffTurnovers",
-            "pointsSecondChance",
-            "pointsFastBreak",
-            "pointsPaint",
-            "oppPointsOffTurnovers",
-            "oppPointsSecondChance",
-            "oppPointsFastBreak",
-            "oppPointsPaint",
-            "blocks",
-            "blocksAgainst",
-            "foulsPersonal",
-            "foulsDrawn",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "pointsOffTurnovers",
-            "pointsSecondChance",
-            "pointsFastBreak",
-            "pointsPaint",
-            "oppPointsOffTurnovers",
-            "oppPointsSecondChance",
-            "oppPointsFastBreak",
-            "oppPointsPaint",
-            "blocks",
-            "blocksAgainst",
-            "foulsPersonal",
-            "foulsDrawn",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -111,7 +59,7 @@ class BoxScoreMiscV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
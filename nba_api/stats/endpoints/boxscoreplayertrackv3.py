@@ -4,73 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class BoxScorePlayerTrackV3(Endpoint):
     endpoint = "boxscoreplayertrackv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "speed",
-            "distance",
-            "reboundChancesOffensive",
-            "reboundChancesDefensive",
-            "reboundChancesTotal",
-            "touches",
-            "secondaryAssists",
-            "freeThrowAssists",
-            "passes",
-            "assists",
-            "contestedFieldGoalsMade",
-            "contestedFieldGoalsAttempted",
-            "contestedFieldGoalPercentage",
-            "uncontestedFieldGoalsMade",
-            "uncontestedFieldGoalsAttempted",
-            "uncontestedFieldGoalsPercentage",
-            "fieldGoalPercentage",
-            "defendedAtRimFieldGoalsMade",
-            "defendedAtRimFieldGoalsAttempted",
-            "defendedAtRimFieldGoalPercentage",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "distance",
-            "reboundChancesOffensive",
-            "reboundChancesDefensive",
-            "reboundChancesTotal",
-            "touches",
-            "secondaryAssists",
-            "freeThrowAssists",
-            "passes",
-            "assists",
-            "contestedFieldGoalsMade",
-            "contestedFieldGoalsAttempted",
-            "contestedFieldGoalPercentage",
-            "uncontestedFieldGoalsMade",
-            "uncontestedFieldGoalsAttempted",
-            "uncontestedFieldGoalsPercentage",
-            "fieldGoalPercentage",
-            "defendedAtRimFieldGoalsMade",
-            "defendedAtRimFieldGoalsAttempted",
-            "defendedAtRimFieldGoalPercentage",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -100,7 +33,7 @@ class BoxScorePlayerTrackV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
@@ -11,57 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreScoringV2(Endpoint):
     endpoint = "boxscorescoringv2"
-    expected_data = {
-        "sqlPlayersScoring": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "PCT_FGA_2PT",
-            "PCT_FGA_3PT",
-            "PCT_PTS_2PT",
-            "PCT_PTS_2PT_MR",
-            "PCT_PTS_3PT",
-            "PCT_PTS_FB",
-            "PCT_PTS_FT",
-            "PCT_PTS_OFF_TOV",
-            "PCT_PTS_PAINT",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-        ],
-        "sqlTeamsScoring": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "PCT_FGA_2PT",
-            "PCT_FGA_3PT",
-            "PCT_PTS_2PT",
-            "PCT_PTS_2PT_MR",
-            "PCT_PTS_3PT",
-            "PCT_PTS_FB",
-            "PCT_PTS_FT",
-            "PCT_PTS_OFF_TOV",
-            "PCT_PTS_PAINT",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -110,7 +59,7 @@ class BoxScoreScoringV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.sql_players_scoring = Endpoint.DataSet(data=data_sets["sqlPlayersScoring"])
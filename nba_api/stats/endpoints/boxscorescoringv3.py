@@ -11,64 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreScoringV3(Endpoint):
     endpoint = "boxscorescoringv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "percentageFieldGoalsAttempted2pt",
-            "percentageFieldGoalsAttempted3pt",
-            "percentagePoints2pt",
-            "percentagePointsMidrange2pt",
-            "percentagePoints3pt",
-            "percentagePointsFastBreak",
-            "percentagePointsFreeThrow",
-            "percentagePointsOffTurnovers",
-            "percentagePointsPaint",
-            "percentageAssisted2pt",
-            "percentageUnassisted2pt",
-            "percentageAssisted3pt",
-            "percentageUnassisted3pt",
-            "percentageAssistedFGM",
-            "percentageUnassistedFGM",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "percentageFieldGoalsAttempted2pt",
-            "percentageFieldGoalsAttempted3pt",
-            "percentagePoints2pt",
-            "percentagePointsMidrange2pt",
-            "percentagePoints3pt",
-            "percentagePointsFastBreak",
-            "percentagePointsFreeThrow",
-            "percentagePointsOffTurnovers",
-            "percentagePointsPaint",
-            "percentageAssisted2pt",
-            "percentageUnassisted2pt",
-            "percentageAssisted3pt",
-            "percentageUnassisted3pt",
-            "percentageAssistedFGM",
-            "percentageUnassistedFGM",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -117,7 +59,7 @@ class BoxScoreScoringV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
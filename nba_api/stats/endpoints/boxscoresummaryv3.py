@@ -13,7 +13,6 @@ Example:
 """
 
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.endpoints._expected_data.boxscoresummaryv3 import _EXPECTED_DATA
 from nba_api.stats.library.http import NBAStatsHTTP
 
 
@@ -68,7 +67,6 @@ class BoxScoreSummaryV3(Endpoint):
     """
 
     endpoint = "boxscoresummaryv3"
-    expected_data = _EXPECTED_DATA
 
     nba_response = None
     data_sets = None
@@ -142,7 +140,7 @@ class BoxScoreSummaryV3(Endpoint):
         """
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
@@ -40,92 +40,6 @@ class BoxScoreTraditionalV2(Endpoint):
         get_request (bool, optional): Whether to fetch data immediately. Defaults to True.
     """
     endpoint = "boxscoretraditionalv2"
-    expected_data = {
-        "PlayerStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TO",
-            "PF",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "TeamStarterBenchStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "STARTERS_BENCH",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TO",
-            "PF",
-            "PTS",
-        ],
-        "TeamStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TO",
-            "PF",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -181,7 +95,7 @@ class BoxScoreTraditionalV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
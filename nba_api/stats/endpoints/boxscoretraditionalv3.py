@@ -11,100 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreTraditionalV3(Endpoint):
     endpoint = "boxscoretraditionalv3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "fieldGoalsMade",
-            "fieldGoalsAttempted",
-            "fieldGoalsPercentage",
-            "threePointersMade",
-            "threePointersAttempted",
-            "threePointersPercentage",
-            "freeThrowsMade",
-            "freeThrowsAttempted",
-            "freeThrowsPercentage",
-            "reboundsOffensive",
-            "reboundsDefensive",
-            "reboundsTotal",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-            "foulsPersonal",
-            "points",
-            "plusMinusPoints",
-        ],
-        "TeamStarterBenchStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "fieldGoalsMade",
-            "fieldGoalsAttempted",
-            "fieldGoalsPercentage",
-            "threePointersMade",
-            "threePointersAttempted",
-            "threePointersPercentage",
-            "freeThrowsMade",
-            "freeThrowsAttempted",
-            "freeThrowsPercentage",
-            "reboundsOffensive",
-            "reboundsDefensive",
-            "reboundsTotal",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-            "foulsPersonal",
-            "points",
-            "startersBench",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "fieldGoalsMade",
-            "fieldGoalsAttempted",
-            "fieldGoalsPercentage",
-            "threePointersMade",
-            "threePointersAttempted",
-            "threePointersPercentage",
-            "freeThrowsMade",
-            "freeThrowsAttempted",
-            "freeThrowsPercentage",
-            "reboundsOffensive",
-            "reboundsDefensive",
-            "reboundsTotal",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-            "foulsPersonal",
-            "points",
-            "plusMinusPoints",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -153,7 +59,7 @@ class BoxScoreTraditionalV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
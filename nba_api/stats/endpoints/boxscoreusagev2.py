@@ -11,63 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreUsageV2(Endpoint):
     endpoint = "boxscoreusagev2"
-    expected_data = {
-        "sqlPlayersUsage": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MIN",
-            "USG_PCT",
-            "PCT_FGM",
-            "PCT_FGA",
-            "PCT_FG3M",
-            "PCT_FG3A",
-            "PCT_FTM",
-            "PCT_FTA",
-            "PCT_OREB",
-            "PCT_DREB",
-            "PCT_REB",
-            "PCT_AST",
-            "PCT_TOV",
-            "PCT_STL",
-            "PCT_BLK",
-            "PCT_BLKA",
-            "PCT_PF",
-            "PCT_PFD",
-            "PCT_PTS",
-        ],
-        "sqlTeamsUsage": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MIN",
-            "USG_PCT",
-            "PCT_FGM",
-            "PCT_FGA",
-            "PCT_FG3M",
-            "PCT_FG3A",
-            "PCT_FTM",
-            "PCT_FTA",
-            "PCT_OREB",
-            "PCT_DREB",
-            "PCT_REB",
-            "PCT_AST",
-            "PCT_TOV",
-            "PCT_STL",
-            "PCT_BLK",
-            "PCT_BLKA",
-            "PCT_PF",
-            "PCT_PFD",
-            "PCT_PTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -116,7 +59,7 @@ class BoxScoreUsageV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.sql_players_usage = Endpoint.DataSet(data=data_sets["sqlPlayersUsage"])
@@ -11,70 +11,6 @@ from nba_api.stats.library.parameters import (
 
 class BoxScoreUsageV3(Endpoint):
     endpoint = "boxscoreusagev3"
-    expected_data = {
-        "PlayerStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "personId",
-            "firstName",
-            "familyName",
-            "nameI",
-            "playerSlug",
-            "position",
-            "comment",
-            "jerseyNum",
-            "minutes",
-            "usagePercentage",
-            "percentageFieldGoalsMade",
-            "percentageFieldGoalsAttempted",
-            "percentageThreePointersMade",
-            "percentageThreePointersAttempted",
-            "percentageFreeThrowsMade",
-            "percentageFreeThrowsAttempted",
-            "percentageReboundsOffensive",
-            "percentageReboundsDefensive",
-            "percentageReboundsTotal",
-            "percentageAssists",
-            "percentageTurnovers",
-            "percentageSteals",
-            "percentageBlocks",
-            "percentageBlocksAllowed",
-            "percentagePersonalFouls",
-            "percentagePersonalFoulsDrawn",
-            "percentagePoints",
-        ],
-        "TeamStats": [
-            "gameId",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamTricode",
-            "teamSlug",
-            "minutes",
-            "usagePercentage",
-            "percentageFieldGoalsMade",
-            "percentageFieldGoalsAttempted",
-            "percentageThreePointersMade",
-            "percentageThreePointersAttempted",
-            "percentageFreeThrowsMade",
-            "percentageFreeThrowsAttempted",
-            "percentageReboundsOffensive",
-            "percentageReboundsDefensive",
-            "percentageReboundsTotal",
-            "percentageAssists",
-            "percentageTurnovers",
-            "percentageSteals",
-            "percentageBlocks",
-            "percentageBlocksAllowed",
-            "percentagePersonalFouls",
-            "percentagePersonalFoulsDrawn",
-            "percentagePoints",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -123,7 +59,7 @@ class BoxScoreUsageV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
@@ -5,26 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season
 
 class CommonAllPlayers(Endpoint):
     endpoint = "commonallplayers"
-    expected_data = {
-        "CommonAllPlayers": [
-            "PERSON_ID",
-            "DISPLAY_LAST_COMMA_FIRST",
-            "DISPLAY_FIRST_LAST",
-            "ROSTERSTATUS",
-            "FROM_YEAR",
-            "TO_YEAR",
-            "PLAYERCODE",
-            "PLAYER_SLUG",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CODE",
-            "TEAM_SLUG",
-            "GAMES_PLAYED_FLAG",
-            "OTHERLEAGUE_EXPERIENCE_CH",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -67,7 +47,7 @@ class CommonAllPlayers(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.common_all_players = Endpoint.DataSet(data=data_sets["CommonAllPlayers"])
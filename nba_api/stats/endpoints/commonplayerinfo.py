@@ -5,51 +5,6 @@ from nba_api.stats.library.parameters import LeagueIDNullable
 
 class CommonPlayerInfo(Endpoint):
     endpoint = "commonplayerinfo"
-    expected_data = {
-        "AvailableSeasons": ["SEASON_ID"],
-        "CommonPlayerInfo": [
-            "PERSON_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "DISPLAY_FIRST_LAST",
-            "DISPLAY_LAST_COMMA_FIRST",
-            "DISPLAY_FI_LAST",
-            "PLAYER_SLUG",
-            "BIRTHDATE",
-            "SCHOOL",
-            "COUNTRY",
-            "LAST_AFFILIATION",
-            "HEIGHT",
-            "WEIGHT",
-            "SEASON_EXP",
-            "JERSEY",
-            "POSITION",
-            "ROSTERSTATUS",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CODE",
-            "TEAM_CITY",
-            "PLAYERCODE",
-            "FROM_YEAR",
-            "TO_YEAR",
-            "DLEAGUE_FLAG",
-            "NBA_FLAG",
-            "GAMES_PLAYED_FLAG",
-            "DRAFT_YEAR",
-            "DRAFT_ROUND",
-            "DRAFT_NUMBER",
-        ],
-        "PlayerHeadlineStats": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TimeFrame",
-            "PTS",
-            "AST",
-            "REB",
-            "PIE",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -87,7 +42,7 @@ class CommonPlayerInfo(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
@@ -5,15 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season
 
 class CommonPlayoffSeries(Endpoint):
     endpoint = "commonplayoffseries"
-    expected_data = {
-        "PlayoffSeries": [
-            "GAME_ID",
-            "HOME_TEAM_ID",
-            "VISITOR_TEAM_ID",
-            "SERIES_ID",
-            "GAME_NUM",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -56,7 +47,7 @@ class CommonPlayoffSeries(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.playoff_series = Endpoint.DataSet(data=data_sets["PlayoffSeries"])
@@ -5,35 +5,6 @@ from nba_api.stats.library.parameters import Season, LeagueIDNullable
 
 class CommonTeamRoster(Endpoint):
     endpoint = "commonteamroster"
-    expected_data = {
-        "Coaches": [
-            "TEAM_ID",
-            "SEASON",
-            "COACH_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "COACH_NAME",
-            "IS_ASSISTANT",
-            "COACH_TYPE",
-            "SORT_SEQUENCE",
-        ],
-        "CommonTeamRoster": [
-            "TeamID",
-            "SEASON",
-            "LeagueID",
-            "PLAYER",
-            "PLAYER_SLUG",
-            "NUM",
-            "POSITION",
-            "HEIGHT",
-            "WEIGHT",
-            "BIRTH_DATE",
-            "AGE",
-            "EXP",
-            "SCHOOL",
-            "PLAYER_ID",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -76,7 +47,7 @@ class CommonTeamRoster(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         # Handle cases where Coaches dataset may not be present (#553)
@@ -5,9 +5,6 @@ from nba_api.stats.library.parameters import LeagueID
 
 class CommonTeamYears(Endpoint):
     endpoint = "commonteamyears"
-    expected_data = {
-        "TeamYears": ["LEAGUE_ID", "TEAM_ID", "MIN_YEAR", "MAX_YEAR", "ABBREVIATION"]
-    }
 
     nba_response = None
     data_sets = None
@@ -44,7 +41,7 @@ class CommonTeamYears(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_years = Endpoint.DataSet(data=data_sets["TeamYears"])
@@ -5,88 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season, SeasonTypeAllStar
 
 class CumeStatsPlayer(Endpoint):
     endpoint = "cumestatsplayer"
-    expected_data = {
-        "GameByGameStats": [
-            "DATE_EST",
-            "VISITOR_TEAM",
-            "HOME_TEAM",
-            "GP",
-            "GS",
-            "ACTUAL_MINUTES",
-            "ACTUAL_SECONDS",
-            "FG",
-            "FGA",
-            "FG_PCT",
-            "FG3",
-            "FG3A",
-            "FG3_PCT",
-            "FT",
-            "FTA",
-            "FT_PCT",
-            "OFF_REB",
-            "DEF_REB",
-            "TOT_REB",
-            "AVG_TOT_REB",
-            "AST",
-            "PF",
-            "DQ",
-            "STL",
-            "TURNOVERS",
-            "BLK",
-            "PTS",
-            "AVG_PTS",
-        ],
-        "TotalPlayerStats": [
-            "DISPLAY_FI_LAST",
-            "PERSON_ID",
-            "JERSEY_NUM",
-            "GP",
-            "GS",
-            "ACTUAL_MINUTES",
-            "ACTUAL_SECONDS",
-            "FG",
-            "FGA",
-            "FG_PCT",
-            "FG3",
-            "FG3A",
-            "FG3_PCT",
-            "FT",
-            "FTA",
-            "FT_PCT",
-            "OFF_REB",
-            "DEF_REB",
-            "TOT_REB",
-            "AST",
-            "PF",
-            "DQ",
-            "STL",
-            "TURNOVERS",
-            "BLK",
-            "PTS",
-            "MAX_ACTUAL_MINUTES",
-            "MAX_ACTUAL_SECONDS",
-            "MAX_REB",
-            "MAX_AST",
-            "MAX_STL",
-            "MAX_TURNOVERS",
-            "MAX_BLK",
-            "MAX_PTS",
-            "AVG_ACTUAL_MINUTES",
-            "AVG_ACTUAL_SECONDS",
-            "AVG_TOT_REB",
-            "AVG_AST",
-            "AVG_STL",
-            "AVG_TURNOVERS",
-            "AVG_BLK",
-            "AVG_PTS",
-            "PER_MIN_TOT_REB",
-            "PER_MIN_AST",
-            "PER_MIN_STL",
-            "PER_MIN_TURNOVERS",
-            "PER_MIN_BLK",
-            "PER_MIN_PTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -133,7 +51,7 @@ class CumeStatsPlayer(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.game_by_game_stats = Endpoint.DataSet(data=data_sets["GameByGameStats"])
@@ -13,7 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class CumeStatsPlayerGames(Endpoint):
     endpoint = "cumestatsplayergames"
-    expected_data = {"CumeStatsPlayerGames": ["MATCHUP", "GAME_ID"]}
 
     nba_response = None
     data_sets = None
@@ -68,7 +67,7 @@ class CumeStatsPlayerGames(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.cume_stats_player_games = Endpoint.DataSet(
@@ -13,7 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class CumeStatsTeamGames(Endpoint):
     endpoint = "cumestatsteamgames"
-    expected_data = {"CumeStatsTeamGames": ["MATCHUP", "GAME_ID"]}
 
     nba_response = None
     data_sets = None
@@ -70,7 +69,7 @@ class CumeStatsTeamGames(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.cume_stats_team_games = Endpoint.DataSet(
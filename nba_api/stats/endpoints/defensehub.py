@@ -12,60 +12,6 @@ from nba_api.stats.library.parameters import (
 
 class DefenseHub(Endpoint):
     endpoint = "defensehub"
-    expected_data = {
-        "DefenseHubStat1": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "DREB",
-        ],
-        "DefenseHubStat10": [],
-        "DefenseHubStat2": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "STL"],
-        "DefenseHubStat3": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "BLK"],
-        "DefenseHubStat4": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "TM_DEF_RATING",
-        ],
-        "DefenseHubStat5": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "OVERALL_PM",
-        ],
-        "DefenseHubStat6": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "THREEP_DFGPCT",
-        ],
-        "DefenseHubStat7": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "TWOP_DFGPCT",
-        ],
-        "DefenseHubStat8": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FIFETEENF_DFGPCT",
-        ],
-        "DefenseHubStat9": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "DEF_RIM_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -114,7 +60,7 @@ class DefenseHub(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.defense_hub_stat1 = Endpoint.DataSet(data=data_sets["DefenseHubStat1"])
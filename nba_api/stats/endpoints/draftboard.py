@@ -5,28 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYear
 
 class DraftBoard(Endpoint):
     endpoint = "draftboard"
-    expected_data = {
-        "DraftBoard": [
-            "PERSON_ID",
-            "PLAYER_NAME",
-            "SEASON",
-            "ROUND_NUMBER",
-            "ROUND_PICK",
-            "OVERALL_PICK",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "ORGANIZATION",
-            "ORGANIZATION_TYPE",
-            "HEIGHT",
-            "WEIGHT",
-            "POSITION",
-            "JERSEY_NUMBER",
-            "BIRTHDATE",
-            "AGE",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -79,7 +57,7 @@ class DraftBoard(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.draft_board = Endpoint.DataSet(data=data_sets["DraftBoard"])
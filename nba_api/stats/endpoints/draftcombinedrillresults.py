@@ -5,22 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYear
 
 class DraftCombineDrillResults(Endpoint):
     endpoint = "draftcombinedrillresults"
-    expected_data = {
-        "Results": [
-            "TEMP_PLAYER_ID",
-            "PLAYER_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "PLAYER_NAME",
-            "POSITION",
-            "STANDING_VERTICAL_LEAP",
-            "MAX_VERTICAL_LEAP",
-            "LANE_AGILITY_TIME",
-            "MODIFIED_LANE_AGILITY_TIME",
-            "THREE_QUARTER_SPRINT",
-            "BENCH_PRESS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -58,7 +42,7 @@ class DraftCombineDrillResults(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.results = Endpoint.DataSet(data=data_sets["Results"])
@@ -5,40 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYear
 
 class DraftCombineNonStationaryShooting(Endpoint):
     endpoint = "draftcombinenonstationaryshooting"
-    expected_data = {
-        "Results": [
-            "TEMP_PLAYER_ID",
-            "PLAYER_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "PLAYER_NAME",
-            "POSITION",
-            "OFF_DRIB_FIFTEEN_BREAK_LEFT_MADE",
-            "OFF_DRIB_FIFTEEN_BREAK_LEFT_ATTEMPT",
-            "OFF_DRIB_FIFTEEN_BREAK_LEFT_PCT",
-            "OFF_DRIB_FIFTEEN_TOP_KEY_MADE",
-            "OFF_DRIB_FIFTEEN_TOP_KEY_ATTEMPT",
-            "OFF_DRIB_FIFTEEN_TOP_KEY_PCT",
-            "OFF_DRIB_FIFTEEN_BREAK_RIGHT_MADE",
-            "OFF_DRIB_FIFTEEN_BREAK_RIGHT_ATTEMPT",
-            "OFF_DRIB_FIFTEEN_BREAK_RIGHT_PCT",
-            "OFF_DRIB_COLLEGE_BREAK_LEFT_MADE",
-            "OFF_DRIB_COLLEGE_BREAK_LEFT_ATTEMPT",
-            "OFF_DRIB_COLLEGE_BREAK_LEFT_PCT",
-            "OFF_DRIB_COLLEGE_TOP_KEY_MADE",
-            "OFF_DRIB_COLLEGE_TOP_KEY_ATTEMPT",
-            "OFF_DRIB_COLLEGE_TOP_KEY_PCT",
-            "OFF_DRIB_COLLEGE_BREAK_RIGHT_MADE",
-            "OFF_DRIB_COLLEGE_BREAK_RIGHT_ATTEMPT",
-            "OFF_DRIB_COLLEGE_BREAK_RIGHT_PCT",
-            "ON_MOVE_FIFTEEN_MADE",
-            "ON_MOVE_FIFTEEN_ATTEMPT",
-            "ON_MOVE_FIFTEEN_PCT",
-            "ON_MOVE_COLLEGE_MADE",
-            "ON_MOVE_COLLEGE_ATTEMPT",
-            "ON_MOVE_COLLEGE_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -76,7 +42,7 @@ class DraftCombineNonStationaryShooting(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.results = Endpoint.DataSet(data=data_sets["Results"])
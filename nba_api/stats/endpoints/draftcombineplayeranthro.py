@@ -5,28 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYear
 
 class DraftCombinePlayerAnthro(Endpoint):
     endpoint = "draftcombineplayeranthro"
-    expected_data = {
-        "Results": [
-            "TEMP_PLAYER_ID",
-            "PLAYER_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "PLAYER_NAME",
-            "POSITION",
-            "HEIGHT_WO_SHOES",
-            "HEIGHT_WO_SHOES_FT_IN",
-            "HEIGHT_W_SHOES",
-            "HEIGHT_W_SHOES_FT_IN",
-            "WEIGHT",
-            "WINGSPAN",
-            "WINGSPAN_FT_IN",
-            "STANDING_REACH",
-            "STANDING_REACH_FT_IN",
-            "BODY_FAT_PCT",
-            "HAND_LENGTH",
-            "HAND_WIDTH",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -64,7 +42,7 @@ class DraftCombinePlayerAnthro(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.results = Endpoint.DataSet(data=data_sets["Results"])
@@ -5,23 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYearNullable
 
 class DraftHistory(Endpoint):
     endpoint = "drafthistory"
-    expected_data = {
-        "DraftHistory": [
-            "PERSON_ID",
-            "PLAYER_NAME",
-            "SEASON",
-            "ROUND_NUMBER",
-            "ROUND_PICK",
-            "OVERALL_PICK",
-            "DRAFT_TYPE",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "ORGANIZATION",
-            "ORGANIZATION_TYPE",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -74,7 +57,7 @@ class DraftHistory(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.draft_history = Endpoint.DataSet(data=data_sets["DraftHistory"])
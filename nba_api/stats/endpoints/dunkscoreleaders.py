@@ -13,7 +13,6 @@ Example:
 """
 
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.endpoints._expected_data.dunkscoreleaders import _EXPECTED_DATA
 from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.library.parameters import LeagueIDNullable, Season, SeasonTypeAllStar
 
@@ -61,7 +60,6 @@ class DunkScoreLeaders(Endpoint):
     """
 
     endpoint = "dunkscoreleaders"
-    expected_data = _EXPECTED_DATA
 
     nba_response = None
     data_sets = None
@@ -142,7 +140,7 @@ class DunkScoreLeaders(Endpoint):
         """
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.dunks = Endpoint.DataSet(data=data_sets["Dunks"])
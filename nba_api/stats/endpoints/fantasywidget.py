@@ -18,30 +18,6 @@ from nba_api.stats.library.parameters import (
 
 class FantasyWidget(Endpoint):
     endpoint = "fantasywidget"
-    expected_data = {
-        "FantasyWidgetResult": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "PLAYER_POSITION",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "GP",
-            "MIN",
-            "FAN_DUEL_PTS",
-            "NBA_FANTASY_PTS",
-            "PTS",
-            "REB",
-            "AST",
-            "BLK",
-            "STL",
-            "TOV",
-            "FG3M",
-            "FGA",
-            "FG_PCT",
-            "FTA",
-            "FT_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -116,7 +92,7 @@ class FantasyWidget(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.fantasy_widget_result = Endpoint.DataSet(
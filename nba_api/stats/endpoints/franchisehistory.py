@@ -5,42 +5,6 @@ from nba_api.stats.library.parameters import LeagueID
 
 class FranchiseHistory(Endpoint):
     endpoint = "franchisehistory"
-    expected_data = {
-        "DefunctTeams": [
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "START_YEAR",
-            "END_YEAR",
-            "YEARS",
-            "GAMES",
-            "WINS",
-            "LOSSES",
-            "WIN_PCT",
-            "PO_APPEARANCES",
-            "DIV_TITLES",
-            "CONF_TITLES",
-            "LEAGUE_TITLES",
-        ],
-        "FranchiseHistory": [
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "START_YEAR",
-            "END_YEAR",
-            "YEARS",
-            "GAMES",
-            "WINS",
-            "LOSSES",
-            "WIN_PCT",
-            "PO_APPEARANCES",
-            "DIV_TITLES",
-            "CONF_TITLES",
-            "LEAGUE_TITLES",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -77,7 +41,7 @@ class FranchiseHistory(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.defunct_teams = Endpoint.DataSet(data=data_sets["DefunctTeams"])
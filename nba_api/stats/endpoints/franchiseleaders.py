@@ -5,26 +5,6 @@ from nba_api.stats.library.parameters import LeagueIDNullable
 
 class FranchiseLeaders(Endpoint):
     endpoint = "franchiseleaders"
-    expected_data = {
-        "FranchiseLeaders": [
-            "TEAM_ID",
-            "PTS",
-            "PTS_PERSON_ID",
-            "PTS_PLAYER",
-            "AST",
-            "AST_PERSON_ID",
-            "AST_PLAYER",
-            "REB",
-            "REB_PERSON_ID",
-            "REB_PLAYER",
-            "BLK",
-            "BLK_PERSON_ID",
-            "BLK_PLAYER",
-            "STL",
-            "STL_PERSON_ID",
-            "STL_PLAYER",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -62,7 +42,7 @@ class FranchiseLeaders(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.franchise_leaders = Endpoint.DataSet(data=data_sets["FranchiseLeaders"])
@@ -9,36 +9,6 @@ from nba_api.stats.library.parameters import (
 
 class FranchisePlayers(Endpoint):
     endpoint = "franchiseplayers"
-    expected_data = {
-        "FranchisePlayers": [
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM",
-            "PERSON_ID",
-            "PLAYER",
-            "SEASON_TYPE",
-            "ACTIVE_WITH_TEAM",
-            "GP",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "PF",
-            "STL",
-            "TOV",
-            "BLK",
-            "PTS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -83,7 +53,7 @@ class FranchisePlayers(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.franchise_players = Endpoint.DataSet(data=data_sets["FranchisePlayers"])
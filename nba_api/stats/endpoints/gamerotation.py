@@ -5,36 +5,6 @@ from nba_api.stats.library.parameters import LeagueID
 
 class GameRotation(Endpoint):
     endpoint = "gamerotation"
-    expected_data = {
-        "AwayTeam": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "PERSON_ID",
-            "PLAYER_FIRST",
-            "PLAYER_LAST",
-            "IN_TIME_REAL",
-            "OUT_TIME_REAL",
-            "PLAYER_PTS",
-            "PT_DIFF",
-            "USG_PCT",
-        ],
-        "HomeTeam": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "PERSON_ID",
-            "PLAYER_FIRST",
-            "PLAYER_LAST",
-            "IN_TIME_REAL",
-            "OUT_TIME_REAL",
-            "PLAYER_PTS",
-            "PT_DIFF",
-            "USG_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -72,7 +42,7 @@ class GameRotation(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.away_team = Endpoint.DataSet(data=data_sets["AwayTeam"])
@@ -5,14 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, SeasonYear, SeasonType
 
 class GLAlumBoxScoreSimilarityScore(Endpoint):
     endpoint = "glalumboxscoresimilarityscore"
-    expected_data = {
-        "GLeagueAlumBoxScoreSimilarityScores": [
-            "PERSON_2_ID",
-            "PERSON_2",
-            "TEAM_ID",
-            "SIMILARITY_SCORE",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -65,7 +57,7 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.g_league_alum_box_score_similarity_scores = Endpoint.DataSet(
@@ -13,39 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class HomePageLeaders(Endpoint):
     endpoint = "homepageleaders"
-    expected_data = {
-        "HomePageLeaders": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "PTS",
-            "FG_PCT",
-            "FG3_PCT",
-            "FT_PCT",
-            "EFG_PCT",
-            "TS_PCT",
-            "PTS_PER48",
-        ],
-        "LeagueAverage": [
-            "PTS",
-            "FG_PCT",
-            "FG3_PCT",
-            "FT_PCT",
-            "EFG_PCT",
-            "TS_PCT",
-            "PTS_PER48",
-        ],
-        "LeagueMax": [
-            "PTS",
-            "FG_PCT",
-            "FG3_PCT",
-            "FT_PCT",
-            "EFG_PCT",
-            "TS_PCT",
-            "PTS_PER48",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -96,7 +63,7 @@ class HomePageLeaders(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.home_page_leaders = Endpoint.DataSet(data=data_sets["HomePageLeaders"])
@@ -13,34 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class HomePageV2(Endpoint):
     endpoint = "homepagev2"
-    expected_data = {
-        "HomePageStat1": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "PTS"],
-        "HomePageStat2": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "REB"],
-        "HomePageStat3": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "AST"],
-        "HomePageStat4": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "STL"],
-        "HomePageStat5": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FG_PCT",
-        ],
-        "HomePageStat6": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FT_PCT",
-        ],
-        "HomePageStat7": [
-            "RANK",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FG3_PCT",
-        ],
-        "HomePageStat8": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "BLK"],
-    }
 
     nba_response = None
     data_sets = None
@@ -91,7 +63,7 @@ class HomePageV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.home_page_stat1 = Endpoint.DataSet(data=data_sets["HomePageStat1"])
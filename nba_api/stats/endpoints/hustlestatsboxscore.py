@@ -4,60 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class HustleStatsBoxScore(Endpoint):
     endpoint = "hustlestatsboxscore"
-    expected_data = {
-        "HustleStatsAvailable": ["GAME_ID", "HUSTLE_STATUS"],
-        "PlayerStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "START_POSITION",
-            "COMMENT",
-            "MINUTES",
-            "PTS",
-            "CONTESTED_SHOTS",
-            "CONTESTED_SHOTS_2PT",
-            "CONTESTED_SHOTS_3PT",
-            "DEFLECTIONS",
-            "CHARGES_DRAWN",
-            "SCREEN_ASSISTS",
-            "SCREEN_AST_PTS",
-            "OFF_LOOSE_BALLS_RECOVERED",
-            "DEF_LOOSE_BALLS_RECOVERED",
-            "LOOSE_BALLS_RECOVERED",
-            "OFF_BOXOUTS",
-            "DEF_BOXOUTS",
-            "BOX_OUT_PLAYER_TEAM_REBS",
-            "BOX_OUT_PLAYER_REBS",
-            "BOX_OUTS",
-        ],
-        "TeamStats": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY",
-            "MINUTES",
-            "PTS",
-            "CONTESTED_SHOTS",
-            "CONTESTED_SHOTS_2PT",
-            "CONTESTED_SHOTS_3PT",
-            "DEFLECTIONS",
-            "CHARGES_DRAWN",
-            "SCREEN_ASSISTS",
-            "SCREEN_AST_PTS",
-            "OFF_LOOSE_BALLS_RECOVERED",
-            "DEF_LOOSE_BALLS_RECOVERED",
-            "LOOSE_BALLS_RECOVERED",
-            "OFF_BOXOUTS",
-            "DEF_BOXOUTS",
-            "BOX_OUT_PLAYER_TEAM_REBS",
-            "BOX_OUT_PLAYER_REBS",
-            "BOX_OUTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -87,7 +33,7 @@ class HustleStatsBoxScore(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.hustle_stats_available = Endpoint.DataSet(
@@ -5,58 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season, Section
 
 class ISTStandings(Endpoint):
     endpoint = "iststandings"
-    expected_data = {
-        "Standings": [
-            "leagueId",
-            "seasonYear",
-            "teamId",
-            "teamCity",
-            "teamName",
-            "teamAbbreviation",
-            "teamSlug",
-            "conference",
-            "istGroup",
-            "clinchIndicator",
-            "clinchedIstKnockout",
-            "clinchedIstGroup",
-            "clinchedIstWildcard",
-            "istWildcardRank",
-            "istGroupRank",
-            "istKnockoutRank",
-            "wins",
-            "losses",
-            "pct",
-            "istGroupGb",
-            "istWildcardGb",
-            "diff",
-            "pts",
-            "oppPts",
-            "gameId1",
-            "opponentTeamAbbreviation1",
-            "location1",
-            "gameStatus1",
-            "gameStatusText1",
-            "outcome1",
-            "gameId2",
-            "opponentTeamAbbreviation2",
-            "location2",
-            "gameStatus2",
-            "gameStatusText2",
-            "outcome2",
-            "gameId3",
-            "opponentTeamAbbreviation3",
-            "location3",
-            "gameStatus3",
-            "gameStatusText3",
-            "outcome3",
-            "gameId4",
-            "opponentTeamAbbreviation4",
-            "location4",
-            "gameStatus4",
-            "gameStatusText4",
-            "outcome4",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -98,7 +46,7 @@ class ISTStandings(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.standings = Endpoint.DataSet(data=data_sets["Standings"])
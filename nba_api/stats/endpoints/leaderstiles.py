@@ -13,24 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class LeadersTiles(Endpoint):
     endpoint = "leaderstiles"
-    expected_data = {
-        "AllTimeSeasonHigh": [
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "SEASON_YEAR",
-            "PTS",
-        ],
-        "LastSeasonHigh": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "PTS"],
-        "LeadersTiles": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "PTS"],
-        "LowSeasonHigh": [
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "SEASON_YEAR",
-            "PTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -81,7 +63,7 @@ class LeadersTiles(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.all_time_season_high = Endpoint.DataSet(
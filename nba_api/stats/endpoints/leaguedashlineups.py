@@ -26,67 +26,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashLineups(Endpoint):
     endpoint = "leaguedashlineups"
-    expected_data = {
-        "Lineups": [
-            "GROUP_SET",
-            "GROUP_ID",
-            "GROUP_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "GP_RANK",
-            "W_RANK",
-            "L_RANK",
-            "W_PCT_RANK",
-            "MIN_RANK",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "FTM_RANK",
-            "FTA_RANK",
-            "FT_PCT_RANK",
-            "OREB_RANK",
-            "DREB_RANK",
-            "REB_RANK",
-            "AST_RANK",
-            "TOV_RANK",
-            "STL_RANK",
-            "BLK_RANK",
-            "BLKA_RANK",
-            "PF_RANK",
-            "PFD_RANK",
-            "PTS_RANK",
-            "PLUS_MINUS_RANK",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -175,7 +114,7 @@ class LeagueDashLineups(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.lineups = Endpoint.DataSet(data=data_sets["Lineups"])
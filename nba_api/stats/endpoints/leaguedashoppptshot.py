@@ -20,28 +20,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashOppPtShot(Endpoint):
     endpoint = "leaguedashoppptshot"
-    expected_data = {
-        "LeagueDashPTShots": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "GP",
-            "G",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -130,7 +108,7 @@ class LeagueDashOppPtShot(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_ptshots = Endpoint.DataSet(data=data_sets["LeagueDashPTShots"])
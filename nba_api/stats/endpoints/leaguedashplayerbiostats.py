@@ -25,33 +25,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashPlayerBioStats(Endpoint):
     endpoint = "leaguedashplayerbiostats"
-    expected_data = {
-        "LeagueDashPlayerBioStats": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "AGE",
-            "PLAYER_HEIGHT",
-            "PLAYER_HEIGHT_INCHES",
-            "PLAYER_WEIGHT",
-            "COLLEGE",
-            "COUNTRY",
-            "DRAFT_YEAR",
-            "DRAFT_ROUND",
-            "DRAFT_NUMBER",
-            "GP",
-            "PTS",
-            "REB",
-            "AST",
-            "NET_RATING",
-            "OREB_PCT",
-            "DREB_PCT",
-            "USG_PCT",
-            "TS_PCT",
-            "AST_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -150,7 +123,7 @@ class LeagueDashPlayerBioStats(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_player_bio_stats = Endpoint.DataSet(
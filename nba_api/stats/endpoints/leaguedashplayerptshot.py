@@ -23,30 +23,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashPlayerPtShot(Endpoint):
     endpoint = "leaguedashplayerptshot"
-    expected_data = {
-        "LeagueDashPTShots": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "PLAYER_LAST_TEAM_ID",
-            "PLAYER_LAST_TEAM_ABBREVIATION",
-            "AGE",
-            "GP",
-            "G",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -153,7 +129,7 @@ class LeagueDashPlayerPtShot(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_ptshots = Endpoint.DataSet(data=data_sets["LeagueDashPTShots"])
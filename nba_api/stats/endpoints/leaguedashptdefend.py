@@ -23,24 +23,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashPtDefend(Endpoint):
     endpoint = "leaguedashptdefend"
-    expected_data = {
-        "LeagueDashPTDefend": [
-            "CLOSE_DEF_PERSON_ID",
-            "PLAYER_NAME",
-            "PLAYER_LAST_TEAM_ID",
-            "PLAYER_LAST_TEAM_ABBREVIATION",
-            "PLAYER_POSITION",
-            "AGE",
-            "GP",
-            "G",
-            "FREQ",
-            "D_FGM",
-            "D_FGA",
-            "D_FG_PCT",
-            "NORMAL_FG_PCT",
-            "PCT_PLUSMINUS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -139,7 +121,7 @@ class LeagueDashPtDefend(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_p_tdefend = Endpoint.DataSet(
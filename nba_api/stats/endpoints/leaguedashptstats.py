@@ -24,24 +24,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashPtStats(Endpoint):
     endpoint = "leaguedashptstats"
-    expected_data = {
-        "LeagueDashPtStats": [
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "GP",
-            "W",
-            "L",
-            "MIN",
-            "DIST_FEET",
-            "DIST_MILES",
-            "DIST_MILES_OFF",
-            "DIST_MILES_DEF",
-            "AVG_SPEED",
-            "AVG_SPEED_OFF",
-            "AVG_SPEED_DEF",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -138,7 +120,7 @@ class LeagueDashPtStats(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_pt_stats = Endpoint.DataSet(
@@ -20,21 +20,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashPtTeamDefend(Endpoint):
     endpoint = "leaguedashptteamdefend"
-    expected_data = {
-        "LeagueDashPtTeamDefend": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "GP",
-            "G",
-            "FREQ",
-            "D_FGM",
-            "D_FGA",
-            "D_FG_PCT",
-            "NORMAL_FG_PCT",
-            "PCT_PLUSMINUS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -113,7 +98,7 @@ class LeagueDashPtTeamDefend(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_dash_pt_team_defend = Endpoint.DataSet(
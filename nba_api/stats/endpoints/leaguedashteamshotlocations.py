@@ -30,53 +30,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueDashTeamShotLocations(Endpoint):
     endpoint = "leaguedashteamshotlocations"
-    expected_data = {
-        "ShotLocations": [
-            {
-                "columnNames": [
-                    "Restricted Area",
-                    "In The Paint (Non-RA)",
-                    "Mid-Range",
-                    "Left Corner 3",
-                    "Right Corner 3",
-                    "Above the Break 3",
-                    "Backcourt",
-                ],
-                "columnSpan": 3,
-                "columnsToSkip": 2,
-                "name": "SHOT_CATEGORY",
-            },
-            {
-                "columnNames": [
-                    "TEAM_ID",
-                    "TEAM_NAME",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                    "FGM",
-                    "FGA",
-                    "FG_PCT",
-                ],
-                "columnSpan": 1,
-                "name": "columns",
-            },
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -173,7 +126,7 @@ class LeagueDashTeamShotLocations(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.shot_locations = Endpoint.DataSet(data=data_sets["ShotLocations"])
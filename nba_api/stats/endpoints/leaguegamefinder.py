@@ -67,38 +67,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueGameFinder(Endpoint):
     endpoint = "leaguegamefinder"
-    expected_data = {
-        "LeagueGameFinderResults": [
-            "SEASON_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "GAME_ID",
-            "GAME_DATE",
-            "MATCHUP",
-            "WL",
-            "MIN",
-            "PTS",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PLUS_MINUS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -322,7 +290,7 @@ class LeagueGameFinder(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_game_finder_results = Endpoint.DataSet(
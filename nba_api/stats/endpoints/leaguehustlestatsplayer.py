@@ -19,38 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueHustleStatsPlayer(Endpoint):
     endpoint = "leaguehustlestatsplayer"
-    expected_data = {
-        "HustleStatsPlayer": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "AGE",
-            "G",
-            "MIN",
-            "CONTESTED_SHOTS",
-            "CONTESTED_SHOTS_2PT",
-            "CONTESTED_SHOTS_3PT",
-            "DEFLECTIONS",
-            "CHARGES_DRAWN",
-            "SCREEN_ASSISTS",
-            "SCREEN_AST_PTS",
-            "OFF_LOOSE_BALLS_RECOVERED",
-            "DEF_LOOSE_BALLS_RECOVERED",
-            "LOOSE_BALLS_RECOVERED",
-            "PCT_LOOSE_BALLS_RECOVERED_OFF",
-            "PCT_LOOSE_BALLS_RECOVERED_DEF",
-            "OFF_BOXOUTS",
-            "DEF_BOXOUTS",
-            "BOX_OUT_PLAYER_TEAM_REBS",
-            "BOX_OUT_PLAYER_REBS",
-            "BOX_OUTS",
-            "PCT_BOX_OUTS_OFF",
-            "PCT_BOX_OUTS_DEF",
-            "PCT_BOX_OUTS_TEAM_REB",
-            "PCT_BOX_OUTS_REB",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -137,7 +105,7 @@ class LeagueHustleStatsPlayer(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.hustle_stats_player = Endpoint.DataSet(data=data_sets["HustleStatsPlayer"])
@@ -19,30 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueHustleStatsTeam(Endpoint):
     endpoint = "leaguehustlestatsteam"
-    expected_data = {
-        "HustleStatsTeam": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "MIN",
-            "CONTESTED_SHOTS",
-            "CONTESTED_SHOTS_2PT",
-            "CONTESTED_SHOTS_3PT",
-            "DEFLECTIONS",
-            "CHARGES_DRAWN",
-            "SCREEN_ASSISTS",
-            "SCREEN_AST_PTS",
-            "OFF_LOOSE_BALLS_RECOVERED",
-            "DEF_LOOSE_BALLS_RECOVERED",
-            "LOOSE_BALLS_RECOVERED",
-            "PCT_LOOSE_BALLS_RECOVERED_OFF",
-            "PCT_LOOSE_BALLS_RECOVERED_DEF",
-            "OFF_BOXOUTS",
-            "DEF_BOXOUTS",
-            "BOX_OUTS",
-            "PCT_BOX_OUTS_OFF",
-            "PCT_BOX_OUTS_DEF",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -129,7 +105,7 @@ class LeagueHustleStatsTeam(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.hustle_stats_team = Endpoint.DataSet(data=data_sets["HustleStatsTeam"])
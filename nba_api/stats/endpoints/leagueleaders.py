@@ -12,37 +12,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueLeaders(Endpoint):
     endpoint = "leagueleaders"
-    expected_data = {
-        "LeagueLeaders": [
-            "PLAYER_ID",
-            "RANK",
-            "PLAYER",
-            "TEAM",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-            "EFF",
-            "AST_TOV",
-            "STL_TOV",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -93,7 +62,7 @@ class LeagueLeaders(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_leaders = Endpoint.DataSet(data=data_sets["LeagueLeaders"])
@@ -26,34 +26,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueLineupViz(Endpoint):
     endpoint = "leaguelineupviz"
-    expected_data = {
-        "LeagueLineupViz": [
-            "GROUP_ID",
-            "GROUP_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "MIN",
-            "OFF_RATING",
-            "DEF_RATING",
-            "NET_RATING",
-            "PACE",
-            "TS_PCT",
-            "FTA_RATE",
-            "TM_AST_PCT",
-            "PCT_FGA_2PT",
-            "PCT_FGA_3PT",
-            "PCT_PTS_2PT_MR",
-            "PCT_PTS_FB",
-            "PCT_PTS_FT",
-            "PCT_PTS_PAINT",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "OPP_FG3_PCT",
-            "OPP_EFG_PCT",
-            "OPP_FTA_RATE",
-            "OPP_TOV_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -144,7 +116,7 @@ class LeagueLineupViz(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_lineup_viz = Endpoint.DataSet(data=data_sets["LeagueLineupViz"])
@@ -10,91 +10,6 @@ from nba_api.stats.library.parameters import (
 
 class LeagueStandings(Endpoint):
     endpoint = "leaguestandings"
-    expected_data = {
-        "Standings": [
-            "LeagueID",
-            "SeasonID",
-            "TeamID",
-            "TeamCity",
-            "TeamName",
-            "Conference",
-            "ConferenceRecord",
-            "PlayoffRank",
-            "ClinchIndicator",
-            "Division",
-            "DivisionRecord",
-            "DivisionRank",
-            "WINS",
-            "LOSSES",
-            "WinPCT",
-            "LeagueRank",
-            "Record",
-            "HOME",
-            "ROAD",
-            "L10",
-            "Last10Home",
-            "Last10Road",
-            "OT",
-            "ThreePTSOrLess",
-            "TenPTSOrMore",
-            "LongHomeStreak",
-            "strLongHomeStreak",
-            "LongRoadStreak",
-            "strLongRoadStreak",
-            "LongWinStreak",
-            "LongLossStreak",
-            "CurrentHomeStreak",
-            "strCurrentHomeStreak",
-            "CurrentRoadStreak",
-            "strCurrentRoadStreak",
-            "CurrentStreak",
-            "strCurrentStreak",
-            "ConferenceGamesBack",
-            "DivisionGamesBack",
-            "ClinchedConferenceTitle",
-            "ClinchedDivisionTitle",
-            "ClinchedPlayoffBirth",
-            "EliminatedConference",
-            "EliminatedDivision",
-            "AheadAtHalf",
-            "BehindAtHalf",
-            "TiedAtHalf",
-            "AheadAtThird",
-            "BehindAtThird",
-            "TiedAtThird",
-            "Score100PTS",
-            "OppScore100PTS",
-            "OppOver500",
-            "LeadInFGPCT",
-            "LeadInReb",
-            "FewerTurnovers",
-            "PointsPG",
-            "OppPointsPG",
-            "DiffPointsPG",
-            "vsEast",
-            "vsAtlantic",
-            "vsCentral",
-            "vsSoutheast",
-            "vsWest",
-            "vsNorthwest",
-            "vsPacific",
-            "vsSouthwest",
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-            "PreAS",
-            "PostAS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -139,7 +54,7 @@ class LeagueStandings(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.standings = Endpoint.DataSet(data=data_sets["Standings"])
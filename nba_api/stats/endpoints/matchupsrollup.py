@@ -5,32 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, PerModeSimple, Season, Se
 
 class MatchupsRollup(Endpoint):
     endpoint = "matchupsrollup"
-    expected_data = {
-        "MatchupsRollup": [
-            "SEASON_ID",
-            "POSITION",
-            "PERCENT_OF_TIME",
-            "DEF_PLAYER_ID",
-            "DEF_PLAYER_NAME",
-            "GP",
-            "MATCHUP_MIN",
-            "PARTIAL_POSS",
-            "PLAYER_PTS",
-            "TEAM_PTS",
-            "MATCHUP_AST",
-            "MATCHUP_TOV",
-            "MATCHUP_BLK",
-            "MATCHUP_FGM",
-            "MATCHUP_FGA",
-            "MATCHUP_FG_PCT",
-            "MATCHUP_FG3M",
-            "MATCHUP_FG3A",
-            "MATCHUP_FG3_PCT",
-            "MATCHUP_FTM",
-            "MATCHUP_FTA",
-            "SFL",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -83,7 +57,7 @@ class MatchupsRollup(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.matchups_rollup = Endpoint.DataSet(data=data_sets["MatchupsRollup"])
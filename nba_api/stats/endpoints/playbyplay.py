@@ -5,23 +5,6 @@ from nba_api.stats.library.parameters import EndPeriod, StartPeriod
 
 class PlayByPlay(Endpoint):
     endpoint = "playbyplay"
-    expected_data = {
-        "AvailableVideo": ["VIDEO_AVAILABLE_FLAG"],
-        "PlayByPlay": [
-            "GAME_ID",
-            "EVENTNUM",
-            "EVENTMSGTYPE",
-            "EVENTMSGACTIONTYPE",
-            "PERIOD",
-            "WCTIMESTRING",
-            "PCTIMESTRING",
-            "HOMEDESCRIPTION",
-            "NEUTRALDESCRIPTION",
-            "VISITORDESCRIPTION",
-            "SCORE",
-            "SCOREMARGIN",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -64,7 +47,7 @@ class PlayByPlay(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
@@ -5,45 +5,6 @@ from nba_api.stats.library.parameters import EndPeriod, StartPeriod
 
 class PlayByPlayV2(Endpoint):
     endpoint = "playbyplayv2"
-    expected_data = {
-        "AvailableVideo": ["VIDEO_AVAILABLE_FLAG"],
-        "PlayByPlay": [
-            "GAME_ID",
-            "EVENTNUM",
-            "EVENTMSGTYPE",
-            "EVENTMSGACTIONTYPE",
-            "PERIOD",
-            "WCTIMESTRING",
-            "PCTIMESTRING",
-            "HOMEDESCRIPTION",
-            "NEUTRALDESCRIPTION",
-            "VISITORDESCRIPTION",
-            "SCORE",
-            "SCOREMARGIN",
-            "PERSON1TYPE",
-            "PLAYER1_ID",
-            "PLAYER1_NAME",
-            "PLAYER1_TEAM_ID",
-            "PLAYER1_TEAM_CITY",
-            "PLAYER1_TEAM_NICKNAME",
-            "PLAYER1_TEAM_ABBREVIATION",
-            "PERSON2TYPE",
-            "PLAYER2_ID",
-            "PLAYER2_NAME",
-            "PLAYER2_TEAM_ID",
-            "PLAYER2_TEAM_CITY",
-            "PLAYER2_TEAM_NICKNAME",
-            "PLAYER2_TEAM_ABBREVIATION",
-            "PERSON3TYPE",
-            "PLAYER3_ID",
-            "PLAYER3_NAME",
-            "PLAYER3_TEAM_ID",
-            "PLAYER3_TEAM_CITY",
-            "PLAYER3_TEAM_NICKNAME",
-            "PLAYER3_TEAM_ABBREVIATION",
-            "VIDEO_AVAILABLE_FLAG",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -86,7 +47,7 @@ class PlayByPlayV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
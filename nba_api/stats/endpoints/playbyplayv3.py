@@ -5,34 +5,6 @@ from nba_api.stats.library.parameters import EndPeriod, StartPeriod
 
 class PlayByPlayV3(Endpoint):
     endpoint = "playbyplayv3"
-    expected_data = {
-        "AvailableVideo": ["videoAvailable"],
-        "PlayByPlay": [
-            "gameId",
-            "actionNumber",
-            "clock",
-            "period",
-            "teamId",
-            "teamTricode",
-            "personId",
-            "playerName",
-            "playerNameI",
-            "xLegacy",
-            "yLegacy",
-            "shotDistance",
-            "shotResult",
-            "isFieldGoal",
-            "scoreHome",
-            "scoreAway",
-            "pointsTotal",
-            "location",
-            "description",
-            "actionType",
-            "subType",
-            "videoAvailable",
-            "actionId",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -75,7 +47,7 @@ class PlayByPlayV3(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
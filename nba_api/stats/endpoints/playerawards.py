@@ -4,24 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class PlayerAwards(Endpoint):
     endpoint = "playerawards"
-    expected_data = {
-        "PlayerAwards": [
-            "PERSON_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "TEAM",
-            "DESCRIPTION",
-            "ALL_NBA_TEAM_NUMBER",
-            "SEASON",
-            "MONTH",
-            "WEEK",
-            "CONFERENCE",
-            "TYPE",
-            "SUBTYPE1",
-            "SUBTYPE2",
-            "SUBTYPE3",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -53,7 +35,7 @@ class PlayerAwards(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_awards = Endpoint.DataSet(data=data_sets["PlayerAwards"])
@@ -10,33 +10,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerCareerByCollege(Endpoint):
     endpoint = "playercareerbycollege"
-    expected_data = {
-        "PlayerCareerByCollege": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "COLLEGE",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -83,7 +56,7 @@ class PlayerCareerByCollege(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_career_by_college = Endpoint.DataSet(
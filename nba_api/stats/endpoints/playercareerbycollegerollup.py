@@ -10,112 +10,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerCareerByCollegeRollup(Endpoint):
     endpoint = "playercareerbycollegerollup"
-    expected_data = {
-        "East": [
-            "REGION",
-            "SEED",
-            "COLLEGE",
-            "PLAYERS",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "Midwest": [
-            "REGION",
-            "SEED",
-            "COLLEGE",
-            "PLAYERS",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "South": [
-            "REGION",
-            "SEED",
-            "COLLEGE",
-            "PLAYERS",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "West": [
-            "REGION",
-            "SEED",
-            "COLLEGE",
-            "PLAYERS",
-            "GP",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -160,7 +54,7 @@ class PlayerCareerByCollegeRollup(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.east = Endpoint.DataSet(data=data_sets["East"])
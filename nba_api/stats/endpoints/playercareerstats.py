@@ -5,286 +5,6 @@ from nba_api.stats.library.parameters import PerMode36, LeagueIDNullable
 
 class PlayerCareerStats(Endpoint):
     endpoint = "playercareerstats"
-    expected_data = {
-        "CareerTotalsAllStarSeason": [
-            "PLAYER_ID",
-            "LEAGUE_ID",
-            "Team_ID",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "CareerTotalsCollegeSeason": [
-            "PLAYER_ID",
-            "LEAGUE_ID",
-            "ORGANIZATION_ID",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "CareerTotalsPostSeason": [
-            "PLAYER_ID",
-            "LEAGUE_ID",
-            "Team_ID",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "CareerTotalsRegularSeason": [
-            "PLAYER_ID",
-            "LEAGUE_ID",
-            "Team_ID",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "SeasonRankingsPostSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "RANK_MIN",
-            "RANK_FGM",
-            "RANK_FGA",
-            "RANK_FG_PCT",
-            "RANK_FG3M",
-            "RANK_FG3A",
-            "RANK_FG3_PCT",
-            "RANK_FTM",
-            "RANK_FTA",
-            "RANK_FT_PCT",
-            "RANK_OREB",
-            "RANK_DREB",
-            "RANK_REB",
-            "RANK_AST",
-            "RANK_STL",
-            "RANK_BLK",
-            "RANK_TOV",
-            "RANK_PTS",
-            "RANK_EFF",
-        ],
-        "SeasonRankingsRegularSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "RANK_MIN",
-            "RANK_FGM",
-            "RANK_FGA",
-            "RANK_FG_PCT",
-            "RANK_FG3M",
-            "RANK_FG3A",
-            "RANK_FG3_PCT",
-            "RANK_FTM",
-            "RANK_FTA",
-            "RANK_FT_PCT",
-            "RANK_OREB",
-            "RANK_DREB",
-            "RANK_REB",
-            "RANK_AST",
-            "RANK_STL",
-            "RANK_BLK",
-            "RANK_TOV",
-            "RANK_PTS",
-            "RANK_EFF",
-        ],
-        "SeasonTotalsAllStarSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "SeasonTotalsCollegeSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "ORGANIZATION_ID",
-            "SCHOOL_NAME",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "SeasonTotalsPostSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-        "SeasonTotalsRegularSeason": [
-            "PLAYER_ID",
-            "SEASON_ID",
-            "LEAGUE_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PLAYER_AGE",
-            "GP",
-            "GS",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -327,7 +47,7 @@ class PlayerCareerStats(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.career_totals_all_star_season = Endpoint.DataSet(
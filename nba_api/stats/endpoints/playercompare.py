@@ -25,60 +25,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerCompare(Endpoint):
     endpoint = "playercompare"
-    expected_data = {
-        "Individual": [
-            "GROUP_SET",
-            "DESCRIPTION",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "OverallCompare": [
-            "GROUP_SET",
-            "DESCRIPTION",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -165,7 +111,7 @@ class PlayerCompare(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.individual = Endpoint.DataSet(data=data_sets["Individual"])
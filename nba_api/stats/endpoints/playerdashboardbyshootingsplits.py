@@ -24,267 +24,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerDashboardByShootingSplits(Endpoint):
     endpoint = "playerdashboardbyshootingsplits"
-    expected_data = {
-        "AssistedBy": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "AssitedShotPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "OverallPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "Shot5FTPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "Shot8FTPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotTypePlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "EFG_PCT_RANK",
-            "BLKA_RANK",
-            "PCT_AST_2PM_RANK",
-            "PCT_UAST_2PM_RANK",
-            "PCT_AST_3PM_RANK",
-            "PCT_UAST_3PM_RANK",
-            "PCT_AST_FGM_RANK",
-            "PCT_UAST_FGM_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotTypeSummaryPlayerDashboard": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "EFG_PCT",
-            "BLKA",
-            "PCT_AST_2PM",
-            "PCT_UAST_2PM",
-            "PCT_AST_3PM",
-            "PCT_UAST_3PM",
-            "PCT_AST_FGM",
-            "PCT_UAST_FGM",
-            "CFID",
-            "CFPARAMS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -367,7 +106,7 @@ class PlayerDashboardByShootingSplits(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.assisted_by = Endpoint.DataSet(data=data_sets["AssistedBy"])
@@ -17,54 +17,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerDashPtPass(Endpoint):
     endpoint = "playerdashptpass"
-    expected_data = {
-        "PassesMade": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "TEAM_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PASS_TYPE",
-            "G",
-            "PASS_TO",
-            "PASS_TEAMMATE_PLAYER_ID",
-            "FREQUENCY",
-            "PASS",
-            "AST",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "PassesReceived": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "TEAM_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "PASS_TYPE",
-            "G",
-            "PASS_FROM",
-            "PASS_TEAMMATE_PLAYER_ID",
-            "FREQUENCY",
-            "PASS",
-            "AST",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -133,7 +85,7 @@ class PlayerDashPtPass(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.passes_made = Endpoint.DataSet(data=data_sets["PassesMade"])
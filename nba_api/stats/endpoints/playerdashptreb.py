@@ -19,102 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerDashPtReb(Endpoint):
     endpoint = "playerdashptreb"
-    expected_data = {
-        "NumContestedRebounding": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "G",
-            "REB_NUM_CONTESTING_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "OverallRebounding": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "G",
-            "OVERALL",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "RebDistanceRebounding": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "G",
-            "REB_DIST_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "ShotDistanceRebounding": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "G",
-            "SHOT_DIST_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "ShotTypeRebounding": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "G",
-            "SHOT_TYPE_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -187,7 +91,7 @@ class PlayerDashPtReb(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.num_contested_rebounding = Endpoint.DataSet(
@@ -19,20 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerDashPtShotDefend(Endpoint):
     endpoint = "playerdashptshotdefend"
-    expected_data = {
-        "DefendingShots": [
-            "CLOSE_DEF_PERSON_ID",
-            "GP",
-            "G",
-            "DEFENSE_CATEGORY",
-            "FREQ",
-            "D_FGM",
-            "D_FGA",
-            "D_FG_PCT",
-            "NORMAL_FG_PCT",
-            "PCT_PLUSMINUS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -105,7 +91,7 @@ class PlayerDashPtShotDefend(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.defending_shots = Endpoint.DataSet(data=data_sets["DefendingShots"])
@@ -19,155 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerDashPtShots(Endpoint):
     endpoint = "playerdashptshots"
-    expected_data = {
-        "ClosestDefender10ftPlusShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "CLOSE_DEF_DIST_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "ClosestDefenderShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "CLOSE_DEF_DIST_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "DribbleShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "DRIBBLE_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "GeneralShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "SHOT_TYPE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "Overall": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "SHOT_TYPE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "ShotClockShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "SHOT_CLOCK_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "TouchTimeShooting": [
-            "PLAYER_ID",
-            "PLAYER_NAME_LAST_FIRST",
-            "SORT_ORDER",
-            "GP",
-            "G",
-            "TOUCH_TIME_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -240,7 +91,7 @@ class PlayerDashPtShots(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.closest_defender10ft_plus_shooting = Endpoint.DataSet(
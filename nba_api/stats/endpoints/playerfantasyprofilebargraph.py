@@ -9,42 +9,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerFantasyProfileBarGraph(Endpoint):
     endpoint = "playerfantasyprofilebargraph"
-    expected_data = {
-        "LastFiveGamesAvg": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "FAN_DUEL_PTS",
-            "NBA_FANTASY_PTS",
-            "PTS",
-            "REB",
-            "AST",
-            "FG3M",
-            "FT_PCT",
-            "STL",
-            "BLK",
-            "TOV",
-            "FG_PCT",
-        ],
-        "SeasonAvg": [
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "FAN_DUEL_PTS",
-            "NBA_FANTASY_PTS",
-            "PTS",
-            "REB",
-            "AST",
-            "FG3M",
-            "FT_PCT",
-            "STL",
-            "BLK",
-            "TOV",
-            "FG_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -89,7 +53,7 @@ class PlayerFantasyProfileBarGraph(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.last_five_games_avg = Endpoint.DataSet(data=data_sets["LastFiveGamesAvg"])
@@ -5,37 +5,6 @@ from nba_api.stats.library.parameters import Season, SeasonTypeAllStar, LeagueID
 
 class PlayerGameLog(Endpoint):
     endpoint = "playergamelog"
-    expected_data = {
-        "PlayerGameLog": [
-            "SEASON_ID",
-            "Player_ID",
-            "Game_ID",
-            "GAME_DATE",
-            "MATCHUP",
-            "WL",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-            "PLUS_MINUS",
-            "VIDEO_AVAILABLE",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -84,7 +53,7 @@ class PlayerGameLog(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_game_log = Endpoint.DataSet(data=data_sets["PlayerGameLog"])
@@ -16,19 +16,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerGameStreakFinder(Endpoint):
     endpoint = "playergamestreakfinder"
-    expected_data = {
-        "PlayerGameStreakFinderResults": [
-            "PLAYER_NAME_LAST_FIRST",
-            "PLAYER_ID",
-            "GAMESTREAK",
-            "STARTDATE",
-            "ENDDATE",
-            "ACTIVESTREAK",
-            "NUMSEASONS",
-            "LASTSEASON",
-            "FIRSTSEASON",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -243,7 +230,7 @@ class PlayerGameStreakFinder(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_game_streak_finder_results = Endpoint.DataSet(
@@ -12,36 +12,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerIndex(Endpoint):
     endpoint = "playerindex"
-    expected_data = {
-        "PlayerIndex": [
-            "PERSON_ID",
-            "PLAYER_LAST_NAME",
-            "PLAYER_FIRST_NAME",
-            "PLAYER_SLUG",
-            "TEAM_ID",
-            "TEAM_SLUG",
-            "IS_DEFUNCT",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "JERSEY_NUMBER",
-            "POSITION",
-            "HEIGHT",
-            "WEIGHT",
-            "COLLEGE",
-            "COUNTRY",
-            "DRAFT_YEAR",
-            "DRAFT_ROUND",
-            "DRAFT_NUMBER",
-            "ROSTER_STATUS",
-            "PTS",
-            "REB",
-            "AST",
-            "STATS_TIMEFRAME",
-            "FROM_YEAR",
-            "TO_YEAR",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -104,7 +74,7 @@ class PlayerIndex(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.player_index = Endpoint.DataSet(data=data_sets["PlayerIndex"])
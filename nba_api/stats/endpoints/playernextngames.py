@@ -10,23 +10,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerNextNGames(Endpoint):
     endpoint = "playernextngames"
-    expected_data = {
-        "NextNGames": [
-            "GAME_ID",
-            "GAME_DATE",
-            "HOME_TEAM_ID",
-            "VISITOR_TEAM_ID",
-            "HOME_TEAM_NAME",
-            "VISITOR_TEAM_NAME",
-            "HOME_TEAM_ABBREVIATION",
-            "VISITOR_TEAM_ABBREVIATION",
-            "HOME_TEAM_NICKNAME",
-            "VISITOR_TEAM_NICKNAME",
-            "GAME_TIME",
-            "HOME_WL",
-            "VISITOR_WL",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -73,7 +56,7 @@ class PlayerNextNGames(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.next_n_games = Endpoint.DataSet(data=data_sets["NextNGames"])
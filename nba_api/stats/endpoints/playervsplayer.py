@@ -23,182 +23,6 @@ from nba_api.stats.library.parameters import (
 
 class PlayerVsPlayer(Endpoint):
     endpoint = "playervsplayer"
-    expected_data = {
-        "OnOffCourt": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "NBA_FANTASY_PTS",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "Overall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "NBA_FANTASY_PTS",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "PlayerInfo": [
-            "PERSON_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "DISPLAY_FIRST_LAST",
-            "DISPLAY_LAST_COMMA_FIRST",
-            "DISPLAY_FI_LAST",
-            "BIRTHDATE",
-            "SCHOOL",
-            "COUNTRY",
-            "LAST_AFFILIATION",
-        ],
-        "ShotAreaOffCourt": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaOnCourt": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaOverall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOffCourt": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOnCourt": [
-            "GROUP_SET",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOverall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "VsPlayerInfo": [
-            "PERSON_ID",
-            "FIRST_NAME",
-            "LAST_NAME",
-            "DISPLAY_FIRST_LAST",
-            "DISPLAY_LAST_COMMA_FIRST",
-            "DISPLAY_FI_LAST",
-            "BIRTHDATE",
-            "SCHOOL",
-            "COUNTRY",
-            "LAST_AFFILIATION",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -279,7 +103,7 @@ class PlayerVsPlayer(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
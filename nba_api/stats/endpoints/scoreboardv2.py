@@ -5,130 +5,6 @@ from nba_api.stats.library.parameters import DayOffset, GameDate, LeagueID
 
 class ScoreboardV2(Endpoint):
     endpoint = "scoreboardv2"
-    expected_data = {
-        "Available": ["GAME_ID", "PT_AVAILABLE"],
-        "EastConfStandingsByDay": [
-            "TEAM_ID",
-            "LEAGUE_ID",
-            "SEASON_ID",
-            "STANDINGSDATE",
-            "CONFERENCE",
-            "TEAM",
-            "G",
-            "W",
-            "L",
-            "W_PCT",
-            "HOME_RECORD",
-            "ROAD_RECORD",
-            "RETURNTOPLAY",
-        ],
-        "GameHeader": [
-            "GAME_DATE_EST",
-            "GAME_SEQUENCE",
-            "GAME_ID",
-            "GAME_STATUS_ID",
-            "GAME_STATUS_TEXT",
-            "GAMECODE",
-            "HOME_TEAM_ID",
-            "VISITOR_TEAM_ID",
-            "SEASON",
-            "LIVE_PERIOD",
-            "LIVE_PC_TIME",
-            "NATL_TV_BROADCASTER_ABBREVIATION",
-            "HOME_TV_BROADCASTER_ABBREVIATION",
-            "AWAY_TV_BROADCASTER_ABBREVIATION",
-            "LIVE_PERIOD_TIME_BCAST",
-            "ARENA_NAME",
-            "WH_STATUS",
-        ],
-        "LastMeeting": [
-            "GAME_ID",
-            "LAST_GAME_ID",
-            "LAST_GAME_DATE_EST",
-            "LAST_GAME_HOME_TEAM_ID",
-            "LAST_GAME_HOME_TEAM_CITY",
-            "LAST_GAME_HOME_TEAM_NAME",
-            "LAST_GAME_HOME_TEAM_ABBREVIATION",
-            "LAST_GAME_HOME_TEAM_POINTS",
-            "LAST_GAME_VISITOR_TEAM_ID",
-            "LAST_GAME_VISITOR_TEAM_CITY",
-            "LAST_GAME_VISITOR_TEAM_NAME",
-            "LAST_GAME_VISITOR_TEAM_CITY1",
-            "LAST_GAME_VISITOR_TEAM_POINTS",
-        ],
-        "LineScore": [
-            "GAME_DATE_EST",
-            "GAME_SEQUENCE",
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_CITY_NAME",
-            "TEAM_NAME",
-            "TEAM_WINS_LOSSES",
-            "PTS_QTR1",
-            "PTS_QTR2",
-            "PTS_QTR3",
-            "PTS_QTR4",
-            "PTS_OT1",
-            "PTS_OT2",
-            "PTS_OT3",
-            "PTS_OT4",
-            "PTS_OT5",
-            "PTS_OT6",
-            "PTS_OT7",
-            "PTS_OT8",
-            "PTS_OT9",
-            "PTS_OT10",
-            "PTS",
-            "FG_PCT",
-            "FT_PCT",
-            "FG3_PCT",
-            "AST",
-            "REB",
-            "TOV",
-        ],
-        "SeriesStandings": [
-            "GAME_ID",
-            "HOME_TEAM_ID",
-            "VISITOR_TEAM_ID",
-            "GAME_DATE_EST",
-            "HOME_TEAM_WINS",
-            "HOME_TEAM_LOSSES",
-            "SERIES_LEADER",
-        ],
-        "TeamLeaders": [
-            "GAME_ID",
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NICKNAME",
-            "TEAM_ABBREVIATION",
-            "PTS_PLAYER_ID",
-            "PTS_PLAYER_NAME",
-            "PTS",
-            "REB_PLAYER_ID",
-            "REB_PLAYER_NAME",
-            "REB",
-            "AST_PLAYER_ID",
-            "AST_PLAYER_NAME",
-            "AST",
-        ],
-        "TicketLinks": ["GAME_ID", "LEAG_TIX"],
-        "WestConfStandingsByDay": [
-            "TEAM_ID",
-            "LEAGUE_ID",
-            "SEASON_ID",
-            "STANDINGSDATE",
-            "CONFERENCE",
-            "TEAM",
-            "G",
-            "W",
-            "L",
-            "W_PCT",
-            "HOME_RECORD",
-            "ROAD_RECORD",
-        ],
-        "WinProbability": [],
-    }
 
     nba_response = None
     data_sets = None
@@ -171,7 +47,7 @@ class ScoreboardV2(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available = Endpoint.DataSet(data=data_sets["Available"])
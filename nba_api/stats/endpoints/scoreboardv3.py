@@ -11,7 +11,6 @@ Example:
 """
 
 from nba_api.stats.endpoints._base import Endpoint
-from nba_api.stats.endpoints._expected_data.scoreboardv3 import _EXPECTED_DATA
 from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.library.parameters import GameDate, LeagueID
 
@@ -61,7 +60,6 @@ class ScoreboardV3(Endpoint):
     """
 
     endpoint = "scoreboardv3"
-    expected_data = _EXPECTED_DATA
 
     nba_response = None
     data_sets = None
@@ -141,7 +139,7 @@ class ScoreboardV3(Endpoint):
         """
         data_sets = self.nba_response.get_data_sets(self.endpoint)
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.scoreboard_info = Endpoint.DataSet(data=data_sets["ScoreboardInfo"])
@@ -29,43 +29,6 @@ from nba_api.stats.library.parameters import (
 
 class ShotChartDetail(Endpoint):
     endpoint = "shotchartdetail"
-    expected_data = {
-        "LeagueAverages": [
-            "GRID_TYPE",
-            "SHOT_ZONE_BASIC",
-            "SHOT_ZONE_AREA",
-            "SHOT_ZONE_RANGE",
-            "FGA",
-            "FGM",
-            "FG_PCT",
-        ],
-        "Shot_Chart_Detail": [
-            "GRID_TYPE",
-            "GAME_ID",
-            "GAME_EVENT_ID",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "PERIOD",
-            "MINUTES_REMAINING",
-            "SECONDS_REMAINING",
-            "EVENT_TYPE",
-            "ACTION_TYPE",
-            "SHOT_TYPE",
-            "SHOT_ZONE_BASIC",
-            "SHOT_ZONE_AREA",
-            "SHOT_ZONE_RANGE",
-            "SHOT_DISTANCE",
-            "LOC_X",
-            "LOC_Y",
-            "SHOT_ATTEMPTED_FLAG",
-            "SHOT_MADE_FLAG",
-            "GAME_DATE",
-            "HTM",
-            "VTM",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -164,7 +127,7 @@ class ShotChartDetail(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_averages = Endpoint.DataSet(data=data_sets["LeagueAverages"])
@@ -5,17 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season
 
 class ShotChartLeagueWide(Endpoint):
     endpoint = "shotchartleaguewide"
-    expected_data = {
-        "League_Wide": [
-            "GRID_TYPE",
-            "SHOT_ZONE_BASIC",
-            "SHOT_ZONE_AREA",
-            "SHOT_ZONE_RANGE",
-            "FGA",
-            "FGM",
-            "FG_PCT",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -53,7 +42,7 @@ class ShotChartLeagueWide(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.league_wide = Endpoint.DataSet(data=data_sets["League_Wide"])
@@ -19,45 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class ShotChartLineupDetail(Endpoint):
     endpoint = "shotchartlineupdetail"
-    expected_data = {
-        "ShotChartLineupDetail": [
-            "GRID_TYPE",
-            "GAME_ID",
-            "GAME_EVENT_ID",
-            "GROUP_ID",
-            "GROUP_NAME",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "TEAM_ID",
-            "TEAM_NAME",
-            "PERIOD",
-            "MINUTES_REMAINING",
-            "SECONDS_REMAINING",
-            "EVENT_TYPE",
-            "ACTION_TYPE",
-            "SHOT_TYPE",
-            "SHOT_ZONE_BASIC",
-            "SHOT_ZONE_AREA",
-            "SHOT_ZONE_RANGE",
-            "SHOT_DISTANCE",
-            "LOC_X",
-            "LOC_Y",
-            "SHOT_ATTEMPTED_FLAG",
-            "SHOT_MADE_FLAG",
-            "GAME_DATE",
-            "HTM",
-            "VTM",
-        ],
-        "ShotChartLineupLeagueAverage": [
-            "GRID_TYPE",
-            "SHOT_ZONE_BASIC",
-            "SHOT_ZONE_AREA",
-            "SHOT_ZONE_RANGE",
-            "FGA",
-            "FGM",
-            "FG_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -134,7 +95,7 @@ class ShotChartLineupDetail(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.shot_chart_lineup_detail = Endpoint.DataSet(
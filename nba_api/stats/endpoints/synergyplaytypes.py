@@ -13,32 +13,6 @@ from nba_api.stats.library.parameters import (
 
 class SynergyPlayTypes(Endpoint):
     endpoint = "synergyplaytypes"
-    expected_data = {
-        "SynergyPlayType": [
-            "SEASON_ID",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "PLAY_TYPE",
-            "TYPE_GROUPING",
-            "PERCENTILE",
-            "GP",
-            "POSS_PCT",
-            "PPP",
-            "FG_PCT",
-            "FT_POSS_PCT",
-            "TOV_POSS_PCT",
-            "SF_POSS_PCT",
-            "PLUSONE_POSS_PCT",
-            "SCORE_POSS_PCT",
-            "EFG_PCT",
-            "POSS",
-            "PTS",
-            "FGM",
-            "FGA",
-            "FGMX",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -89,7 +63,7 @@ class SynergyPlayTypes(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.synergy_play_type = Endpoint.DataSet(data=data_sets["SynergyPlayType"])
@@ -25,145 +25,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamAndPlayersVsPlayers(Endpoint):
     endpoint = "teamandplayersvsplayers"
-    expected_data = {
-        "PlayersVsPlayers": [
-            "GROUP_SET",
-            "TITLE_DESCRIPTION",
-            "DESCRIPTION",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "TeamPlayersVsPlayersOff": [
-            "GROUP_SET",
-            "TITLE_DESCRIPTION",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "TeamPlayersVsPlayersOn": [
-            "GROUP_SET",
-            "TITLE_DESCRIPTION",
-            "PLAYER_ID",
-            "PLAYER_NAME",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "TeamVsPlayers": [
-            "GROUP_SET",
-            "TITLE_DESCRIPTION",
-            "DESCRIPTION",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-        "TeamVsPlayersOff": [
-            "GROUP_SET",
-            "TITLE_DESCRIPTION",
-            "DESCRIPTION",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -270,7 +131,7 @@ class TeamAndPlayersVsPlayers(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.players_vs_players = Endpoint.DataSet(data=data_sets["PlayersVsPlayers"])
@@ -19,102 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamDashPtReb(Endpoint):
     endpoint = "teamdashptreb"
-    expected_data = {
-        "NumContestedRebounding": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "REB_NUM_CONTESTING_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "OverallRebounding": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "G",
-            "OVERALL",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "RebDistanceRebounding": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "REB_DIST_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "ShotDistanceRebounding": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "SHOT_DIST_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-        "ShotTypeRebounding": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "SHOT_TYPE_RANGE",
-            "REB_FREQUENCY",
-            "OREB",
-            "DREB",
-            "REB",
-            "C_OREB",
-            "C_DREB",
-            "C_REB",
-            "C_REB_PCT",
-            "UC_OREB",
-            "UC_DREB",
-            "UC_REB",
-            "UC_REB_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -185,7 +89,7 @@ class TeamDashPtReb(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.num_contested_rebounding = Endpoint.DataSet(
@@ -19,128 +19,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamDashPtShots(Endpoint):
     endpoint = "teamdashptshots"
-    expected_data = {
-        "ClosestDefender10ftPlusShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "CLOSE_DEF_DIST_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "ClosestDefenderShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "CLOSE_DEF_DIST_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "DribbleShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "DRIBBLE_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "GeneralShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "SHOT_TYPE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "ShotClockShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "SHOT_CLOCK_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-        "TouchTimeShooting": [
-            "TEAM_ID",
-            "TEAM_NAME",
-            "SORT_ORDER",
-            "G",
-            "TOUCH_TIME_RANGE",
-            "FGA_FREQUENCY",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "EFG_PCT",
-            "FG2A_FREQUENCY",
-            "FG2M",
-            "FG2A",
-            "FG2_PCT",
-            "FG3A_FREQUENCY",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -211,7 +89,7 @@ class TeamDashPtShots(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.closest_defender10ft_plus_shooting = Endpoint.DataSet(
@@ -4,42 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class TeamDetails(Endpoint):
     endpoint = "teamdetails"
-    expected_data = {
-        "TeamAwardsChampionships": ["YEARAWARDED", "OPPOSITETEAM"],
-        "TeamAwardsConf": ["YEARAWARDED", "OPPOSITETEAM"],
-        "TeamAwardsDiv": ["YEARAWARDED", "OPPOSITETEAM"],
-        "TeamBackground": [
-            "TEAM_ID",
-            "ABBREVIATION",
-            "NICKNAME",
-            "YEARFOUNDED",
-            "CITY",
-            "ARENA",
-            "ARENACAPACITY",
-            "OWNER",
-            "GENERALMANAGER",
-            "HEADCOACH",
-            "DLEAGUEAFFILIATION",
-        ],
-        "TeamHistory": ["TEAM_ID", "CITY", "NICKNAME", "YEARFOUNDED", "YEARACTIVETILL"],
-        "TeamHof": [
-            "PLAYERID",
-            "PLAYER",
-            "POSITION",
-            "JERSEY",
-            "SEASONSWITHTEAM",
-            "YEAR",
-        ],
-        "TeamRetired": [
-            "PLAYERID",
-            "PLAYER",
-            "POSITION",
-            "JERSEY",
-            "SEASONSWITHTEAM",
-            "YEAR",
-        ],
-        "TeamSocialSites": ["ACCOUNTTYPE", "WEBSITE_LINK"],
-    }
 
     nba_response = None
     data_sets = None
@@ -69,7 +33,7 @@ class TeamDetails(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_awards_championships = Endpoint.DataSet(
@@ -5,40 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, Season, SeasonType
 
 class TeamEstimatedMetrics(Endpoint):
     endpoint = "teamestimatedmetrics"
-    expected_data = {
-        "TeamEstimatedMetrics": [
-            "TEAM_NAME",
-            "TEAM_ID",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "E_OFF_RATING",
-            "E_DEF_RATING",
-            "E_NET_RATING",
-            "E_PACE",
-            "E_AST_RATIO",
-            "E_OREB_PCT",
-            "E_DREB_PCT",
-            "E_REB_PCT",
-            "E_TM_TOV_PCT",
-            "GP_RANK",
-            "W_RANK",
-            "L_RANK",
-            "W_PCT_RANK",
-            "MIN_RANK",
-            "E_OFF_RATING_RANK",
-            "E_DEF_RATING_RANK",
-            "E_NET_RATING_RANK",
-            "E_AST_RATIO_RANK",
-            "E_OREB_PCT_RANK",
-            "E_DREB_PCT_RANK",
-            "E_REB_PCT_RANK",
-            "E_TM_TOV_PCT_RANK",
-            "E_PACE_RANK",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -81,7 +47,7 @@ class TeamEstimatedMetrics(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_estimated_metrics = Endpoint.DataSet(
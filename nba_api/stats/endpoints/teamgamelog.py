@@ -5,37 +5,6 @@ from nba_api.stats.library.parameters import Season, SeasonTypeAllStar, LeagueID
 
 class TeamGameLog(Endpoint):
     endpoint = "teamgamelog"
-    expected_data = {
-        "TeamGameLog": [
-            "Team_ID",
-            "Game_ID",
-            "GAME_DATE",
-            "MATCHUP",
-            "WL",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -88,7 +57,7 @@ class TeamGameLog(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_game_log = Endpoint.DataSet(data=data_sets["TeamGameLog"])
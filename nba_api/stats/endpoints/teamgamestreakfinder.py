@@ -15,20 +15,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamGameStreakFinder(Endpoint):
     endpoint = "teamgamestreakfinder"
-    expected_data = {
-        "TeamGameStreakFinderParametersResults": [
-            "TEAM_NAME",
-            "TEAM_ID",
-            "GAMESTREAK",
-            "STARTDATE",
-            "ENDDATE",
-            "ACTIVESTREAK",
-            "NUMSEASONS",
-            "LASTSEASON",
-            "FIRSTSEASON",
-            "ABBREVIATION",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -441,7 +427,7 @@ class TeamGameStreakFinder(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_game_streak_finder_parameters_results = Endpoint.DataSet(
@@ -9,39 +9,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamInfoCommon(Endpoint):
     endpoint = "teaminfocommon"
-    expected_data = {
-        "AvailableSeasons": ["SEASON_ID"],
-        "TeamInfoCommon": [
-            "TEAM_ID",
-            "SEASON_YEAR",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "TEAM_ABBREVIATION",
-            "TEAM_CONFERENCE",
-            "TEAM_DIVISION",
-            "TEAM_CODE",
-            "W",
-            "L",
-            "PCT",
-            "CONF_RANK",
-            "DIV_RANK",
-            "MIN_YEAR",
-            "MAX_YEAR",
-        ],
-        "TeamSeasonRanks": [
-            "LEAGUE_ID",
-            "SEASON_ID",
-            "TEAM_ID",
-            "PTS_RANK",
-            "PTS_PG",
-            "REB_RANK",
-            "REB_PG",
-            "AST_RANK",
-            "AST_PG",
-            "OPP_PTS_RANK",
-            "OPP_PTS_PG",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -86,7 +53,7 @@ class TeamInfoCommon(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
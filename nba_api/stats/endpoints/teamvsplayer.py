@@ -23,280 +23,6 @@ from nba_api.stats.library.parameters import (
 
 class TeamVsPlayer(Endpoint):
     endpoint = "teamvsplayer"
-    expected_data = {
-        "OnOffCourt": [
-            "GROUP_SET",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "GP_RANK",
-            "W_RANK",
-            "L_RANK",
-            "W_PCT_RANK",
-            "MIN_RANK",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "FTM_RANK",
-            "FTA_RANK",
-            "FT_PCT_RANK",
-            "OREB_RANK",
-            "DREB_RANK",
-            "REB_RANK",
-            "AST_RANK",
-            "TOV_RANK",
-            "STL_RANK",
-            "BLK_RANK",
-            "BLKA_RANK",
-            "PF_RANK",
-            "PFD_RANK",
-            "PTS_RANK",
-            "PLUS_MINUS_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "Overall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "GP_RANK",
-            "W_RANK",
-            "L_RANK",
-            "W_PCT_RANK",
-            "MIN_RANK",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "FTM_RANK",
-            "FTA_RANK",
-            "FT_PCT_RANK",
-            "OREB_RANK",
-            "DREB_RANK",
-            "REB_RANK",
-            "AST_RANK",
-            "TOV_RANK",
-            "STL_RANK",
-            "BLK_RANK",
-            "BLKA_RANK",
-            "PF_RANK",
-            "PFD_RANK",
-            "PTS_RANK",
-            "PLUS_MINUS_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaOffCourt": [
-            "GROUP_SET",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaOnCourt": [
-            "GROUP_SET",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotAreaOverall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOffCourt": [
-            "GROUP_SET",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOnCourt": [
-            "GROUP_SET",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "VS_PLAYER_ID",
-            "VS_PLAYER_NAME",
-            "COURT_STATUS",
-            "GROUP_VALUE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "ShotDistanceOverall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "TEAM_ID",
-            "TEAM_ABBREVIATION",
-            "TEAM_NAME",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "CFID",
-            "CFPARAMS",
-        ],
-        "vsPlayerOverall": [
-            "GROUP_SET",
-            "GROUP_VALUE",
-            "PLAYER_ID",
-            "GP",
-            "W",
-            "L",
-            "W_PCT",
-            "MIN",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "TOV",
-            "STL",
-            "BLK",
-            "BLKA",
-            "PF",
-            "PFD",
-            "PTS",
-            "PLUS_MINUS",
-            "NBA_FANTASY_PTS",
-            "DD2",
-            "TD3",
-            "GP_RANK",
-            "W_RANK",
-            "L_RANK",
-            "W_PCT_RANK",
-            "MIN_RANK",
-            "FGM_RANK",
-            "FGA_RANK",
-            "FG_PCT_RANK",
-            "FG3M_RANK",
-            "FG3A_RANK",
-            "FG3_PCT_RANK",
-            "FTM_RANK",
-            "FTA_RANK",
-            "FT_PCT_RANK",
-            "OREB_RANK",
-            "DREB_RANK",
-            "REB_RANK",
-            "AST_RANK",
-            "TOV_RANK",
-            "STL_RANK",
-            "BLK_RANK",
-            "BLKA_RANK",
-            "PF_RANK",
-            "PFD_RANK",
-            "PTS_RANK",
-            "PLUS_MINUS_RANK",
-            "NBA_FANTASY_PTS_RANK",
-            "DD2_RANK",
-            "TD3_RANK",
-            "CFID",
-            "CFPARAMS",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -379,7 +105,7 @@ class TeamVsPlayer(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
@@ -5,44 +5,6 @@ from nba_api.stats.library.parameters import LeagueID, PerModeSimple, SeasonType
 
 class TeamYearByYearStats(Endpoint):
     endpoint = "teamyearbyyearstats"
-    expected_data = {
-        "TeamStats": [
-            "TEAM_ID",
-            "TEAM_CITY",
-            "TEAM_NAME",
-            "YEAR",
-            "GP",
-            "WINS",
-            "LOSSES",
-            "WIN_PCT",
-            "CONF_RANK",
-            "DIV_RANK",
-            "PO_WINS",
-            "PO_LOSSES",
-            "CONF_COUNT",
-            "DIV_COUNT",
-            "NBA_FINALS_APPEARANCE",
-            "FGM",
-            "FGA",
-            "FG_PCT",
-            "FG3M",
-            "FG3A",
-            "FG3_PCT",
-            "FTM",
-            "FTA",
-            "FT_PCT",
-            "OREB",
-            "DREB",
-            "REB",
-            "AST",
-            "PF",
-            "STL",
-            "TOV",
-            "BLK",
-            "PTS",
-            "PTS_RANK",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -87,7 +49,7 @@ class TeamYearByYearStats(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
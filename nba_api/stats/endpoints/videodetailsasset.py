@@ -29,7 +29,6 @@ from nba_api.stats.library.parameters import (
 
 class VideoDetailsAsset(Endpoint):
     endpoint = "videodetailsasset"
-    expected_data = {}
 
     nba_response = None
     data_sets = None
@@ -126,6 +125,6 @@ class VideoDetailsAsset(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
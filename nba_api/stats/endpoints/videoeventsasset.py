@@ -4,7 +4,6 @@ from nba_api.stats.library.http import NBAStatsHTTP
 
 class VideoEventsAsset(Endpoint):
     endpoint = "videoeventsasset"
-    expected_data = {}
 
     nba_response = None
     data_sets = None
@@ -42,6 +41,6 @@ class VideoEventsAsset(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
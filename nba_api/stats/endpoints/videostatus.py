@@ -5,24 +5,6 @@ from nba_api.stats.library.parameters import GameDate, LeagueID
 
 class VideoStatus(Endpoint):
     endpoint = "videostatus"
-    expected_data = {
-        "VideoStatus": [
-            "GAME_ID",
-            "GAME_DATE",
-            "VISITOR_TEAM_ID",
-            "VISITOR_TEAM_CITY",
-            "VISITOR_TEAM_NAME",
-            "VISITOR_TEAM_ABBREVIATION",
-            "HOME_TEAM_ID",
-            "HOME_TEAM_CITY",
-            "HOME_TEAM_NAME",
-            "HOME_TEAM_ABBREVIATION",
-            "GAME_STATUS",
-            "GAME_STATUS_TEXT",
-            "IS_AVAILABLE",
-            "PT_XYZ_AVAILABLE",
-        ]
-    }
 
     nba_response = None
     data_sets = None
@@ -60,7 +42,7 @@ class VideoStatus(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.video_status = Endpoint.DataSet(data=data_sets["VideoStatus"])
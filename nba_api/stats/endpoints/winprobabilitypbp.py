@@ -5,35 +5,6 @@ from nba_api.stats.library.parameters import RunType
 
 class WinProbabilityPBP(Endpoint):
     endpoint = "winprobabilitypbp"
-    expected_data = {
-        "GameInfo": [
-            "GAME_ID",
-            "GAME_DATE",
-            "HOME_TEAM_ID",
-            "HOME_TEAM_ABR",
-            "HOME_TEAM_PTS",
-            "VISITOR_TEAM_ID",
-            "VISITOR_TEAM_ABR",
-            "VISITOR_TEAM_PTS",
-        ],
-        "WinProbPBP": [
-            "GAME_ID",
-            "EVENT_NUM",
-            "HOME_PCT",
-            "VISITOR_PCT",
-            "HOME_PTS",
-            "VISITOR_PTS",
-            "HOME_SCORE_MARGIN",
-            "PERIOD",
-            "SECONDS_REMAINING",
-            "HOME_POSS_IND",
-            "HOME_G",
-            "DESCRIPTION",
-            "LOCATION",
-            "PCTIMESTRING",
-            "ISVISIBLE",
-        ],
-    }
 
     nba_response = None
     data_sets = None
@@ -71,7 +42,7 @@ class WinProbabilityPBP(Endpoint):
     def load_response(self):
         data_sets = self.nba_response.get_data_sets()
         self.data_sets = [
-            Endpoint.DataSet(data=data_set)
+            Endpoint.DataSet(data=data_set, name=data_set_name)
             for data_set_name, data_set in data_sets.items()
         ]
         self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
@@ -0,0 +1,211 @@
+"""Fetch one endpoint class for many parameter sets with bounded concurrency."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from nba_api.library.throttle import TokenBucket
+
+
+class BatchResult:
+    """Outcome of one parameter set: the loaded endpoint, or the error it raised."""
+
+    def __init__(self, index, parameters, endpoint=None, error=None, elapsed=0.0):
+        self.index = index
+        self.parameters = parameters
+        self.endpoint = endpoint
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return "BatchResult(index={}, parameters={!r}, ok={})".format(
+            self.index, self.parameters, self.ok
+        )
+
+
+class BatchStats:
+    """Running totals for a batch, updated as each result is yielded."""
+
+    def __init__(self):
+        self.submitted = 0
+        self.ok = 0
+        self.failed = 0
+        self.retries = 0
+        self.rate_limit_wait = 0.0
+        self.started = None
+        self.finished = None
+
+    @property
+    def completed(self):
+        return self.ok + self.failed
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self):
+        """Completed items per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def record(self, result):
+        if result.ok:
+            self.ok += 1
+            nba_response = getattr(result.endpoint, "nba_response", None)
+            if nba_response is not None:
+                request_stats = nba_response.get_request_stats()
+                self.retries += request_stats["retries"]
+                self.rate_limit_wait += request_stats["rate_limit_wait"]
+        else:
+            self.failed += 1
+
+    def get_dict(self):
+        return {
+            "submitted": self.submitted,
+            "ok": self.ok,
+            "failed": self.failed,
+            "retries": self.retries,
+            "rate_limit_wait": self.rate_limit_wait,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+        }
+
+
+class BatchFetcher:
+    """Run ``endpoint_class(**parameters)`` for each parameter set, streaming results.
+
+    ``parameter_sets`` is any iterable of keyword-argument dicts, e.g.
+    ``[{"game_id": gid} for gid in game_ids]``; it is consumed lazily, so at most
+    ``max_workers`` requests are in flight. ``rate`` (requests per second, with
+    optional ``burst``) or an existing ``rate_limiter`` caps how fast items start
+    across the whole batch, on top of any per-host limit set on NBAHTTP.
+
+    Iterating (or ``async for`` with ``iter_async``) yields a BatchResult per item
+    in completion order; failures are yielded, not raised. ``stats`` is updated as
+    results are yielded.
+    """
+
+    def __init__(
+        self,
+        endpoint_class,
+        parameter_sets,
+        max_workers=4,
+        rate=None,
+        burst=None,
+        rate_limiter=None,
+        **endpoint_kwargs
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.endpoint_class = endpoint_class
+        self.parameter_sets = parameter_sets
+        self.max_workers = max_workers
+        if rate_limiter is None and rate is not None:
+            rate_limiter = TokenBucket(rate=rate, burst=burst)
+        self.rate_limiter = rate_limiter
+        # Shared by every item, e.g. timeout=, proxy= or headers=.
+        self.endpoint_kwargs = endpoint_kwargs
+        self.stats = BatchStats()
+        self._lock = threading.Lock()
+
+    def _kwargs(self, parameters):
+        kwargs = dict(self.endpoint_kwargs)
+        kwargs.update(parameters)
+        return kwargs
+
+    def _fetch(self, index, parameters):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        started = time.perf_counter()
+        try:
+            endpoint = self.endpoint_class(**self._kwargs(parameters))
+        except Exception as e:
+            return BatchResult(index, parameters, error=e, elapsed=time.perf_counter() - started)
+        return BatchResult(index, parameters, endpoint=endpoint, elapsed=time.perf_counter() - started)
+
+    async def _fetch_async(self, index, parameters):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        started = time.perf_counter()
+        try:
+            endpoint = await self.endpoint_class.create_async(**self._kwargs(parameters))
+        except Exception as e:
+            return BatchResult(index, parameters, error=e, elapsed=time.perf_counter() - started)
+        return BatchResult(index, parameters, endpoint=endpoint, elapsed=time.perf_counter() - started)
+
+    def _start(self):
+        self.stats.started = time.perf_counter()
+        self.stats.finished = None
+        return enumerate(self.parameter_sets)
+
+    def _finish(self, result):
+        with self._lock:
+            self.stats.record(result)
+
+    def __iter__(self):
+        items = self._start()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = set()
+
+            def submit(count):
+                for index, parameters in itertools.islice(items, count):
+                    pending.add(pool.submit(self._fetch, index, parameters))
+                    self.stats.submitted += 1
+
+            submit(self.max_workers)
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    pending.difference_update(done)
+                    submit(len(done))
+                    for future in done:
+                        result = future.result()
+                        self._finish(result)
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+                self.stats.finished = time.perf_counter()
+
+    async def iter_async(self):
+        items = self._start()
+        pending = set()
+
+        def submit(count):
+            for index, parameters in itertools.islice(items, count):
+                pending.add(asyncio.ensure_future(self._fetch_async(index, parameters)))
+                self.stats.submitted += 1
+
+        submit(self.max_workers)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                submit(len(done))
+                for task in done:
+                    result = task.result()
+                    self._finish(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            self.stats.finished = time.perf_counter()
+
+    def run(self):
+        """Fetch everything and return the results in input order."""
+        return sorted(self, key=lambda result: result.index)
+
+
+def fetch_batch(endpoint_class, parameter_sets, **kwargs):
+    """Shorthand for ``iter(BatchFetcher(endpoint_class, parameter_sets, **kwargs))``."""
+    return iter(BatchFetcher(endpoint_class, parameter_sets, **kwargs))
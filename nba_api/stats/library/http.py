@@ -3,6 +3,7 @@
 import json
 
 from nba_api.library import http
+from nba_api.library.columns import get_columns
 
 try:
     from nba_api.library.debug.debug import STATS_HEADERS
@@ -48,19 +49,34 @@ class NBAStatsResponse(http.NBAResponse):
                 headers = result["headers"]
                 row_set = result["rowSet"]
 
-                rows = []
-                for raw_row in row_set:
-                    row = {}
-                    for i in range(len(headers)):
-                        row[headers[i]] = raw_row[i]
-                    rows.append(row)
-                data[name] = rows
+                data[name] = [dict(zip(headers, raw_row)) for raw_row in row_set]
 
         return data
 
     def get_normalized_json(self):
         return json.dumps(self.get_normalized_dict())
 
+    def get_normalized_columns(self, as_numpy=None):
+        """Like get_normalized_dict, but each result set maps headers to columns."""
+        raw_data = self.get_dict()
+
+        if "resultSets" in raw_data:
+            results = raw_data["resultSets"]
+            if "Meta" in results:
+                return results
+        elif "resultSet" in raw_data:
+            results = raw_data["resultSet"]
+        else:
+            return {}
+        if isinstance(results, dict):
+            results = [results]
+        return {
+            result["name"]: get_columns(
+                result["headers"], result["rowSet"], as_numpy=as_numpy
+            )
+            for result in results
+        }
+
     def get_parameters(self):
         if not self.valid_json() or "parameters" not in self.get_dict():
             return None
@@ -126,6 +142,21 @@ class NBAStatsResponse(http.NBAResponse):
             endpoint_parser = get_parser_for_endpoint(endpoint, self.get_dict())
             return endpoint_parser.get_data_sets()
 
+    def iter_data_sets(self, endpoint=None):
+        """Like get_data_sets, but each data set's "data" is a row iterator.
+
+        V3 parsers build rows lazily as the iterator is consumed; tabular
+        responses iterate over their already decoded rowSet.
+        """
+        if endpoint is not None:
+            from nba_api.stats.endpoints._parsers import get_parser_for_endpoint
+
+            return get_parser_for_endpoint(endpoint, self.get_dict()).iter_data_sets()
+        return {
+            name: {"headers": data_set["headers"], "data": iter(data_set["data"])}
+            for name, data_set in self.get_data_sets().items()
+        }
+
 
 class NBAStatsHTTP(http.NBAHTTP):
     """HTTP client for NBA Stats API with custom response handling."""
@@ -140,3 +171,7 @@ class NBAStatsHTTP(http.NBAHTTP):
         if '{"Message":"An error has occurred."}' in contents:
             return "<Error><Message>An error has occurred.</Message></Error>"
         return contents
+
+
+class AsyncNBAStatsHTTP(http.AsyncNBAHTTP, NBAStatsHTTP):
+    """Asyncio HTTP client for NBA Stats API, see http.AsyncNBAHTTP."""
@@ -0,0 +1,211 @@
+"""
+Batch Play-by-Play Description Parser
+-------------------------------------
+Parses whole PlayByPlayV2 result sets with the patterns in playbyplayregex.
+
+Each row is dispatched on its EVENTMSGTYPE to the patterns listed in
+``eventmsgtype_to_re``, for each of its HOME/NEUTRAL/VISITOR descriptions. Every
+matched description becomes one output record, so a blocked miss yields a
+``field_goal_missed`` record on one side and a ``block`` record on the other.
+
+Output is columnar: a dict mapping each column name to a list, with the event
+identifiers, the description side, the name of the matching pattern and one
+column per named group of the patterns (``player``, ``points``, ``player_ast``,
+``distance``, ``foul_type``, ...). Groups that did not take part in a match are
+None; numeric groups are converted to int. Groups whose name means something
+else in one pattern get their own column: the "(P1.T2)" counts of player fouls
+and turnovers are ``personal_fouls``/``team_fouls`` and
+``personal_turnovers``/``team_turnovers`` rather than ``personal``/``team``,
+which stays the team name.
+
+Usage:
+    columns = parse_play_by_play(PlayByPlayV2(game_id=...).play_by_play)
+    columns = parse_games([pbp1, pbp2, ...], processes=4)
+"""
+
+import functools
+import operator
+
+from nba_api.stats.library import playbyplayregex
+from nba_api.stats.library.playbyplayregex import eventmsgtype_to_re
+
+DESCRIPTION_COLUMNS = (
+    ("home", "HOMEDESCRIPTION"),
+    ("neutral", "NEUTRALDESCRIPTION"),
+    ("visitor", "VISITORDESCRIPTION"),
+)
+
+EVENT_COLUMNS = ("GAME_ID", "EVENTNUM", "EVENTMSGTYPE", "PERIOD", "PCTIMESTRING")
+
+# Named groups holding counts, points or distances.
+NUMERIC_GROUPS = frozenset(
+    (
+        "points",
+        "assists",
+        "distance",
+        "blocks",
+        "steals",
+        "offensive",
+        "defensive",
+        "turnovers",
+        "full",
+        "short",
+        "personal_fouls",
+        "team_fouls",
+        "personal_turnovers",
+        "team_turnovers",
+    )
+)
+
+# EVENTMSGTYPE value -> patterns, tried in order. Built from a copy so the
+# defaultdict in playbyplayregex is not grown by lookups of unmapped types.
+_PATTERNS_BY_TYPE = {
+    event_type.value: tuple(patterns)
+    for event_type, patterns in dict(eventmsgtype_to_re).items()
+}
+
+# Compiled pattern -> its name without the "re_" prefix, e.g. "field_goal_made".
+PATTERN_NAMES = {
+    getattr(playbyplayregex, name): name[3:]
+    for name in dir(playbyplayregex)
+    if name.startswith("re_")
+}
+
+# (pattern name, group) -> output column, for groups that would otherwise share a
+# column with a group of the same name but a different meaning.
+_RENAMED_GROUPS = {
+    ("foul_player", "personal"): "personal_fouls",
+    ("foul_player", "team"): "team_fouls",
+    ("turnover_player", "personal"): "personal_turnovers",
+    ("turnover_player", "team"): "team_turnovers",
+}
+
+
+def _group_column(pattern, group):
+    return _RENAMED_GROUPS.get((PATTERN_NAMES[pattern], group), group)
+
+
+GROUP_COLUMNS = tuple(
+    sorted(
+        {
+            _group_column(pattern, group)
+            for patterns in _PATTERNS_BY_TYPE.values()
+            for pattern in patterns
+            for group in pattern.groupindex
+        }
+    )
+)
+
+COLUMNS = EVENT_COLUMNS + ("SIDE", "DESCRIPTION", "PATTERN") + GROUP_COLUMNS
+
+
+# Compiled pattern -> [(GROUP_COLUMNS position, group name, is numeric)] of its groups.
+_PATTERN_GROUPS = {
+    pattern: [
+        (
+            GROUP_COLUMNS.index(_group_column(pattern, group)),
+            group,
+            _group_column(pattern, group) in NUMERIC_GROUPS,
+        )
+        for group in pattern.groupindex
+    ]
+    for patterns in _PATTERNS_BY_TYPE.values()
+    for pattern in patterns
+}
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_description(event_msg_type, description):
+    """Match one description against the patterns of its event type.
+
+    Returns ``(pattern_name, groups)`` for the first pattern that matches, with
+    ``groups`` a tuple aligned with GROUP_COLUMNS, or None. Results are cached,
+    as descriptions like "Celtics Rebound" or "SUB: ... FOR ..." repeat often.
+    """
+    for pattern in _PATTERNS_BY_TYPE.get(event_msg_type, ()):
+        match = pattern.match(description)
+        if match is None:
+            continue
+        groups = [None] * len(GROUP_COLUMNS)
+        for position, group, numeric in _PATTERN_GROUPS[pattern]:
+            value = match.group(group)
+            if numeric and value is not None and value.isdigit():
+                value = int(value)
+            groups[position] = value
+        return PATTERN_NAMES[pattern], tuple(groups)
+    return None
+
+
+def parse_rows(headers, rows):
+    """Parse PlayByPlayV2 rows given their headers; returns the columnar dict."""
+    index = {header: i for i, header in enumerate(headers)}
+    # Event columns missing from the headers read as None from a padded row.
+    pad = [None] if any(column not in index for column in EVENT_COLUMNS) else None
+    get_event = operator.itemgetter(
+        *(index.get(column, len(headers)) for column in EVENT_COLUMNS)
+    )
+    description_indexes = [
+        (side, index[column]) for side, column in DESCRIPTION_COLUMNS if column in index
+    ]
+    type_index = index["EVENTMSGTYPE"]
+
+    records = []
+    for row in rows:
+        try:
+            event_msg_type = int(row[type_index])
+        except (TypeError, ValueError):
+            continue
+        event = None
+        for side, i in description_indexes:
+            description = row[i]
+            if not description:
+                continue
+            # The stored description is the one that was parsed.
+            description = description.strip()
+            parsed = parse_description(event_msg_type, description)
+            if parsed is None:
+                continue
+            if event is None:
+                event = get_event(row if pad is None else list(row) + pad)
+            records.append(event + (side, description, parsed[0]) + parsed[1])
+
+    if not records:
+        return {column: [] for column in COLUMNS}
+    return {column: list(values) for column, values in zip(COLUMNS, zip(*records))}
+
+
+def parse_play_by_play(data_set):
+    """Parse a PlayByPlayV2 ``PlayByPlay`` data set (a DataSet or its dict)."""
+    if hasattr(data_set, "get_dict"):
+        data_set = data_set.get_dict()
+    return parse_rows(data_set["headers"], data_set["data"])
+
+
+def merge_columns(parts):
+    """Concatenate columnar dicts produced by parse_rows."""
+    merged = {column: [] for column in COLUMNS}
+    for part in parts:
+        for column in COLUMNS:
+            merged[column].extend(part[column])
+    return merged
+
+
+def parse_games(data_sets, processes=None, chunksize=1):
+    """Parse many games' PlayByPlay data sets into one columnar dict.
+
+    With ``processes`` set, games are parsed in a multiprocessing pool of that
+    size; each worker keeps its own description cache. Output keeps input order.
+    """
+    data_sets = [
+        data_set.get_dict() if hasattr(data_set, "get_dict") else data_set
+        for data_set in data_sets
+    ]
+    if not processes:
+        return merge_columns(parse_play_by_play(data_set) for data_set in data_sets)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return merge_columns(
+            pool.map(parse_play_by_play, data_sets, chunksize=chunksize)
+        )
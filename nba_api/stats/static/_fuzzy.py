@@ -0,0 +1,111 @@
+"""Typo-tolerant name search over the static players and teams tables."""
+
+import heapq
+import math
+import re
+import unicodedata
+
+from collections import Counter
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text):
+    """Accent-fold, lower-case and reduce ``text`` to space separated tokens."""
+    decomposed = unicodedata.normalize("NFD", str(text))
+    folded = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+    return _NON_ALNUM.sub(" ", folded.lower()).strip()
+
+
+def _grams(tokens):
+    grams = set()
+    for token in tokens:
+        padded = " {} ".format(token)
+        for i in range(len(padded) - 2):
+            grams.add(padded[i : i + 3])
+        # A first-letter gram lets one-letter tokens ("Giannis A") match as prefixes.
+        grams.add("^" + token[:1])
+    return grams
+
+
+class TrigramIndex:
+    """Inverted trigram index over one or more name keys per entry.
+
+    Scores combine IDF-weighted containment and Dice overlap of the query and entry
+    trigrams, plus a bonus when every query token is a prefix of some entry token,
+    so both typos ("jokicc") and partial input ("Giannis A", "wemby") rank sensibly.
+    """
+
+    def __init__(self, entries, common_fraction=0.05):
+        """``entries`` is a list of lists of names; positions are returned by search.
+
+        Grams found in more than ``common_fraction`` of the entries still count
+        towards the score but do not produce candidates on their own.
+        """
+        self.size = len(entries)
+        self._tokens = []
+        self._grams = []
+        self._postings = {}
+        for position, names in enumerate(entries):
+            tokens = set()
+            for name in names:
+                tokens.update(normalize(name).split())
+            grams = frozenset(_grams(tokens))
+            self._tokens.append(tuple(sorted(tokens)))
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+        self._weights = {
+            gram: math.log(1.0 + self.size / len(postings))
+            for gram, postings in self._postings.items()
+        }
+        self._entry_weight = [
+            sum(self._weights[gram] for gram in grams) for grams in self._grams
+        ]
+        self._common_size = max(1, int(self.size * common_fraction))
+
+    def search(self, query, limit=10, boost=None):
+        """Return up to ``limit`` ``(score, position)`` pairs, best first.
+
+        ``boost(position)`` may return a bonus added to the entry's score; it also
+        decides between entries sharing as many grams when picking candidates.
+        """
+        tokens = normalize(query).split()
+        if not tokens or limit <= 0:
+            return []
+        grams = frozenset(_grams(tokens))
+        weights = self._weights
+        query_weight = sum(weights.get(gram, 0.0) for gram in grams)
+        if query_weight <= 0:
+            return []
+
+        known = sorted(
+            (self._postings[gram] for gram in grams if gram in self._postings), key=len
+        )
+        rare = [postings for postings in known if len(postings) <= self._common_size]
+        if sum(map(len, rare)) < limit:
+            rare = known[: len(rare) + 1]
+
+        # Shared-gram counts (a C-level loop) pick candidates; only those get the
+        # weighted score.
+        counts = Counter()
+        for postings in rare:
+            counts.update(postings)
+        if boost is None:
+            candidates = heapq.nlargest(limit * 3, counts, key=counts.__getitem__)
+        else:
+            candidates = heapq.nlargest(limit * 3, counts, key=lambda p: (counts[p], boost(p)))
+
+        scored = []
+        for position in candidates:
+            shared = sum(weights[gram] for gram in grams & self._grams[position])
+            # Containment rewards covering the query, Dice penalises extra name parts.
+            value = shared / query_weight + 2.0 * shared / (query_weight + self._entry_weight[position])
+            entry_tokens = self._tokens[position]
+            if all(any(t.startswith(q) for t in entry_tokens) for q in tokens):
+                value += 1.0
+            if boost is not None:
+                value += boost(position)
+            scored.append((value, position))
+        scored.sort(key=lambda sp: (-sp[0], sp[1]))
+        return scored[:limit]
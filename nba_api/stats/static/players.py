@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_left
 from nba_api.stats.library.data import players, wnba_players
 from nba_api.stats.library.data import (
     player_index_id,
@@ -8,14 +9,132 @@ from nba_api.stats.library.data import (
     player_index_is_active,
 )
 import unicodedata
+from nba_api.stats.static._fuzzy import TrigramIndex
+
+
+_REGEX_METACHARACTERS = set(".^$*+?{}[]\\|()")
+
+_NAME_FIELDS = (player_index_full_name, player_index_first_name, player_index_last_name)
+
+# Fuzzy-search score bonus for active players.
+_ACTIVE_BONUS = 0.25
+
+
+class _PlayerIndex:
+    """Lookup tables over one players table, built once on first use.
+
+    Holds a dict by id, accent-folded lower-case exact-name maps and sorted name
+    lists for prefix search, plus the accent-folded column values that the regex
+    fallback scans. The trigram index for fuzzy search is also built lazily.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.by_id = {}
+        for position, row in enumerate(rows):
+            self.by_id.setdefault(row[player_index_id], []).append(position)
+        self._folded = {}
+        self._exact = {}
+        self._sorted = {}
+        self._fuzzy = None
+
+    def get_folded(self, row_id):
+        folded = self._folded.get(row_id)
+        if folded is None:
+            folded = [_strip_accents(str(row[row_id])) for row in self.rows]
+            self._folded[row_id] = folded
+        return folded
+
+    def find_exact(self, row_id, name):
+        exact = self._exact.get(row_id)
+        if exact is None:
+            exact = {}
+            for position, value in enumerate(self.get_folded(row_id)):
+                exact.setdefault(value.lower(), []).append(position)
+            self._exact[row_id] = exact
+        return exact.get(_strip_accents(name).lower(), [])
+
+    def find_prefix(self, row_id, prefix):
+        entries = self._sorted.get(row_id)
+        if entries is None:
+            entries = sorted(
+                (value.lower(), position)
+                for position, value in enumerate(self.get_folded(row_id))
+            )
+            self._sorted[row_id] = entries
+        prefix = _strip_accents(prefix).lower()
+        positions = []
+        for i in range(bisect_left(entries, (prefix,)), len(entries)):
+            value, position = entries[i]
+            if not value.startswith(prefix):
+                break
+            positions.append(position)
+        return sorted(positions)
+
+    def find_fuzzy(self, query, limit):
+        if self._fuzzy is None:
+            self._fuzzy = TrigramIndex([[row[player_index_full_name]] for row in self.rows])
+        # Active players get a bonus smaller than the gap between match kinds (exact,
+        # prefix, typo), so they lead among equally good matches without outranking a
+        # better one: "curry" puts Stephen Curry ahead of the retired Currys.
+        return [
+            position
+            for _, position in self._fuzzy.search(
+                query,
+                limit,
+                boost=lambda p: _ACTIVE_BONUS if self.rows[p][player_index_is_active] else 0.0,
+            )
+        ]
+
+    def find_regex(self, row_id, regex_pattern):
+        regex = re.compile(_strip_accents(regex_pattern), flags=re.I)
+        return [
+            position
+            for position, value in enumerate(self.get_folded(row_id))
+            if regex.search(value)
+        ]
+
+
+_indexes = {}
+
+
+def _get_index(players):
+    index = _indexes.get(id(players))
+    if index is None or index.rows is not players:
+        index = _PlayerIndex(players)
+        _indexes[id(players)] = index
+    return index
+
+
+def _parse_anchored_pattern(regex_pattern):
+    """Split ``^literal`` / ``^literal$`` patterns into (literal, exact), else None."""
+    if not regex_pattern.startswith("^"):
+        return None
+    literal = regex_pattern[1:]
+    exact = literal.endswith("$") and not literal.endswith("\\$")
+    if exact:
+        literal = literal[:-1]
+    if not literal or _REGEX_METACHARACTERS & set(literal):
+        return None
+    return literal, exact
+
+
+def _find_player_positions(regex_pattern, row_id, players=players):
+    index = _get_index(players)
+    anchored = _parse_anchored_pattern(str(regex_pattern))
+    if anchored is not None and row_id in _NAME_FIELDS:
+        literal, exact = anchored
+        if exact:
+            return index.find_exact(row_id, literal)
+        return index.find_prefix(row_id, literal)
+    return index.find_regex(row_id, str(regex_pattern))
 
 
 def _find_players(regex_pattern, row_id, players=players):
-    players_found = []
-    for player in players:
-        if re.search(_strip_accents(regex_pattern), _strip_accents(str(player[row_id])), flags=re.I):
-            players_found.append(_get_player_dict(player))
-    return players_found
+    return [
+        _get_player_dict(players[position])
+        for position in _find_player_positions(regex_pattern, row_id, players=players)
+    ]
 
 
 def _strip_accents(inputstr: str) -> str:
@@ -29,8 +148,12 @@ def _strip_accents(inputstr: str) -> str:
 
 
 def _find_player_by_id(player_id, players=players):
-    regex_pattern = "^{}$".format(player_id)
-    players_list = _find_players(regex_pattern, player_index_id, players=players)
+    try:
+        positions = _get_index(players).by_id.get(int(player_id), [])
+    except (TypeError, ValueError):
+        regex_pattern = "^{}$".format(player_id)
+        positions = _find_player_positions(regex_pattern, player_index_id, players=players)
+    players_list = [_get_player_dict(players[position]) for position in positions]
     if len(players_list) > 1:
         raise Exception("Found more than 1 id")
     elif not players_list:
@@ -72,6 +195,19 @@ def _get_player_dict(player_row):
     }
 
 
+def find_players_by_name(name, row_id=player_index_full_name, prefix=False):
+    """Accent- and case-insensitive exact (or prefix) name lookup without regex scanning."""
+    index = _get_index(players)
+    positions = index.find_prefix(row_id, name) if prefix else index.find_exact(row_id, name)
+    return [_get_player_dict(players[position]) for position in positions]
+
+
+def search_players(query, limit=10):
+    """Typo-tolerant ranked search, e.g. "jokic", "Giannis A" or "wemby"."""
+    positions = _get_index(players).find_fuzzy(query, limit)
+    return [_get_player_dict(players[position]) for position in positions]
+
+
 def find_players_by_full_name(regex_pattern):
     return _find_players(regex_pattern, player_index_full_name)
 
@@ -100,6 +236,17 @@ def get_inactive_players():
     return _get_inactive_players()
 
 
+def find_wnba_players_by_name(name, row_id=player_index_full_name, prefix=False):
+    index = _get_index(wnba_players)
+    positions = index.find_prefix(row_id, name) if prefix else index.find_exact(row_id, name)
+    return [_get_player_dict(wnba_players[position]) for position in positions]
+
+
+def search_wnba_players(query, limit=10):
+    positions = _get_index(wnba_players).find_fuzzy(query, limit)
+    return [_get_player_dict(wnba_players[position]) for position in positions]
+
+
 def find_wnba_players_by_full_name(regex_pattern):
     return _find_players(regex_pattern, player_index_full_name, players=wnba_players)
 
@@ -12,6 +12,16 @@ from nba_api.stats.library.data import (
     team_index_year_founded,
 )
 from nba_api.stats.library.data import team_index_championship_year
+from nba_api.stats.static._fuzzy import TrigramIndex
+
+_NAME_FIELDS = (
+    team_index_full_name,
+    team_index_abbreviation,
+    team_index_nickname,
+    team_index_city,
+)
+
+_fuzzy_indexes = {}
 
 
 def _find_teams(regex_pattern, row_id, teams=teams):
@@ -59,6 +69,14 @@ def _find_teams_by_year_founded(year, teams=teams):
     return teams_found
 
 
+def _search_teams(query, limit, teams=teams):
+    index = _fuzzy_indexes.get(id(teams))
+    if index is None:
+        index = TrigramIndex([[team[field] for field in _NAME_FIELDS] for team in teams])
+        _fuzzy_indexes[id(teams)] = index
+    return [_get_team_dict(teams[position]) for _, position in index.search(query, limit)]
+
+
 def _get_teams(teams=teams):
     teams_list = []
     for team in teams:
@@ -78,6 +96,11 @@ def _get_team_dict(team_row):
     }
 
 
+def search_teams(query, limit=10):
+    """Typo-tolerant ranked search over full name, abbreviation, nickname and city."""
+    return _search_teams(query, limit)
+
+
 def find_teams_by_full_name(regex_pattern):
     return _find_teams(regex_pattern, team_index_full_name)
 
@@ -114,6 +137,10 @@ def get_teams():
     return _get_teams()
 
 
+def search_wnba_teams(query, limit=10):
+    return _search_teams(query, limit, teams=wnba_teams)
+
+
 def find_wnba_teams_by_full_name(regex_pattern):
     return _find_teams(regex_pattern, team_index_full_name, teams=wnba_teams)
 
@@ -3,35 +3,111 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class PointsModelConfig:
     prior_rate_per_minute: float = 0.65
     prior_minutes: float = 12.0
+    # Deprecated and ignored: the Poisson tail no longer truncates its series.
     max_poisson_terms: int = 250
 
 
-def _poisson_tail_prob(lam: float, k: int, max_terms: int) -> float:
+# Series terms are summed this many at a time, so numpy does the inner loop.
+_BLOCK = 32
+_BLOCK_OFFSETS = np.arange(1, _BLOCK + 1, dtype=float)
+_EPS = np.finfo(float).eps
+# Hard cap on series terms; convergence takes about 9 * sqrt(k) terms, so this
+# only cuts in for k beyond ~1e8.
+_MAX_TERMS = 100_000
+
+
+def _log_factorials(k: np.ndarray) -> np.ndarray:
+    # lgamma per distinct k only; a slate repeats the same few thresholds.
+    unique, inverse = np.unique(k, return_inverse=True)
+    table = np.array([math.lgamma(value + 1.0) for value in unique.tolist()], dtype=float)
+    return table[inverse].reshape(k.shape)
+
+
+def _series(lam: np.ndarray, k: np.ndarray, upper: bool) -> np.ndarray:
+    """1 + r1 + r1*r2 + ... for every row, until the terms stop mattering."""
+    series = np.ones_like(lam)
+    last = np.ones_like(lam)
+    rows = np.arange(lam.size)
+    n = _BLOCK_OFFSETS
+    while rows.size and n[0] <= _MAX_TERMS:
+        lam_r = lam[rows, None]
+        k_r = k[rows, None]
+        if upper:
+            ratios = lam_r / (k_r + n)
+        else:
+            ratios = np.maximum(k_r - n, 0.0) / lam_r
+        terms = last[:, None] * np.cumprod(ratios, axis=1)
+        series[rows] += terms.sum(axis=1)
+        last = terms[:, -1]
+        keep = last > series[rows] * _EPS
+        rows = rows[keep]
+        last = last[keep]
+        n = n + _BLOCK
+    return series
+
+
+def poisson_tail_probs(lam, k) -> np.ndarray:
+    """P(X >= k) for X ~ Poisson(lam), elementwise over broadcast arrays.
+
+    Works in log space, so no factorial or power is ever formed. Below the
+    mean (lam < k) the tail is summed upwards from pmf(k), with term ratios
+    lam / (k+n); otherwise the complement is summed downwards from pmf(k-1),
+    with ratios (k-n) / lam. Both ratios stay below one and shrink, so each
+    side converges within O(sqrt(k)) terms and the small tails keep full
+    relative precision. NaN in either input gives NaN; an infinite ``lam``
+    gives 1 and an infinite ``k`` (with finite ``lam``) gives 0.
+    """
+    lam, k = np.broadcast_arrays(np.asarray(lam, dtype=float), np.asarray(k))
+    k = np.ceil(k).astype(float)
+    result = np.where(k <= 0, 1.0, 0.0)
+    result[(lam == np.inf) & (k > 0)] = 1.0
+    result[np.isnan(lam) | np.isnan(k)] = np.nan
+    finite = np.isfinite(lam) & np.isfinite(k)
+
+    for upper in (True, False):
+        todo = finite & (k > 0) & (lam > 0) & ((lam < k) == upper)
+        if not todo.any():
+            continue
+        lam_t = lam[todo]
+        k_t = k[todo]
+        first = k_t if upper else k_t - 1.0
+        log_first = first * np.log(lam_t) - lam_t - _log_factorials(first)
+        mass = np.exp(log_first + np.log(_series(lam_t, k_t, upper)))
+        result[todo] = np.clip(mass if upper else 1.0 - mass, 0.0, 1.0)
+    return result
+
+
+def poisson_tail_prob(lam: float, k: float) -> float:
+    """Scalar poisson_tail_probs, in plain floats to skip numpy's per-call overhead."""
+    if math.isnan(lam) or math.isnan(k):
+        return math.nan
     if k <= 0:
         return 1.0
     if lam <= 0:
         return 0.0
-    terms = min(k, max_terms)
-    cumulative = 0.0
-    for i in range(terms):
-        cumulative += math.exp(-lam) * (lam ** i) / math.factorial(i)
-    if k > max_terms:
-        mean = lam
-        variance = lam
-        if variance <= 0:
-            return 0.0
-        z = (k - 0.5 - mean) / math.sqrt(variance)
-        return max(0.0, min(1.0, 1.0 - _normal_cdf(z)))
-    return max(0.0, min(1.0, 1.0 - cumulative))
-
-
-def _normal_cdf(z: float) -> float:
-    return 0.5 * (1.0 + math.erf(z / math.sqrt(2)))
+    if math.isinf(lam):
+        return 1.0
+    if math.isinf(k):
+        return 0.0
+    k = math.ceil(k)
+    upper = lam < k
+    first = k if upper else k - 1
+    log_first = first * math.log(lam) - lam - math.lgamma(first + 1)
+    series = term = 1.0
+    for n in range(1, _MAX_TERMS + 1):
+        term *= lam / (k + n) if upper else (k - n) / lam
+        series += term
+        if term <= series * _EPS:
+            break
+    mass = math.exp(log_first + math.log(series))
+    return max(0.0, min(1.0, mass if upper else 1.0 - mass))
 
 
 def estimate_break_probabilities(
@@ -57,8 +133,8 @@ def estimate_break_probabilities(
     season_needed = max(0, math.ceil(season_high - current_points))
     all_time_needed = max(0, math.ceil(all_time_high - current_points))
 
-    season_prob = _poisson_tail_prob(lam, season_needed, config.max_poisson_terms)
-    all_time_prob = _poisson_tail_prob(lam, all_time_needed, config.max_poisson_terms)
+    season_prob = poisson_tail_prob(lam, season_needed)
+    all_time_prob = poisson_tail_prob(lam, all_time_needed)
 
     return {
         "season_high": season_prob,
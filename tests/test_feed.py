@@ -0,0 +1,69 @@
+from feed.cache import (
+    GAME_STATUS_FINAL,
+    GAME_STATUS_LIVE,
+    GAME_STATUS_SCHEDULED,
+    FeedCache,
+    FeedCacheConfig,
+)
+from feed.poller import LeaderboardPoller
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_follows_game_status():
+    cache = FeedCache(FeedCacheConfig(live_ttl=5.0, scheduled_ttl=60.0))
+    assert cache.ttl_for_status(GAME_STATUS_LIVE) == 5.0
+    assert cache.ttl_for_status(str(GAME_STATUS_SCHEDULED)) == 60.0
+    assert cache.ttl_for_status(GAME_STATUS_FINAL) is None
+    assert cache.ttl_for_status(None) == 5.0
+
+
+def test_zero_ttl_is_not_stored():
+    cache = FeedCache(FeedCacheConfig(live_ttl=0.0))
+    cache.set("live", 1, cache.ttl_for_status(GAME_STATUS_LIVE))
+    assert cache.get("live") == (False, None)
+
+
+def test_entries_expire_and_evict():
+    clock = Clock()
+    cache = FeedCache(FeedCacheConfig(max_entries=2), clock=clock)
+    cache.set("a", 1, 10.0)
+    cache.set("b", 2, None)
+    assert cache.get("a") == (True, 1)
+    clock.now = 11.0
+    assert cache.get("a") == (False, None)
+    cache.set("c", 3, None)
+    cache.set("d", 4, None)
+    assert cache.get("b") == (False, None)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_snapshot_is_stamped_when_the_fetch_began(monkeypatch):
+    times = iter([100.0, 130.0])
+    monkeypatch.setattr("feed.poller.time.time", lambda: next(times))
+    poller = LeaderboardPoller(lambda: ({}, {}, []))
+    poller.poll_once()
+    assert poller.snapshot().fetched_at == 100.0
+
+
+def test_failed_poll_keeps_previous_snapshot():
+    results = [({"Points": {"value": 1}}, {}, [])]
+
+    def fetch():
+        if results:
+            return results.pop()
+        raise RuntimeError("boom")
+
+    poller = LeaderboardPoller(fetch)
+    poller.poll_once()
+    first = poller.snapshot()
+    poller.poll_once()
+    assert poller.snapshot() is first
+    assert poller.last_error == "boom"
+    assert poller.polls == 2
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from feed.leaderboard import DailyLeaderboards, TopKLeaderboard
+
+STATS = ("points", "rebounds")
+
+
+class Oracle:
+    """Brute-force reference: every key's value and the step it was set at."""
+
+    def __init__(self):
+        self.values = {stat: {} for stat in STATS}
+        self.step = 0
+
+    def set(self, stat, key, value):
+        self.step += 1
+        old = self.values[stat].get(key)
+        if old is None or old[0] != value:
+            self.values[stat][key] = (value, self.step)
+
+    def remove(self, key):
+        for values in self.values.values():
+            values.pop(key, None)
+
+    def top(self, stat, k):
+        ranked = sorted(self.values[stat].items(), key=lambda kv: (-kv[1][0], kv[1][1]))
+        return [(key, value) for key, (value, _) in ranked[:k]]
+
+
+def board_top(board, stat):
+    return [(entry.key, entry.value) for entry in board.top(stat)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("k", [1, 3, 5])
+def test_matches_brute_force(seed, k):
+    rng = random.Random(seed)
+    board = TopKLeaderboard(STATS, k=k)
+    oracle = Oracle()
+    keys = [("g{}".format(rng.randrange(3)), person) for person in range(12)]
+
+    for _ in range(400):
+        key = rng.choice(keys)
+        if rng.random() < 0.05:
+            board.remove(key)
+            oracle.remove(key)
+        else:
+            stat = rng.choice(STATS)
+            value = float(rng.randrange(8))
+            before = board_top(board, stat)
+            changed = board.update_stat(stat, key, value)
+            oracle.set(stat, key, value)
+            if not changed:
+                assert board_top(board, stat) == before
+        for stat in STATS:
+            expected = oracle.top(stat, k)
+            assert board_top(board, stat) == expected
+            leader = board.leader(stat)
+            assert (leader.key, leader.value) == expected[0] if expected else leader is None
+
+
+def test_update_reports_changed_stats_and_keeps_info():
+    board = TopKLeaderboard(STATS, k=2)
+    assert board.update("a", {"points": 10, "rebounds": 2}, info={"player": "A"}) == {"points", "rebounds"}
+    assert board.update("a", {"points": 10}) == set()
+    assert board.leader("points").info == {"player": "A"}
+    assert board.remove("a") == {"points", "rebounds"}
+    assert board.leader("points") is None
+
+
+def test_ties_go_to_who_reached_the_value_first():
+    board = TopKLeaderboard(STATS, k=3)
+    board.update_stat("points", "a", 10)
+    board.update_stat("points", "b", 12)
+    board.update_stat("points", "b", 10)
+    assert [entry.key for entry in board.top("points")] == ["a", "b"]
+
+
+def test_k_must_be_positive():
+    with pytest.raises(ValueError):
+        TopKLeaderboard(STATS, k=0)
+
+
+def test_daily_boards_skip_unchanged_players_and_drop_old_dates():
+    boards = DailyLeaderboards(STATS, k=2)
+    assert boards.update("2026-01-01", "a", {"points": 5, "rebounds": 1}, info=1) == {"points", "rebounds"}
+    assert boards.update("2026-01-01", "a", {"points": 5, "rebounds": 1}, info=2) == set()
+    assert boards.board("2026-01-01").leader("points").info == 2
+
+    boards.update("2026-01-02", "b", {"points": 7})
+    boards.retain(["2026-01-02"])
+    assert boards.dates() == ("2026-01-02",)
+    assert boards.board("2026-01-01").leader("points") is None
@@ -0,0 +1,56 @@
+from nba_api.stats.library.playbyplayparser import COLUMNS, parse_rows
+
+HEADERS = [
+    "GAME_ID",
+    "EVENTNUM",
+    "EVENTMSGTYPE",
+    "PERIOD",
+    "PCTIMESTRING",
+    "HOMEDESCRIPTION",
+    "NEUTRALDESCRIPTION",
+    "VISITORDESCRIPTION",
+]
+
+
+def parse_one(event_msg_type, description):
+    row = ["0022400001", 1, event_msg_type, 1, "11:00", description, None, None]
+    columns = parse_rows(HEADERS, [row])
+    assert len(columns["PATTERN"]) == 1
+    return {column: values[0] for column, values in columns.items()}
+
+
+def test_foul_counts_do_not_share_the_team_column():
+    record = parse_one(6, "Horford S.FOUL (P1.T2) (B.Adams)")
+    assert record["PATTERN"] == "foul_player"
+    assert record["player"] == "Horford"
+    assert record["personal_fouls"] == 1
+    assert record["team_fouls"] == 2
+    assert record["team"] is None
+
+
+def test_turnover_counts_do_not_share_the_team_column():
+    record = parse_one(5, "Tatum Bad Pass Turnover (P2.T5)")
+    assert record["PATTERN"] == "turnover_player"
+    assert record["personal_turnovers"] == 2
+    assert record["team_turnovers"] == 5
+    assert record["team"] is None
+
+
+def test_team_column_holds_team_names():
+    assert parse_one(4, "Celtics Rebound")["team"] == "Celtics"
+    assert parse_one(9, "Celtics Timeout: Regular (Full 1 Short 0)")["team"] == "Celtics"
+
+
+def test_stored_description_is_the_parsed_one():
+    record = parse_one(4, "  Celtics Rebound ")
+    assert record["DESCRIPTION"] == "Celtics Rebound"
+
+
+def test_unmatched_and_empty_descriptions_are_skipped():
+    rows = [
+        ["0022400001", 1, 4, 1, "11:00", "", None, None],
+        ["0022400001", 2, 4, 1, "11:00", "no pattern here", None, None],
+    ]
+    columns = parse_rows(HEADERS, rows)
+    assert set(columns) == set(COLUMNS)
+    assert columns["PATTERN"] == []
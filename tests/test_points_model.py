@@ -0,0 +1,131 @@
+import math
+import random
+from decimal import Decimal, localcontext
+
+import numpy as np
+import pytest
+
+from probability.points_model import (
+    PointsModelConfig,
+    estimate_break_probabilities,
+    poisson_tail_prob,
+    poisson_tail_probs,
+)
+
+
+def reference_tail(lam, k):
+    """P(X >= k) for X ~ Poisson(lam), summed with 80 significant digits."""
+    k = math.ceil(k)
+    if k <= 0:
+        return 1.0
+    if lam <= 0:
+        return 0.0
+    with localcontext() as ctx:
+        ctx.prec = 80
+        lam = Decimal(repr(float(lam)))
+        term = (-lam).exp()
+        cdf = Decimal(0)
+        for i in range(k):
+            cdf += term
+            term = term * lam / (i + 1)
+        if cdf < Decimal("0.5"):
+            return float(1 - cdf)
+        # Sum the upper tail directly so tiny tails keep their relative precision.
+        tail = Decimal(0)
+        i = k
+        while term > tail * Decimal("1e-40"):
+            tail += term
+            i += 1
+            term = term * lam / i
+        return float(tail)
+
+
+EDGE_CASES = [
+    (0.0, 3),
+    (5.0, 0),
+    (5.0, -2),
+    (1e-9, 1),
+    (7.3, 1),
+    (0.5, 40),
+    (10.0, 10),
+    (10.0, 11),
+    (99.5, 100),
+    (100.0, 100),
+    (30.0, 300),
+    (300.0, 30),
+    (300.0, 320),
+    (2000.0, 1900),
+    (2000.0, 2100),
+]
+
+
+def random_cases(count=500, seed=0):
+    rng = random.Random(seed)
+    return [(rng.uniform(0.01, 80.0), rng.randint(1, 120)) for _ in range(count)]
+
+
+def assert_close(got, expected, rel=1e-11):
+    assert got == pytest.approx(expected, rel=rel, abs=1e-300)
+
+
+@pytest.mark.parametrize("lam, k", EDGE_CASES)
+def test_scalar_matches_reference(lam, k):
+    assert_close(poisson_tail_prob(lam, k), reference_tail(lam, k))
+
+
+def test_vectorized_matches_reference():
+    cases = EDGE_CASES + random_cases()
+    lam = np.array([lam for lam, _ in cases])
+    k = np.array([k for _, k in cases])
+    got = poisson_tail_probs(lam, k)
+    for (case_lam, case_k), value in zip(cases, got):
+        assert_close(value, reference_tail(case_lam, case_k))
+
+
+def test_scalar_and_vectorized_agree():
+    cases = random_cases(seed=1)
+    got = poisson_tail_probs([lam for lam, _ in cases], [k for _, k in cases])
+    for (lam, k), value in zip(cases, got):
+        assert poisson_tail_prob(lam, k) == pytest.approx(value, rel=1e-13, abs=1e-300)
+
+
+def test_vectorized_broadcasts():
+    assert poisson_tail_probs(3.0, 2).shape == ()
+    got = poisson_tail_probs([[1.0], [2.0]], [1, 2, 3])
+    assert got.shape == (2, 3)
+    assert_close(got[1, 2], reference_tail(2.0, 3))
+
+
+def test_estimate_break_probabilities_ignores_max_poisson_terms():
+    kwargs = dict(
+        current_points=30, minutes_played=24, remaining_minutes=24, season_high=62, all_time_high=100
+    )
+    default = estimate_break_probabilities(**kwargs)
+    legacy = estimate_break_probabilities(**kwargs, config=PointsModelConfig(max_poisson_terms=5))
+    assert default == legacy
+    assert 0.0 < default["all_time"] < default["season_high"] < 1.0
+
+
+@pytest.mark.parametrize(
+    "lam, k, expected",
+    [
+        (math.nan, 5, math.nan),
+        (5.0, math.nan, math.nan),
+        (math.inf, 5, 1.0),
+        (5.0, math.inf, 0.0),
+        (math.inf, 0, 1.0),
+        (-math.inf, 5, 0.0),
+    ],
+)
+def test_non_finite_inputs(lam, k, expected):
+    for got in (poisson_tail_prob(lam, k), float(poisson_tail_probs(lam, k))):
+        if math.isnan(expected):
+            assert math.isnan(got)
+        else:
+            assert got == expected
+
+
+def test_huge_k_terminates():
+    # Far beyond the iteration cap's accurate range, but it must still return.
+    assert 0.0 <= poisson_tail_prob(1e12 - 1.0, 1e12) <= 1.0
+    assert 0.0 <= float(poisson_tail_probs(1e12 - 1.0, 1e12)) <= 1.0
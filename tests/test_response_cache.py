@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from nba_api.library.cache import (
+    FinalGameTTL,
+    ResponseCache,
+    current_season_start_year,
+    historical_ttl,
+    season_start_year,
+)
+
+
+def current_game_id():
+    return "002{:02d}00001".format(current_season_start_year() % 100)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path))
+
+
+@pytest.mark.parametrize(
+    "parameters, year",
+    [
+        ({"GameID": "0029600001"}, 1996),
+        ({"GameID": "0024600001"}, 1946),
+        ({"GameID": "0020000001"}, 2000),
+        ({"GameID": "0022400001"}, 2024),
+        ({"Season": "1998-99"}, 1998),
+        ({"LeagueID": "00"}, None),
+    ],
+)
+def test_season_start_year(parameters, year):
+    assert season_start_year(parameters) == year
+
+
+def test_historical_ttl_keeps_last_century_forever():
+    assert historical_ttl()({"GameID": "0029600001"}) is None
+
+
+def test_endpoints_without_policy_are_not_cached(cache):
+    assert not cache.set("ScoreboardV2", "u", [("GameDate", "2026-01-01")], "{}")
+    assert cache.get("ScoreboardV2", "u", [("GameDate", "2026-01-01")]) is None
+    assert not cache.set("boxscore/boxscore_0022400001.json", "u", [], "{}")
+
+
+def test_live_paths_get_a_policy_name(cache):
+    assert cache.get_policy_name("boxscore/boxscore_0022400001.json") == "boxscore/boxscore"
+    assert cache.get_policy_name("PlayerCareerStats") == "playercareerstats"
+
+
+def test_past_season_game_cached_forever(cache):
+    parameters = [("GameID", "0029600001")]
+    assert cache.set("BoxScoreTraditionalV3", "u", parameters, "{}")
+    assert cache.get("BoxScoreTraditionalV3", "u", parameters) == ("{}", None, None)
+
+
+def test_current_season_game_cached_only_when_final(cache):
+    parameters = [("GameID", current_game_id())]
+    live = json.dumps({"boxScoreSummary": {"gameStatus": 2}})
+    no_status = json.dumps({"boxScoreTraditional": {"gameId": current_game_id()}})
+    final = json.dumps({"boxScoreSummary": {"gameStatus": 3}})
+
+    assert not cache.set("BoxScoreSummaryV3", "u", parameters, live)
+    assert not cache.set("BoxScoreTraditionalV3", "u", parameters, no_status)
+    assert cache.get("BoxScoreTraditionalV3", "u", parameters) is None
+
+    assert cache.set("BoxScoreSummaryV3", "u", parameters, final)
+    assert cache.get("BoxScoreSummaryV3", "u", parameters)[0] == final
+
+
+def test_final_game_ttl_lookups_are_allowed():
+    assert FinalGameTTL(final_ttl=60)({"GameID": current_game_id()}) == 60
+
+
+def test_plain_callable_policies_still_get_only_parameters(tmp_path):
+    seen = []
+
+    def policy(parameters):
+        seen.append(parameters)
+        return 60
+
+    cache = ResponseCache(str(tmp_path), ttl_policies={"custom": policy})
+    assert cache.set("Custom", "u", [("A", 1)], "{}")
+    assert seen == [{"A": 1}]